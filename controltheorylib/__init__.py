@@ -1,10 +1,42 @@
-from .controlsystem import ControlSystem, ControlBlock, Connection
-from .bode import BodePlot
-from .nyquist import Nyquist
-from .pzmap import PoleZeroMap
-from .mech_vis import spring
-from .mech_vis import fixed_world
-from .mech_vis import rect_mass
-from .mech_vis import circ_mass
-from .mech_vis import damper
+import importlib
 
+# Public names and the submodule that defines them. Submodules (and manim, scipy.signal,
+# sympy with them) are only imported on first attribute access, so importing the
+# package itself is instant.
+_LAZY_ATTRIBUTES = {
+    'ControlSystem': 'controlsystem',
+    'ControlBlock': 'controlsystem',
+    'Connection': 'controlsystem',
+    'BodePlot': 'bode',
+    'Nyquist': 'nyquist',
+    'PoleZeroMap': 'pzmap',
+    'spring': 'mech_vis',
+    'fixed_world': 'mech_vis',
+    'rect_mass': 'mech_vis',
+    'circ_mass': 'mech_vis',
+    'damper': 'mech_vis',
+}
+
+_SUBMODULES = {'analysis', 'bode', 'controlsystem', 'curves', 'freqresp', 'margins', 'mech_vis',
+               'nyquist', 'pzmap', 'statespace', 'tfparser', 'ticklabels'}
+
+__all__ = list(_LAZY_ATTRIBUTES) + ['use_default_style']
+
+def use_default_style():
+    """Apply the library's default scene style (dark grey background) to manim's config."""
+    from manim import config
+    config.background_color = "#3d3d3d"
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module('.' + _LAZY_ATTRIBUTES[name], __name__)
+        value = getattr(module, name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module('.' + name, __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | _SUBMODULES)
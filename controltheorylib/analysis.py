@@ -0,0 +1,638 @@
+import warnings
+
+import numpy as np
+
+from .freqresp import (FrequencyResponse, normalize_system, frequency_response, adaptive_frequency_response,
+                       discrete_frequency_response, s_plane_poles_zeros, nyquist_frequency, is_z_domain)
+from .margins import (stability_margins, gain_crossover_frequencies, phase_crossover_frequencies,
+                      modulus_margin)
+from .statespace import StateSpaceModel
+
+# Headless numeric analysis: the data behind BodePlot, Nyquist and PoleZeroMap, without manim
+
+# ========================Bode=================
+
+def bode_frequency_range(systems):
+    """
+    Frequency range spanning one decade beyond the outermost pole and zero break frequencies.
+
+    PARAMETERS
+    ----------
+    systems : various | list
+        One system, or a list of systems (e.g. the members of a parameter sweep) whose
+        features should all be covered.
+
+    RETURNS
+    -------
+    tuple
+        (min_freq, max_freq) in rad/s. Discrete-time ranges end at the Nyquist frequency π/dt.
+    """
+    if not isinstance(systems, list):
+        systems = [systems]
+    systems = [normalize_system(system) for system in systems]
+    # Discrete-time roots are mapped to the s-plane, where |s| is the break frequency
+    roots = [s_plane_poles_zeros(system) for system in systems]
+    poles = np.concatenate([system_poles for system_poles, _ in roots])
+    zeros = np.concatenate([system_zeros for _, system_zeros in roots])
+
+    # Filter out infinite and zero frequencies for frequency range determination
+    finite_poles = poles[np.isfinite(poles) & (poles != 0)]
+    finite_zeros = zeros[np.isfinite(zeros) & (zeros != 0)]
+
+    # Handle integrators (poles at 0) and differentiators (zeros at 0)
+    has_integrator = any(np.isclose(poles, 0, atol=1e-8))
+    has_differentiator = any(np.isclose(zeros, 0, atol=1e-8))
+
+    # Determine freq range based on features
+    all_features = np.abs(np.concatenate([finite_poles, finite_zeros]))
+    if len(all_features) > 0:
+        min_freq = 10**(np.floor(np.log10(np.min(all_features)))-1)
+        max_freq = 10**(np.ceil(np.log10(np.max(all_features)))+1)
+    else:
+        min_freq, max_freq = 0.1, 100
+
+    if has_integrator:
+        min_freq = min(0.001, min_freq)
+    if has_differentiator:
+        max_freq = max(1000, max_freq)
+
+    if systems[0].dt is not None:
+        # The response folds at the Nyquist frequency, so the axis ends there
+        max_freq = nyquist_frequency(systems[0])
+        min_freq = min(min_freq, max_freq / 100)
+    return min_freq, max_freq
+
+def bode_response(system, freq_range=None, sampling="uniform", tol_db=0.05, tol_deg=0.5):
+    """
+    Frequency response on the grid a BodePlot uses.
+
+    PARAMETERS
+    ----------
+    system : various
+        Any supported system specification (see freqresp.parse_system_input).
+    freq_range : tuple[float] | None
+        Frequency range in rad/s. If None, bode_frequency_range is used.
+    sampling : str
+        "uniform" (1000 logspaced points) or "adaptive" (see freqresp.adaptive_frequency_response).
+        Uniform discrete-time grids up to the Nyquist frequency share one zero-padded FFT.
+    tol_db, tol_deg : float
+        Interpolation tolerances of adaptive sampling.
+
+    RETURNS
+    -------
+    FrequencyResponse
+    """
+    system = normalize_system(system)
+    if freq_range is None:
+        freq_range = bode_frequency_range(system)
+    if sampling == "adaptive":
+        return adaptive_frequency_response(system, freq_range, tol_db=tol_db, tol_deg=tol_deg)
+    if system.dt is not None:
+        return discrete_frequency_response(system, freq_range, 1000)
+    return frequency_response(system, np.logspace(np.log10(freq_range[0]), np.log10(freq_range[1]), 1000))
+
+def magnitude_range(magnitudes):
+    """
+    Magnitude axis range in dB, rounded outwards to a step that suits the span.
+
+    RETURNS
+    -------
+    tuple
+        (min_db, max_db, None); the step is left to the plot.
+    """
+    magnitudes = np.asarray(magnitudes)
+    # Poles on the unit circle (e.g. at the Nyquist frequency) give infinite samples
+    magnitudes = magnitudes[np.isfinite(magnitudes)]
+    mag_min_calc = np.min(magnitudes)
+    mag_max_calc = np.max(magnitudes)
+
+    mag_span = mag_max_calc - mag_min_calc
+    if mag_span <= 30:
+        base_step_mag = 5
+    elif mag_span <= 60:
+        base_step_mag = 10
+    elif mag_span <= 100:
+        base_step_mag = 20
+    else:
+        base_step_mag = 30
+
+    mag_min = np.floor(mag_min_calc / base_step_mag) * base_step_mag
+    mag_max = np.ceil(mag_max_calc / base_step_mag) * base_step_mag
+    return (float(mag_min), float(mag_max), None)
+
+def phase_range(phases):
+    """
+    Phase axis range in degrees, rounded outwards to 15, 45 or 90 degrees depending on the span.
+
+    RETURNS
+    -------
+    tuple
+        (min_deg, max_deg, None); the step is left to the plot.
+    """
+    phases = np.asarray(phases)
+    phases = phases[np.isfinite(phases)]
+    phase_min_calc = np.min(phases)
+    phase_max_calc = np.max(phases)
+
+    phase_span = phase_max_calc - phase_min_calc
+    if phase_span <= 90:
+        base_step = 15
+    elif phase_span <= 180:
+        base_step = 45
+    else:
+        base_step = 90
+
+    phase_min = np.floor(phase_min_calc / base_step) * base_step
+    phase_max = np.ceil(phase_max_calc / base_step) * base_step
+    if phase_min == phase_max:
+        # If after rounding, min and max are still the same, ensure a minimal span
+        phase_min -= base_step
+        phase_max += base_step
+    return (float(phase_min), float(phase_max), None)
+
+def bode_data(system, freq_range=None, sampling="uniform", tol_db=0.05, tol_deg=0.5, dt=None):
+    """
+    Everything a BodePlot shows, as plain NumPy results.
+
+    PARAMETERS
+    ----------
+    system : various
+        Any supported system specification (see freqresp.parse_system_input).
+    freq_range : tuple[float] | None
+        Frequency range in rad/s. If None, automatically determined.
+    sampling, tol_db, tol_deg : see bode_response
+    dt : float | None
+        Sample time of a discrete-time system (see freqresp.normalize_system).
+
+    RETURNS
+    -------
+    dict
+        'system', 'freq_range', 'frequencies', 'magnitudes' (dB), 'phases' (unwrapped and
+        DC-aligned, degrees), 'mag_range', 'phase_range' and the underlying 'response'.
+    """
+    system = normalize_system(system, dt=dt)
+    if freq_range is None:
+        freq_range = bode_frequency_range(system)
+    freq_range = (float(freq_range[0]), float(min(freq_range[1], nyquist_frequency(system))))
+    response = bode_response(system, freq_range, sampling=sampling, tol_db=tol_db, tol_deg=tol_deg)
+    return {
+        'system': system,
+        'freq_range': freq_range,
+        'frequencies': response.omega,
+        'magnitudes': response.magnitude_db,
+        'phases': response.aligned_phase,
+        'mag_range': magnitude_range(response.magnitude_db),
+        'phase_range': phase_range(response.aligned_phase),
+        'response': response,
+    }
+
+# ========================Nyquist=================
+
+def is_proper(system):
+    """Check if the system is proper (numerator degree ≤ denominator degree)."""
+    system = normalize_system(system)
+    if isinstance(system, StateSpaceModel):
+        return True  # State-space models are always proper
+    if system.dt is not None:
+        return True  # The unit circle is bounded, so the curve never diverges at high frequencies
+
+    num_degree = len(system.num) - 1  # Degree of numerator
+    den_degree = len(system.den) - 1  # Degree of denominator
+    return num_degree <= den_degree
+
+def is_strictly_proper(system):
+    """Check if strictly proper (numerator degree < denominator degree)."""
+    system = normalize_system(system)
+    if isinstance(system, StateSpaceModel):
+        return system.is_strictly_proper
+    num_degree = len(system.num) - 1
+    den_degree = len(system.den) - 1
+    return num_degree < den_degree
+
+def first_sustained_run(mask, min_length):
+    """
+    Start index of the first run of at least min_length consecutive True values in mask,
+    or None. Uses window sums of a cumulative sum, so the cost is linear in len(mask).
+    """
+    counts = np.concatenate([[0], np.cumsum(mask)])
+    window_sums = counts[min_length:] - counts[:-min_length]
+    starts = np.flatnonzero(window_sums >= min_length)
+    return starts[0] if len(starts) else None
+
+def nyquist_ranges(system, dt=None):
+    """
+    Frequency range and axis ranges of a Nyquist plot.
+
+    The frequency range spans two decades beyond the outermost break frequencies. The axis
+    ranges cover the curve, leaving out the part where an integrator or an improper system
+    makes it diverge, and are rounded to a step that suits their span.
+
+    PARAMETERS
+    ----------
+    system : various
+        Any supported system specification (see freqresp.parse_system_input).
+    dt : float | None
+        Sample time of a discrete-time system (see freqresp.normalize_system).
+
+    RETURNS
+    -------
+    dict
+        'freq_range', 'x_range' and 'y_range', plus the 'response' evaluated for the range
+        finding (None for systems without poles and zeros), 'num_poles_at_zero' and
+        'is_pure_integrator'.
+    """
+    system = normalize_system(system, dt=dt)
+    dt = system.dt
+    defaults = {
+        'freq_range': (0.1, 100) if dt is None else (np.pi / dt / 1000, np.pi / dt),
+        'x_range': (-10, 10),
+        'y_range': (-10, 10),
+        'response': None,
+        'num_poles_at_zero': 0,
+        'is_pure_integrator': False,
+    }
+    try:
+        # Discrete-time roots are mapped to the s-plane, where |s| is the break frequency
+        poles, zeros = s_plane_poles_zeros(system)
+
+        # Initialize range variables with defaults
+        min_freq, max_freq = 0.1, 100
+        x_min, x_max = -10, 10
+        y_min, y_max = -10, 10
+        re_min, re_max = x_min, x_max
+        im_min, im_max = y_min, y_max
+
+        # Handle special cases
+        if not poles.size and not zeros.size:
+            return defaults
+
+        # Calculate frequency range
+        finite_features = np.abs(np.concatenate([
+            poles[np.isfinite(poles) & (poles != 0)],
+            zeros[np.isfinite(zeros) & (zeros != 0)]
+        ]))
+
+        if finite_features.size > 0:
+            with np.errstate(divide='ignore'):
+                min_freq = 10**(np.floor(np.log10(np.min(finite_features))) - 2)
+                max_freq = 10**(np.ceil(np.log10(np.max(finite_features))) + 2)
+        else:
+            min_freq, max_freq = 0.1, 100
+
+        # Handle integrators/differentiators
+        if any(np.isclose(poles, 0, atol=1e-6)):
+            min_freq = min(0.001, min_freq)
+        if any(np.isclose(zeros, 0)):
+            max_freq = max(1000, max_freq)
+        if dt is not None:
+            # The response folds at the Nyquist frequency, so the curve ends there
+            max_freq = np.pi / dt
+            min_freq = min(min_freq, max_freq / 1000)
+
+        num_poles_at_zero = np.sum(np.isclose(poles,0))
+        is_pure_integrator = (len(poles) == 1 and np.isclose(poles[0], 0) 
+                              and len(zeros) == 0)
+
+        # Calculate Nyquist response once on the plotting grid, extended by one decade
+        # with the same spacing for proper systems. The plotting data reuses the first part.
+        log_min, log_max = np.log10(max(min_freq, 1e-10)), np.log10(max_freq)
+        if dt is not None:
+            # Nothing new lies beyond the Nyquist frequency
+            range_response = discrete_frequency_response(system, (10**log_min, max_freq), 10000)
+            # Poles on the unit circle (e.g. at z = -1) give infinite samples
+            finite = np.isfinite(range_response.response)
+            w = range_response.omega[finite]
+            response = range_response.response[finite]
+        else:
+            log_step = (log_max - log_min) / 9999
+            n_extended = 10000 + int(np.ceil(1 / log_step)) if log_step > 0 else 10000
+            w_extended = 10**(log_min + np.arange(n_extended) * log_step)
+            range_response = frequency_response(system, w_extended)
+            w = w_extended[:10000]
+            response = range_response.response[:10000]
+        re, im = np.real(response), np.imag(response)
+
+        if num_poles_at_zero>0:
+            magnitudes = np.abs(response)
+            if len(magnitudes) > 1:
+                log_magnitudes = np.log(magnitudes + 1e-12)  # Avoid log(0)
+                log_w = np.log(w + 1e-12)
+
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    growth_rate = np.diff(log_magnitudes)/np.diff(log_w)
+                growth_rate = np.nan_to_num(growth_rate, nan=0, posinf=1e6, neginf=-1e6)
+
+                # Parameters for sustained divergence detection
+                negative_threshold = -0.5  # negative since magnitude increases as frequency decreases
+                min_consecutive_points = 4000  #4000 Number of consecutive points below threshold 
+
+                below_threshold = growth_rate < negative_threshold
+                # Find the first run of consecutive points below the negative threshold
+                truncate_start_idx = 0
+                divergent_start = first_sustained_run(below_threshold, min_consecutive_points)
+                if divergent_start is not None:
+                    end_of_divergence_in_growth_rate = divergent_start + min_consecutive_points - 1
+                    truncate_start_idx = end_of_divergence_in_growth_rate + 1 # Truncate from this index onwards
+
+                re_truncated = re[truncate_start_idx:]
+                im_truncated = im[truncate_start_idx:]
+
+                # Ensure arrays are not empty after truncation
+                if len(re_truncated) > 0:
+                    re_min, re_max = np.min(re_truncated), np.max(re_truncated)
+                    im_min, im_max = np.min(im_truncated), np.max(im_truncated)
+
+                    if is_pure_integrator:
+                        re_min, re_max = -2, 10
+                        im_min, im_max = -10, 10
+                else:
+                    re_min, re_max = (-1.5, 0.5) if is_pure_integrator else (-10, 10)
+                    im_min, im_max = (-1, 1) if is_pure_integrator else (-10, 10)
+
+            x_min = re_min 
+            x_max = re_max 
+            max_abs_im = max(abs(im_min), abs(im_max))
+            y_min = -max_abs_im 
+            y_max = max_abs_im
+
+        if (is_proper(system) or is_strictly_proper(system)) and num_poles_at_zero==0:
+
+            if not any(np.isclose(poles, 0)):  
+                # Include the extra decade beyond max_freq
+                finite = np.isfinite(range_response.response)
+                re = range_response.real[finite]
+                im = range_response.imag[finite]
+
+                # Axis ranges with adaptive padding
+                re_min, re_max = np.min(re), np.max(re)
+                im_min, im_max = np.min(im), np.max(im)
+
+
+                padding = 0.01 if is_proper(system) else 0.05
+
+                x_min = re_min 
+                x_max = re_max 
+                max_abs_im = max(abs(im_min), abs(im_max))
+                y_min = -max_abs_im 
+                y_max = max_abs_im
+
+                # Ensure the origin is visible for proper systems (critical for Nyquist criterion)
+        if (is_proper(system) or is_strictly_proper(system)) and num_poles_at_zero==0:
+
+            max_abs_real_deviation = max(abs(re_min), abs(re_max))
+            max_abs_im_deviation = max(abs(im_min), abs(im_max))
+
+            min_real_range_extent = max_abs_real_deviation * 0.15 # e.g., 15% of max real deviation
+            min_im_range_extent = max_abs_im_deviation * 0.15 # e.g., 15% of max imaginary deviation
+
+            x_min = min(x_min, -min_real_range_extent)
+            x_max = max(x_max, min_real_range_extent)
+            y_min = min(y_min, -min_im_range_extent)
+            y_max = max(y_max, min_im_range_extent)
+
+            x_padding = (x_max - x_min) * padding
+            y_padding = (y_max - y_min) * padding
+
+            x_min -= x_padding
+            x_max += x_padding
+            y_min -= y_padding
+            y_max += y_padding
+
+        if (not is_proper(system) and not is_strictly_proper(system)) and num_poles_at_zero==0:
+            # Detect sustained divergence for improper systems
+            magnitudes = np.abs(response)
+            if len(magnitudes) > 1:
+                log_magnitudes = np.log(magnitudes + 1e-12)  # Avoid log(0)
+                log_w = np.log(w + 1e-12)
+
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    growth_rate = np.diff(log_magnitudes)/np.diff(log_w)
+                growth_rate = np.nan_to_num(growth_rate, nan=0, posinf=1e6, neginf=-1e6)
+
+                # Parameters for sustained divergence detection
+                threshold = 0.5  # Growth rate threshold 0.5
+                min_consecutive_points = 1000  # 1000Number of consecutive points above threshold 100
+
+                # Find regions of sustained growth
+                above_threshold = growth_rate > threshold
+                divergent_start = first_sustained_run(above_threshold, min_consecutive_points)
+
+                if divergent_start is not None:
+                    first_divergent_idx = divergent_start + min_consecutive_points - 1
+
+                    # Only truncate if the divergence is significant
+                    if (log_w[-1] - log_w[first_divergent_idx]) > 1.0:  # At least 1 decade of sustained growth
+                        re = re[:first_divergent_idx+1]
+                        im = im[:first_divergent_idx+1]
+
+            # Calculate ranges based on response
+            re_min, re_max = np.min(re), np.max(re)
+            im_min, im_max = np.min(im), np.max(im)
+
+            # Add padding only if not diverging
+            if len(magnitudes) == len(re):  # If we didn't truncate
+                padding = 0
+                x_padding = (re_max - re_min) * padding
+                y_padding = (im_max - im_min) * padding
+            else:
+                padding = 0  # Smaller padding for truncated responses
+
+            x_min = re_min 
+            x_max = re_max 
+            max_abs_im = max(abs(im_min), abs(im_max))
+            y_min = -max_abs_im 
+            y_max = max_abs_im
+
+        # Calculate total span
+        x_span = abs(x_max-x_min)
+        y_span = abs(y_max-y_min)
+
+        # Based on the span, round off to nearest integer x
+        # Round off to 0.5
+        if x_span <= 2:
+            x_min=np.floor(x_min/0.5)*0.5
+            x_max=np.ceil(x_max/0.5)*0.5
+        if y_span <= 2:
+            y_min=np.floor(y_min/0.5)*0.5
+            y_max=np.ceil(y_max/0.5)*0.5
+
+        if 2<x_span < 4:
+            x_min=np.floor(x_min)
+            x_max=np.ceil(x_max)
+        if y_span < 4:
+            y_min=np.floor(y_min)
+            y_max=np.ceil(y_max)
+
+        # Round off to 1
+        if 4<= x_span <= 10:
+            x_min=np.floor(x_min/2)*2
+            x_max=np.ceil(x_max/2)*2
+        if 4 <= y_span <= 10:
+            y_min=np.floor(y_min/2)*2
+            y_max=np.ceil(y_max/2)*2
+
+        # Round off to 2
+        if 10< x_span <= 20:
+            x_min=np.floor(x_min/5)*5
+            x_max=np.ceil(x_max/5)*5
+        if 10 <= y_span <= 20:
+            y_min=np.floor(y_min/5)*5
+            y_max=np.ceil(y_max/5)*5
+
+        # Round off to 5 
+        if 20<x_span <=50:
+            x_min=np.floor(x_min/10)*10
+            x_max=np.ceil(x_max/10)*10
+        if 20<y_span <=50:
+            y_min=np.floor(y_min/10)*10
+            y_max=np.ceil(y_max/10)*10
+
+        # Round off to 10 
+        if x_span > 50:
+            x_min=np.floor(x_min/20)*20
+            x_max=np.ceil(x_max/20)*20
+        if y_span > 50:
+            y_min=np.floor(y_min/20)*20
+            y_max=np.ceil(y_max/20)*20
+
+        if np.isclose(x_min, 0):
+            x_min = 0.0
+        if np.isclose(x_max, 0):
+            x_max = 0.0
+        if np.isclose(y_min, 0):
+            y_min = 0.0
+        if np.isclose(y_max, 0):
+            y_max = 0.0
+
+        return {
+            'freq_range': (float(min_freq), float(max_freq)),
+            'x_range': (float(x_min), float(x_max)),
+            'y_range': (float(y_min), float(y_max)),
+            'response': range_response,
+            'num_poles_at_zero': int(num_poles_at_zero),
+            'is_pure_integrator': bool(is_pure_integrator),
+        }
+
+    except Exception as e:
+        warnings.warn(f"Range determination error: {e}", RuntimeWarning)
+        return defaults
+
+def nyquist_data(system, freq_range=None, dt=None):
+    """
+    Everything a (uniformly sampled) Nyquist plot shows, as plain NumPy results.
+
+    PARAMETERS
+    ----------
+    system : various
+        Any supported system specification (see freqresp.parse_system_input).
+    freq_range : tuple[float] | None
+        Frequency range in rad/s. If None, automatically determined.
+    dt : float | None
+        Sample time of a discrete-time system (see freqresp.normalize_system).
+
+    RETURNS
+    -------
+    dict
+        The nyquist_ranges results, with 'frequencies' and the complex 'response' values
+        on 10000 logspaced frequencies (the negative frequencies are their mirror image).
+    """
+    system = normalize_system(system, dt=dt)
+    ranges = nyquist_ranges(system)
+    if freq_range is not None:
+        ranges['freq_range'] = (float(freq_range[0]), float(min(freq_range[1], nyquist_frequency(system))))
+    ranges['system'] = system
+    response = nyquist_response(system, ranges['freq_range'], ranges['response'])
+    ranges['frequencies'] = response.omega
+    ranges['response'] = response.response
+    return ranges
+
+def nyquist_response(system, freq_range, range_response=None):
+    """
+    Frequency response on the uniform grid of 10000 logspaced points a Nyquist plot uses.
+
+    The response evaluated by nyquist_ranges starts with exactly this grid when the range
+    was determined automatically, and is reused instead of evaluated again.
+    """
+    system = normalize_system(system)
+    if system.dt is not None:
+        # Shares the zero-padded FFT evaluation (and the cache entry) of the range finding
+        return discrete_frequency_response(system, freq_range, 10000)
+    if (range_response is not None and len(range_response) >= 10000 and
+            np.allclose(range_response.omega[[0, 9999]], freq_range[:2], rtol=1e-9, atol=0)):
+        return FrequencyResponse(system, range_response.omega[:10000], range_response.response[:10000])
+    return frequency_response(system, np.logspace(np.log10(freq_range[0]), np.log10(freq_range[1]), 10000))
+
+# ========================Pole-zero map=================
+
+def pole_zero_ranges(poles, zeros):
+    """
+    Axis ranges of a pole-zero map: one unit beyond the outermost poles and zeros.
+
+    RETURNS
+    -------
+    tuple
+        (x_range, y_range), each as [min, max, step].
+    """
+    def axis_range(part):
+        # An empty set of poles or zeros counts as a point at 0
+        values = [part(np.asarray(roots, dtype=complex)) if len(roots) else np.zeros(1)
+                  for roots in (zeros, poles)]
+        low, high = min(np.min(v) for v in values), max(np.max(v) for v in values)
+        step = max(0.1, min(10.0, (abs(high - low) + 2) / 4))
+        return [low - 1, high + 1, step]
+
+    return axis_range(np.real), axis_range(np.imag)
+
+def pole_zero_data(system, dt=None):
+    """
+    Poles and zeros of a system, as plotted by PoleZeroMap.
+
+    PARAMETERS
+    ----------
+    system : various
+        Any supported system specification (see freqresp.parse_system_input).
+    dt : float | None
+        Sample time of a discrete-time system (see freqresp.normalize_system).
+
+    RETURNS
+    -------
+    dict
+        'system', 'poles', 'zeros', 'system_type' ('continuous' or 'discrete'),
+        'x_range' and 'y_range'.
+    """
+    discrete = is_z_domain(system)
+    system = normalize_system(system, dt=dt)
+    poles, zeros = system.poles, system.zeros
+    x_range, y_range = pole_zero_ranges(poles, zeros)
+    return {
+        'system': system,
+        'poles': poles,
+        'zeros': zeros,
+        'system_type': 'discrete' if discrete or system.dt is not None else 'continuous',
+        'x_range': x_range,
+        'y_range': y_range,
+    }
+
+# ========================Margins=================
+
+def batch_margins(systems, freq_range=None):
+    """
+    Stability margins of many loops at once, without building any plot.
+
+    PARAMETERS
+    ----------
+    systems : list
+        Systems in any supported format (see freqresp.parse_system_input).
+    freq_range : tuple[float] | None
+        Only consider crossovers in (min_freq, max_freq). If None, all frequencies are used.
+
+    RETURNS
+    -------
+    dict
+        'gm' (dB), 'pm' (degrees), 'mm', 'wg', 'wp' and 'wm' as arrays with one entry per
+        system (see margins.stability_margins).
+    """
+    names = ('gm', 'pm', 'mm', 'wg', 'wp', 'wm')
+    results = np.array([stability_margins(system, freq_range) for system in systems], dtype=float)
+    results = results.reshape(len(systems), len(names))
+    return {name: results[:, i] for i, name in enumerate(names)}
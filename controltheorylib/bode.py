@@ -1,23 +1,21 @@
 from manim import *
 import numpy as np
 import warnings
-from scipy import signal
-import sympy as sp
-from collections import OrderedDict
-from manim import TexTemplate
-from scipy.interpolate import interp1d 
+from .freqresp import (FrequencyResponse, normalize_system, evaluate, is_z_domain, align_phase, family_response,
+                       template_coefficients, evaluate_family)
+from .analysis import bode_frequency_range, bode_response, magnitude_range, phase_range
+from .margins import stability_margins
+from .ticklabels import number_label, power_of_ten_label
+from .curves import dash_segments, edge_ticks, line_set, masked_polyline, resolve_tolerance, to_scene
 
-config.background_color = "#3d3d3d"
-
-my_template = TexTemplate()
-my_template.add_to_preamble(r"\usepackage{amsmath}")  # Add required packages
 
 # Bode plot classes
 class BodePlot(VGroup):
     def __init__(self, system, freq_range=None, magnitude_yrange=None,  
                  phase_yrange=None, color=BLUE,stroke_width=2.5, mag_label="Magnitude (dB)", 
                  phase_label = "Phase (deg)",xlabel = "Frequency (rad/s)", 
-                 font_size_ylabels = 20, font_size_xlabel=20,y_length_mag=None,y_length_phase=None,x_length=None,**kwargs):
+                 font_size_ylabels = 20, font_size_xlabel=20,y_length_mag=None,y_length_phase=None,x_length=None,
+                 sampling="uniform", tol_db=0.05, tol_deg=0.5, dt=None, simplify_tol=None, **kwargs):
         """
         Generates a Bode plot visualization as a Manim VGroup for continuous- or discrete-time systems.
 
@@ -30,7 +28,7 @@ class BodePlot(VGroup):
         system : various
             System representation, which can be one of:
             - scipy.signal.lti or transfer function coefficients (list/tuple of arrays)
-            - Symbolic expressions for numerator/denominator (using 's' as variable)
+            - Symbolic expressions for numerator/denominator (using 's' as variable, or 'z' for discrete time)
             - Tuple of (numerator_expr, denominator_expr) as strings or sympy expressions
         freq_range : tuple[float] | None
             Frequency range in rad/s as (min_freq, max_freq). If None, automatically determined.
@@ -58,6 +56,22 @@ class BodePlot(VGroup):
             The vertical length of the phase plot
         x_length : float
             The horizontal length of the plots
+        sampling : str
+            Frequency sampling of the curves: "uniform" (1000 logspaced points, default) or "adaptive",
+            which refines the grid only where the curves bend until tol_db and tol_deg are met.
+        tol_db : float
+            Maximum magnitude interpolation error in dB for adaptive sampling (default: 0.05).
+        tol_deg : float
+            Maximum phase interpolation error in degrees for adaptive sampling (default: 0.5).
+        dt : float | None
+            Sample time of a discrete-time system. Discrete-time responses repeat beyond the
+            Nyquist frequency π/dt, so the frequency axis ends there. Expressions in z without
+            a dt use dt = 1 (default: None, continuous time unless the system has its own dt).
+        simplify_tol : float | str | None
+            Removes curve corners that lie within this distance (in Manim units) of the
+            simplified curve before drawing (Ramer-Douglas-Peucker), which makes every frame
+            cheaper to render. "pixel" uses half a pixel at the current render resolution
+            (default: None, every sample is drawn).
         **kwargs : Any
             Additional keyword arguments passed to the VGroup constructor.
 
@@ -71,8 +85,15 @@ class BodePlot(VGroup):
             - Optional grid lines, title, and stability indicators
         """
         super().__init__(**kwargs)
-        self.system = self._parse_system_input(system)
-        self.system = self._ensure_tf(self.system)
+        self.system = normalize_system(system, dt=dt)
+        self.dt = self.system.dt
+        if sampling not in ["uniform", "adaptive"]:
+            warnings.warn("Invalid sampling, setting to default ('uniform')", UserWarning)
+            sampling = "uniform"
+        self.sampling = sampling
+        self.tol_db = tol_db
+        self.tol_deg = tol_deg
+        self.simplify_tol = resolve_tolerance(simplify_tol)
         self._show_grid = False # Grid off by default
         self.plotcolor = color
         self.plot_stroke_width = stroke_width
@@ -81,8 +102,8 @@ class BodePlot(VGroup):
             "stroke_width": 1.2
         }
 
-        auto_ranges = self._auto_determine_ranges()
-        self.freq_range = freq_range if freq_range is not None else auto_ranges['freq_range']
+        auto_ranges = self._auto_determine_ranges(freq_range)
+        self.freq_range = auto_ranges['freq_range']
         self.magnitude_yrange = magnitude_yrange if magnitude_yrange is not None else auto_ranges['mag_range']
         self.phase_yrange = phase_yrange if phase_yrange is not None else auto_ranges['phase_range']
         
@@ -106,85 +127,199 @@ class BodePlot(VGroup):
         self.y_length_mag = y_length_mag
         self.y_length_phase = y_length_phase
         self.x_length = x_length
-        #self.mag_hor_grid = VGroup()
-        #self.phase_hor_grid = VGroup()
-        #self.mag_vert_grid = VGroup()
-        #self.phase_vert_grid = VGroup()
 
         #Create all components
         self._create_axes()
-        self._calculate_bode_data()
-        self._plot_bode_response()
 
         # Position everything properly
         self._update_plot_visibility()
 
-    # Check transfer function
-    
-    def _parse_system_input(self, system):
-        """Parse different input formats for the system specification."""
-        # Directly pass through valid scipy LTI system objects or coefficient lists
-        if isinstance(system, (signal.TransferFunction, signal.ZerosPolesGain, signal.StateSpace)):
-            return system
-
-        # Handle sympy expression directly 
-        if isinstance(system, sp.Basic):
-            return self._symbolic_to_coefficients(system, 1)  # Denominator is 1 since it's already a complete expression
-
-        # Tuple: could be symbolic or coefficient list
-        if isinstance(system, tuple) and len(system) == 2:
-            num, den = system
-
-            # If any part is symbolic or a string, convert
-            if isinstance(num, (str, sp.Basic)) or isinstance(den, (str, sp.Basic)):
-                return self._symbolic_to_coefficients(num, den)
+    @classmethod
+    def family(cls, systems, param_grid=None, colors=None, show_all=False, **kwargs):
+        """
+        Creates one Bode plot for a family of systems, e.g. a parameter sweep.
+
+        All members are evaluated in one broadcast pass on a shared frequency grid and
+        share one set of axes, ticks and labels. The axes ranges cover all members. Every
+        member gets its own magnitude and phase curve, ready to be used in transforms.
+
+        PARAMETERS
+        ----------
+        systems : list | tuple | str | sympy.Basic | callable
+            Either a list of systems (any format accepted by BodePlot), or a template
+            with param_grid. Templates are:
+            - a string or sympy expression in 's' with the parameters as extra symbols,
+              e.g. "K/(s*(s+a))", or a (numerator, denominator) tuple of those. It is parsed once.
+            - a callable that returns a system for the parameters given as keyword arguments.
+            (template, param_grid) may also be passed as one tuple.
+        param_grid : dict | None
+            {parameter name: values} for templates. All combinations are used as members.
+        colors : list | None
+            Color of each member's curves. If None, all curves use the plot color.
+        show_all : bool
+            If true, all member curves are shown. Otherwise only the first member is shown
+            and the other curves are available for transforms.
+        **kwargs : Any
+            Any other BodePlot argument (freq_range, magnitude_yrange, stroke_width, ...).
+
+        RETURNS
+        -------
+        BodePlot
+            Bode plot of the first member, with the additional attributes:
+            - mag_plots / phase_plots: the magnitude and phase curve of every member
+            - family_params: the parameter values of every member (template input only)
+            - family_magnitudes / family_phases: (members x frequencies) data arrays
+        """
+        if isinstance(systems, tuple) and len(systems) == 2 and isinstance(systems[1], dict):
+            systems, param_grid = systems
+
+        family_params = None
+        family_coeffs = None
+        dt = kwargs.get('dt')
+        if dt is None and not callable(systems) and is_z_domain(systems):
+            dt = kwargs['dt'] = 1
+        if param_grid is not None:
+            if callable(systems):
+                names = list(param_grid)
+                mesh = np.meshgrid(*[np.atleast_1d(param_grid[name]) for name in names], indexing='ij')
+                family_params = [dict(zip(names, values)) for values in zip(*[m.ravel() for m in mesh])]
+                members = [normalize_system(systems(**params), dt=dt) for params in family_params]
             else:
-                return (num, den)  # Already numeric
+                from scipy import signal
+                params, nums, dens = template_coefficients(systems, param_grid)
+                n_members = len(nums)
+                family_params = [{name: values[i] for name, values in params.items()} for i in range(n_members)]
+                members = [signal.TransferFunction(num, den, dt=dt) if dt is not None else
+                           signal.TransferFunction(num, den) for num, den in zip(nums, dens)]
+                family_coeffs = (nums, dens)
+        else:
+            members = [normalize_system(system, dt=dt) for system in systems]
+        if not members:
+            raise ValueError("A system family needs at least one member.")
+
+        plot = cls.__new__(cls)
+        plot._family_systems = members
+        plot._family_coeffs = family_coeffs
+        plot._family_show_all = show_all
+        plot.family_params = family_params
+        plot.family_colors = colors
+        plot.__init__(members[0], **kwargs)
+        return plot
+
+    def update_system(self, system, keep_ranges=True, animate=True, **kwargs):
+        """
+        Replaces the plotted system, reusing the axes, ticks, labels and grids of the plot.
+
+        The magnitude and phase curves keep their identity, so they can be animated directly
+        instead of transforming into the curves of a second Bode plot.
 
-        # Handle string-based symbolic transfer functions 
-        if isinstance(system, str):
-            if '/' in system:
-                num_str, den_str = system.split('/', 1)
-                return self._symbolic_to_coefficients(num_str.strip(), den_str.strip())
+        PARAMETERS
+        ----------
+        system : various
+            The new system, in any format accepted by BodePlot. A continuous-time system
+            gets the sample time of the plot if the plot is discrete-time.
+        keep_ranges : bool
+            If true, the new response is evaluated on the current frequency grid and drawn
+            on the current axes (default). Otherwise the ranges are determined again for the
+            new system and the axes, ticks and labels are rebuilt; only the curves are animated.
+        animate : bool
+            If true, an animation transforming the current curves into the new ones is
+            returned (default). Otherwise the curves are updated right away.
+        **kwargs : Any
+            Arguments passed to the Transform animations (run_time, rate_func, ...).
+
+        RETURNS
+        -------
+        Animation | BodePlot
+            The animation of the visible curves if animate is true, otherwise the Bode plot itself.
+            Margins and asymptotes shown before are not updated.
+        """
+        if getattr(self, '_family_systems', None):
+            raise ValueError("update_system is not supported for a BodePlot of a system family.")
+        self.system = normalize_system(system, dt=self.dt)
+        self.dt = self.system.dt
+        self._bode_grid_key = None  # The data of the previous system is no longer valid
+        for attr in ('mag_asymp', 'phase_asymp'):
+            self.__dict__.pop(attr, None)
+
+        old_curves = (self.mag_plot, self.phase_plot)
+        if keep_ranges:
+            self._calculate_bode_data()
+            new_curves = self._create_bode_curves(self.magnitudes, self.phases, self.plotcolor)
+        else:
+            auto_ranges = self._auto_determine_ranges()
+            self.freq_range = auto_ranges['freq_range']
+            self.magnitude_yrange = auto_ranges['mag_range']
+            self.phase_yrange = auto_ranges['phase_range']
+            self._create_axes()
+            self._update_plot_visibility()
+            new_curves = (self.mag_plot, self.phase_plot)
+            # Put the existing curve objects in the place of the new ones
+            for group, old, new in ((self.mag_group, old_curves[0], new_curves[0]),
+                                    (self.phase_group, old_curves[1], new_curves[1])):
+                group.submobjects[group.submobjects.index(new)] = old
+            self.mag_plot, self.phase_plot = old_curves
+
+        shown = (self._show_magnitude, self._show_phase)
+        animations = []
+        for old, new, visible in zip(old_curves, new_curves, shown):
+            if animate and visible:
+                animations.append(Transform(old, new, **kwargs))
             else:
-                return self._symbolic_to_coefficients(system.strip(), "1")
+                old.become(new)
+        return AnimationGroup(*animations) if animate else self
+
+    @classmethod
+    def live(cls, system_func, tracker, **kwargs):
+        """
+        Creates a Bode plot of a parameterized system that follows a ValueTracker.
 
-        raise ValueError("Invalid system specification.")
+        Unlike rebuilding the whole plot with always_redraw, the updater of a live plot only
+        evaluates the new system on the fixed frequency grid of the plot and rewrites the
+        points of the existing curves. The axes, ticks, labels and grids are built once.
 
+        PARAMETERS
+        ----------
+        system_func : callable
+            Function of the parameter value returning the system, in any format accepted
+            by BodePlot, e.g. lambda K: ([K], [1, 2, 1]). Coefficient input is evaluated
+            fastest, since expressions are parsed again for every new value.
+        tracker : ValueTracker
+            The tracker holding the parameter value (a gain K, a damping ratio, ...).
+        **kwargs : Any
+            Any other BodePlot argument (freq_range, magnitude_yrange, stroke_width, ...).
+            The ranges are determined for the initial value if they are not given.
+
+        RETURNS
+        -------
+        BodePlot
+            A Bode plot with an updater. Margins and asymptotes are not updated; remove the
+            updater with clear_updaters() to freeze the plot.
+        """
+        plot = cls(system_func(tracker.get_value()), **kwargs)
+        plot._live_func = system_func
+        plot._live_value = tracker.get_value()
+        plot.add_updater(lambda mob: mob.set_parameter(tracker.get_value()))
+        return plot
+
+    def set_parameter(self, value):
+        """
+        Updates a live Bode plot (see BodePlot.live) to a new parameter value by evaluating
+        the system on the current frequency grid and rewriting the curves in place.
+        Nothing is done if the value did not change.
+        """
+        if value == self._live_value:
+            return self
+        self._live_value = value
+        self.system = normalize_system(self._live_func(value), dt=self.dt)
+        # Every frame has a new system, so the response cache is bypassed
+        self.freq_response = FrequencyResponse(self.system, self.frequencies)
+        self.magnitudes = self.freq_response.magnitude_db
+        self.phase_raw = self.freq_response.phase
+        self.phases = self.freq_response.aligned_phase
+        self._draw_bode_curves(self.mag_plot, self.phase_plot, self.magnitudes, self.phases)
+        return self
 
-    def _symbolic_to_coefficients(self, num_expr, den_expr):
-        """Convert symbolic expressions to polynomial coefficients."""
-        s = sp.symbols('s')
-        try:
-            # If we got a complete expression (num_expr is the whole TF and den_expr is 1)
-            if den_expr == 1 and isinstance(num_expr, sp.Basic):
-                # Extract numerator and denominator from the expression
-                frac = sp.fraction(num_expr)
-                num_expr = frac[0]
-                den_expr = frac[1] if len(frac) > 1 else 1
-
-            # Convert strings to sympy expressions
-            if isinstance(num_expr, str):
-                num_expr = sp.sympify(num_expr.replace('^', '**'))
-            if isinstance(den_expr, str):
-                den_expr = sp.sympify(den_expr.replace('^', '**'))
-
-            num_poly = sp.Poly(num_expr, s)
-            den_poly = sp.Poly(den_expr, s)
-
-            num_coeffs = [float(c) for c in num_poly.all_coeffs()]
-            den_coeffs = [float(c) for c in den_poly.all_coeffs()]
-
-            return (num_coeffs, den_coeffs)
-        except Exception as e:
-            raise ValueError(f"Could not parse transfer function: {e}") from e
-        
-    def _ensure_tf(self, system):
-        """Convert system to TransferFunction if needed"""
-        if isinstance(system, signal.TransferFunction):
-            return system
-        return signal.TransferFunction(*system) 
-    
     # Check which bode plots to show
     def show_magnitude(self, show=True):
         """Show or hide the magnitude plot and all its components.
@@ -195,8 +330,6 @@ class BodePlot(VGroup):
             If true shows the magnitude plot
         """
         self._show_magnitude = show
-        self._create_axes()
-        self._add_plot_components()
         self._update_plot_visibility()
         return self
 
@@ -209,8 +342,6 @@ class BodePlot(VGroup):
             If true shows the phase plot
         """
         self._show_phase = show
-        self._create_axes()
-        self._add_plot_components()
         self._update_plot_visibility()
         return self
     
@@ -228,33 +359,50 @@ class BodePlot(VGroup):
         return self
 
     def _update_grid_visibility(self):
-        """Directly control the stored grid components"""
-        opacity = 1 if self._show_grid else 0
-        self.mag_hor_grid.set_opacity(opacity)
-        self.mag_vert_grid.set_opacity(opacity)
-        self.phase_hor_grid.set_opacity(opacity)
-        self.phase_vert_grid.set_opacity(opacity)
+        """Build the grids on first use, and keep them out of the mobject tree while hidden"""
+        if self._show_grid and self.mag_hor_grid is None:
+            # Store grid components with proper references
+            self.mag_hor_grid = self._create_grid(self.mag_axes, self.magnitude_yrange, "horizontal")
+            self.mag_vert_grid = self._create_grid(self.mag_axes, None, "vertical")
+            self.phase_hor_grid = self._create_grid(self.phase_axes, self.phase_yrange, "horizontal")
+            self.phase_vert_grid = self._create_grid(self.phase_axes, None, "vertical")
+        if self.mag_hor_grid is None:
+            return
+
+        for components, grids in ((self.mag_components, (self.mag_hor_grid, self.mag_vert_grid)),
+                                  (self.phase_components, (self.phase_hor_grid, self.phase_vert_grid))):
+            if self._show_grid:
+                components.add_to_back(*grids)
+            else:
+                components.remove(*grids)
+
+    def _extra_member_curves(self, kind):
+        """Curves of the other members of a system family that are shown along with the first one."""
+        if not getattr(self, '_family_show_all', False):
+            return []
+        return (self.mag_plots if kind == "mag" else self.phase_plots)[1:]
 
     def _update_plot_visibility(self):
-        """Update the visibility and positioning of all plot components."""
+        """
+        Update the visibility and positioning of all plot components.
+
+        The components are retained: toggling a panel or adding a title only reparents and
+        moves the existing magnitude and phase groups, nothing is rebuilt.
+        """
         # Clear everything first
         for mobject in self.submobjects.copy():
             self.remove(mobject)
         
         self.components_to_add = []
-        self.mag_group = VGroup()
-        self.phase_group = VGroup()
 
-        # Handle different display configurations
+        # Handle different display configurations. Panels are placed relative to the
+        # center of their axes, where a newly created Axes sits at the origin.
         if self._show_magnitude and self._show_phase:
             # Both plots - standard layout
-            self.mag_group.add(self.mag_axes, self.mag_components, self.mag_plot)
-            self.phase_group.add(self.phase_axes, self.phase_components, self.phase_plot)
-            
             if self._title:
-                self.mag_group.shift(1.6*UP)
+                self.mag_group.shift(1.6*UP - self.mag_axes.get_center())
             else:
-                self.mag_group.shift(1.8*UP)
+                self.mag_group.shift(1.8*UP - self.mag_axes.get_center())
 
             self.phase_group.next_to(self.mag_group, DOWN, buff=0.4).align_to(self.mag_group, LEFT)
             self.freq_ticklabels.next_to(self.phase_axes, DOWN, buff=0.2)
@@ -262,8 +410,7 @@ class BodePlot(VGroup):
             self.components_to_add.extend([self.mag_group, self.phase_group,self.freq_ticklabels, self.freq_xlabel,])
         elif self._show_magnitude:
             # Only magnitude - center it and move frequency labels
-            self.mag_group.add(self.mag_axes, self.mag_components, self.mag_plot)
-            #mag_group.move_to(ORIGIN)
+            self.mag_group.shift(-self.mag_axes.get_center())
 
             # Move frequency labels to bottom of magnitude plot
             self.freq_ticklabels.next_to(self.mag_axes, DOWN, buff=0.2)
@@ -272,14 +419,12 @@ class BodePlot(VGroup):
 
         elif self._show_phase:
             # Only phase - center it
-            self.phase_group.add(self.phase_axes, self.phase_components, self.phase_plot)
-            #phase_group.move_to(ORIGIN)
+            self.phase_group.shift(-self.phase_axes.get_center())
             self.freq_ticklabels.next_to(self.phase_axes, DOWN, buff=0.2)
             self.freq_xlabel.next_to(self.phase_axes,DOWN,buff=0.4)
             self.components_to_add.extend([self.phase_group,self.freq_ticklabels, self.freq_xlabel])
-            # Handle title
-
 
+        # Handle title
         if self._title:
             if self._show_magnitude:
                 self._title.next_to(self.mag_axes, UP, buff=self.title_buff)
@@ -326,27 +471,25 @@ class BodePlot(VGroup):
         else:
             self.y_length_phase = self.y_length_phase
 
-        if self._show_magnitude:
-        
-            self.mag_axes = Axes(
-                x_range=[np.log10(self.freq_range[0]), np.log10(self.freq_range[1]), 1],
-                y_range=[self.magnitude_yrange[0], self.magnitude_yrange[1], mag_step],
-                x_length=self.x_length, y_length=self.y_length_mag,
-                axis_config={"color": GREY, "stroke_width": 0, "stroke_opacity": 0.7,
-                        "include_tip": False, "include_ticks": False},
-                y_axis_config={"font_size": 25},
-            )
-        if self._show_phase:
-            self.phase_axes = Axes(
-                x_range=[np.log10(self.freq_range[0]), np.log10(self.freq_range[1]), 1],
-                y_range=[self.phase_yrange[0], self.phase_yrange[1], phase_step],
-                x_length=self.x_length, y_length=self.y_length_phase,
-                axis_config={"color": GREY, "stroke_width": 0, "stroke_opacity": 0.7, 
+        # Both panels are always built, so showing a hidden panel later needs no rebuild
+        self.mag_axes = Axes(
+            x_range=[np.log10(self.freq_range[0]), np.log10(self.freq_range[1]), 1],
+            y_range=[self.magnitude_yrange[0], self.magnitude_yrange[1], mag_step],
+            x_length=self.x_length, y_length=self.y_length_mag,
+            axis_config={"color": GREY, "stroke_width": 0, "stroke_opacity": 0.7,
                     "include_tip": False, "include_ticks": False},
-                y_axis_config={"font_size": 25},
-            )
-            
-        # Add boxes and labels only for the visible plots
+            y_axis_config={"font_size": 25},
+        )
+        self.phase_axes = Axes(
+            x_range=[np.log10(self.freq_range[0]), np.log10(self.freq_range[1]), 1],
+            y_range=[self.phase_yrange[0], self.phase_yrange[1], phase_step],
+            x_length=self.x_length, y_length=self.y_length_phase,
+            axis_config={"color": GREY, "stroke_width": 0, "stroke_opacity": 0.7, 
+                "include_tip": False, "include_ticks": False},
+            y_axis_config={"font_size": 25},
+        )
+        
+        # Add boxes and labels
         self._calculate_bode_data()
         self._plot_bode_response()
         self._add_plot_components()
@@ -362,8 +505,10 @@ class BodePlot(VGroup):
         self.freq_ticklabels = VGroup()
         for exp in decade_exponents:
             x_val = np.log10(10**exp)
+            if not (np.log10(self.freq_range[0]) - 1e-9 <= x_val <= np.log10(self.freq_range[1]) + 1e-9):
+                continue
             tick_point = self.phase_axes.x_axis.n2p(x_val)
-            label = MathTex(f"10^{{{int(exp)}}}", font_size=20)
+            label = power_of_ten_label(int(exp), font_size=20)
             label.move_to([tick_point[0]+0.1, self.phase_axes.get_bottom()[1]-0.2, 0])
             self.freq_ticklabels.add(label)
 
@@ -386,26 +531,27 @@ class BodePlot(VGroup):
         self.phase_yticks = self._create_ticks(self.phase_axes, self.phase_yrange, "horizontal")
         self.phase_xticks = self._create_ticks(self.phase_axes, None, "vertical")
 
-            # Store grid components with proper references
-        self.mag_hor_grid = self._create_grid(self.mag_axes, self.magnitude_yrange, "horizontal")
-        self.mag_vert_grid = self._create_grid(self.mag_axes, None, "vertical")
-        self.phase_hor_grid = self._create_grid(self.phase_axes, self.phase_yrange, "horizontal")
-        self.phase_vert_grid = self._create_grid(self.phase_axes, None, "vertical")
+        # Grids are built on the first grid_on() (see _update_grid_visibility)
+        self.mag_hor_grid = self.mag_vert_grid = None
+        self.phase_hor_grid = self.phase_vert_grid = None
 
-        # Group components with proper grid references
+        # Group components
         self.mag_components = VGroup(
-        self.mag_box, self.mag_yticks, self.mag_xticks, self.mag_yticklabels, self.mag_hor_grid, self.mag_vert_grid, 
-        self.mag_ylabel
+        self.mag_box, self.mag_yticks, self.mag_xticks, self.mag_yticklabels, self.mag_ylabel
         )
         self.phase_components = VGroup(
-        self.phase_box, self.phase_yticklabels, self.phase_hor_grid, self.phase_vert_grid,
-        self.phase_ylabel, self.phase_yticks, self.phase_xticks
+        self.phase_box, self.phase_yticklabels, self.phase_ylabel, self.phase_yticks, self.phase_xticks
         )
+
+        # The panels, kept for the lifetime of the plot and positioned by _update_plot_visibility
+        self.mag_group = VGroup(self.mag_axes, self.mag_components, self.mag_plot, *self._extra_member_curves("mag"))
+        self.phase_group = VGroup(self.phase_axes, self.phase_components, self.phase_plot,
+                                  *self._extra_member_curves("phase"))
+        if self._show_grid:
+            self._update_grid_visibility()
     
     def _create_ticks(self, axes, y_range=None, orientation="horizontal"):
-        """Generalized tick creation for both axes"""
-        ticks = VGroup()
-        
+        """Generalized tick creation for both axes, as one line set per axis"""
         if orientation == "horizontal":
             if y_range[2] == None:
                 span = y_range[1] - y_range[0]
@@ -414,110 +560,69 @@ class BodePlot(VGroup):
             else:
                 step = y_range[2]
             tick_length = 0.1
-            
-            for y_val in np.arange(y_range[0], y_range[1]+1, step):
-                # Left side
-                left_point = axes.c2p(axes.x_range[0], y_val)
-                ticks.add(Line(
-                    [left_point[0], left_point[1], 0],
-                    [left_point[0] + tick_length, left_point[1], 0],
-                    **self.tick_style
-                ))
-                # Right side
-                right_point = axes.c2p(axes.x_range[1], y_val)
-                ticks.add(Line(
-                    [right_point[0]-tick_length, right_point[1], 0],
-                    [right_point[0], right_point[1], 0],
-                    **self.tick_style
-                ))
+
+            # Left and right side
+            start, end = edge_ticks(axes, np.arange(y_range[0], y_range[1]+1, step), "y", tick_length)
                 
         else:  # vertical
             min_exp = np.floor(np.log10(self.freq_range[0]))
             max_exp = np.ceil(np.log10(self.freq_range[1]))
             
             # Major ticks at decades (10^n)
-            main_log_ticks = np.log10([10**exp for exp in np.arange(min_exp, max_exp + 1)])
+            main_log_ticks = np.arange(min_exp, max_exp + 1)
             # Intermediate ticks (2×10^n, 3×10^n, ..., 9×10^n)
             intermediate_log_ticks = np.log10(np.concatenate([
                 np.arange(2, 10) * 10**exp for exp in np.arange(min_exp, max_exp)
             ]))
-            
-            y_range = self.magnitude_yrange if axes == self.mag_axes else self.phase_yrange
             tick_lengths = {"major": 0.15, "minor": 0.08}
+
+            # Bottom and top, for the ticks inside the axis range
+            in_range = lambda x_vals: x_vals[(x_vals >= axes.x_range[0]) & (x_vals <= axes.x_range[1])]
+            major = edge_ticks(axes, in_range(main_log_ticks), "x", tick_lengths["major"])
+            minor = edge_ticks(axes, in_range(intermediate_log_ticks), "x", tick_lengths["minor"])
+            start, end = np.concatenate([major[0], minor[0]]), np.concatenate([major[1], minor[1]])
             
-            # Create ticks function
-            def add_vertical_ticks(x_vals, length):
-                for x_val in x_vals:
-                    if not (axes.x_range[0] <= x_val <= axes.x_range[1]):
-                        continue
-                    # Bottom
-                    bottom_point = axes.c2p(x_val, y_range[0])
-                    ticks.add(Line(
-                        [bottom_point[0], bottom_point[1], 0],
-                        [bottom_point[0], bottom_point[1] + length, 0],
-                        **self.tick_style
-                    ))
-                    # Top
-                    top_point = axes.c2p(x_val, y_range[1])
-                    ticks.add(Line(
-                        [top_point[0], top_point[1]-length, 0],
-                        [top_point[0], top_point[1], 0],
-                        **self.tick_style
-                    ))
-            
-            add_vertical_ticks(main_log_ticks, tick_lengths["major"])
-            add_vertical_ticks(intermediate_log_ticks, tick_lengths["minor"])
-            
-        return ticks
+        return line_set(start, end, **self.tick_style)
     
     def _create_grid(self, axes, y_range=None, orientation="horizontal"):
-        """Generalized grid creation"""
-        grid = VGroup()
-        show = self._show_grid
-        opacity_val = 1 if show else 0
+        """Generalized grid creation, as one line set per orientation"""
+        # Grids are only built when shown, at the full opacity they have always been drawn with
+        grid_style = {"color": GREY, "stroke_width": 0.5, "stroke_opacity": 1}
         
         if orientation == "horizontal":
             span = y_range[1] - y_range[0]
             step = 5 if span <= 30 else (10 if span <= 60 else 20) if axes == self.mag_axes else \
            15 if span <= 90 else (30 if span <= 180 else 45)
         
-            for y_val in np.arange(y_range[0], y_range[1]+1, step):
-                start = axes.c2p(axes.x_range[0], y_val)
-                end = axes.c2p(axes.x_range[1], y_val)
-            # Create regular line (not dashed) for horizontal grid
-                grid.add(Line(start, end, color=GREY, stroke_width=0.5, stroke_opacity=0.7))
+            # Regular lines (not dashed) for the horizontal grid
+            y_vals = np.arange(y_range[0], y_range[1]+1, step)
+            start = to_scene(axes, axes.x_range[0], y_vals)
+            end = to_scene(axes, axes.x_range[1], y_vals)
             
         else:  # vertical
             min_exp = np.floor(np.log10(self.freq_range[0]))
             max_exp = np.ceil(np.log10(self.freq_range[1]))
-        
-            # Main decade lines (solid)
-            main_log_ticks = np.log10([10**exp for exp in np.arange(min_exp, max_exp + 1)])
             y_range = self.magnitude_yrange if axes == self.mag_axes else self.phase_yrange
         
-            for x_val in main_log_ticks:
-                start = axes.c2p(x_val, y_range[0])
-                end = axes.c2p(x_val, y_range[1])
-                    # Create regular line for main decades
-                grid.add(Line(start, end, color=GREY, stroke_width=0.5, stroke_opacity=0.7))
+            # Main decade lines (solid)
+            main_log_ticks = np.arange(min_exp, max_exp + 1)
+            main_log_ticks = main_log_ticks[(main_log_ticks >= axes.x_range[0] - 1e-9) &
+                                            (main_log_ticks <= axes.x_range[1] + 1e-9)]
         
-        # Intermediate lines (dashed)
+            # Intermediate lines (dashed)
             intermediate_ticks = np.concatenate([
                 np.arange(1, 10) * 10**exp for exp in np.arange(min_exp, max_exp)
             ])
             intermediate_log_ticks = np.log10(intermediate_ticks)
+            intermediate_log_ticks = intermediate_log_ticks[(intermediate_log_ticks >= axes.x_range[0]) &
+                                                            (intermediate_log_ticks <= axes.x_range[1])]
+            dashes = dash_segments(to_scene(axes, intermediate_log_ticks, y_range[0]),
+                                   to_scene(axes, intermediate_log_ticks, y_range[1]), dash_length=0.05)
+
+            start = np.concatenate([to_scene(axes, main_log_ticks, y_range[0]), dashes[0]])
+            end = np.concatenate([to_scene(axes, main_log_ticks, y_range[1]), dashes[1]])
         
-            for x_val in intermediate_log_ticks:
-                if axes.x_range[0] <= x_val <= axes.x_range[1]:
-                    start = axes.c2p(x_val, y_range[0])
-                    end = axes.c2p(x_val, y_range[1])
-                    # Create dashed line for intermediates
-                    grid.add(DashedLine(start, end, color=GREY, dash_length=0.05, 
-                                   stroke_width=0.5, stroke_opacity=0.7))
-        
-        for line in grid:
-            line.set_opacity(opacity_val)
-        return grid
+        return line_set(start, end, **grid_style)
 
     def _create_y_labels(self, axes, y_range):
         """Create dynamic y-axis labels."""
@@ -531,9 +636,8 @@ class BodePlot(VGroup):
         
         for y_val in np.arange(y_range[0], y_range[1]+1, step):
             point = axes.c2p(axes.x_range[0], y_val)
-            label = MathTex(f"{int(y_val)}", font_size=20)
-            box = SurroundingRectangle(axes, buff=0, color=WHITE)
-            label.next_to(box.get_left(), LEFT, buff=0.1)
+            label = number_label(f"{int(y_val)}", font_size=20)
+            label.next_to(axes.get_left(), LEFT, buff=0.1)
             label.move_to([label.get_x(), point[1], 0])
             y_labels.add(label)
         return y_labels
@@ -569,260 +673,140 @@ class BodePlot(VGroup):
             self._title = Text(text, font_size=self.title_font_size, color=color)
         
         # Update title position based on which plots are shown
-        self._create_axes()
         self._update_plot_visibility()
 
         return self
     # Determine the ranges of interest whenever ranges are not specified
-    def _auto_determine_ranges(self):
-        """Automatically determine plot ranges based on system poles/zeros and Bode data."""
-        # Get poles and zeros
-        if not isinstance(self.system, (signal.TransferFunction, signal.ZerosPolesGain, signal.StateSpace)):
-             try:
-                 system_tf = signal.TransferFunction(*self.system)
-             except Exception as e:
-                 print(f"Could not convert system to TransferFunction: {e}")
-                 poles = np.array([])
-                 zeros = np.array([])
-        else:
-            system_tf = self.system
-    
-        if isinstance(system_tf, (signal.ZerosPolesGain, signal.StateSpace)):
-            poles = system_tf.poles
-            zeros = system_tf.zeros
-        elif isinstance(system_tf, signal.TransferFunction):
-            poles = system_tf.poles
-            zeros = system_tf.zeros
-        else:
-            poles = np.array([])
-            zeros = np.array([])
-
-        # Filter out infinite and zero frequencies for frequency range determination
-        finite_poles = poles[np.isfinite(poles) & (poles != 0)]
-        finite_zeros = zeros[np.isfinite(zeros) & (zeros != 0)]
-
-        # Handle integrators (poles at 0) and differentiators (zeros at 0)
-        has_integrator = any(np.isclose(poles, 0, atol=1e-8))
-        has_differentiator = any(np.isclose(zeros, 0, atol=1e-8))
-
-        # Step 1: Determine freq range based on features
-        all_features = np.abs(np.concatenate([finite_poles, finite_zeros]))
-        if len(all_features) > 0:
-            min_freq = 10**(np.floor(np.log10(np.min(all_features)))-1)
-            max_freq = 10**(np.ceil(np.log10(np.max(all_features)))+1)
-        else:
-            min_freq, max_freq = 0.1, 100
+    def _auto_freq_range(self):
+        """Frequency range spanning one decade beyond the outermost pole and zero break frequencies."""
+        # Poles and zeros of all members for a system family
+        return bode_frequency_range(getattr(self, '_family_systems', None) or [self.system])
 
-        if has_integrator:
-             min_freq = min(0.001, min_freq)
-        if has_differentiator:
-             max_freq = max(1000, max_freq)
+    def _nyquist_frequency(self):
+        """Nyquist frequency π/dt of a discrete-time system (np.inf in continuous time)."""
+        return np.inf if self.dt is None else np.pi / self.dt
 
-        # Step 2: Calculate Bode response in determined frequency range for range finding
-        w_focus = np.logspace(np.log10(min_freq), np.log10(max_freq), 2000) # More points for range calc
-        try:
-            _, mag_focus, phase_focus_raw = signal.bode(system_tf, w_focus)
-
-            # UNWRAP THE PHASE
-            phase_focus_unwrapped = np.unwrap(phase_focus_raw * np.pi/180) * 180/np.pi
-
-            # --- Apply DC Gain Based Phase Alignment for Range Determination ---
-            phase_focus_aligned = np.copy(phase_focus_unwrapped) # Work on a copy
-            try:
-                # Calculate DC Gain
-                G0 = system_tf.horner(0)
-
-                # Check if DC gain is finite and non-zero
-                if not np.isclose(G0, 0) and np.isfinite(G0):
-                    # Determine the target starting phase (0 or 180)
-                    target_dc_phase = 180 if np.real(G0) < 0 else 0 # Use real part to be safe
-
-                    # Calculate the shift needed to align the lowest freq phase to the target
-                    phase_at_low_freq = phase_focus_unwrapped[0]
-                    shift = target_dc_phase - phase_at_low_freq
-
-                    # Normalize shift to be within +/- 180 degrees around 0
-                    shift = (shift + 180) % 360 - 180
-
-                    # Apply the shift to the phase data used for range determination
-                    phase_focus_aligned += shift
-                # else: If G0 is 0 or inf, the phase doesn't settle to 0/180,
-                #       so no DC alignment is applied. Use the unwrapped phase as is.
-
-            except Exception as e_align:
-                 print(f"Warning: Could not perform DC phase alignment for range: {e_align}")
-                 # Fallback: Use the unwrapped phase without alignment if alignment fails
-                 phase_focus_aligned = phase_focus_unwrapped
-
-        except Exception as e:
-            print(f"Error calculating Bode data for range determination: {e}")
-            phase_focus_aligned = np.zeros_like(w_focus)
-            mag_focus = np.zeros_like(w_focus)
-
-        if not hasattr(self, 'phase_asymp'):
-        # Step 3: Determine phase range from the calculated, ALIGNED Bode data
-            self.phase_min_calc = np.min(phase_focus_aligned)
-            self.phase_max_calc = np.max(phase_focus_aligned)
-
-
-            # Apply rounding for nice plot ticks based on the span
-        phase_span = self.phase_max_calc - self.phase_min_calc
+    def _auto_determine_ranges(self, freq_range=None):
+        """
+        Automatically determine plot ranges based on system poles/zeros and Bode data.
 
-        
-        if phase_span <= 90:
-             base_step = 15
-        elif phase_span <= 180:
-             base_step = 45
-        else:
-             base_step = 90
-
-        self.phase_min = np.floor(self.phase_min_calc / base_step) * base_step
-        self.phase_max = np.ceil(self.phase_max_calc / base_step) * base_step
-
-        padding_deg = base_step # Add at least one step of padding for min span
-        if self.phase_min == self.phase_max:
-            # If after rounding, min and max are still the same, ensure a minimal span
-            self.phase_min -= base_step
-            self.phase_max += base_step
-
-        # Ensure the min and max are still different after padding, especially for very flat responses
-        if self.phase_min == self.phase_max:
-             self.phase_max += base_step # Ensure a minimal difference
-
-        # Step 4: Determine magnitude range
-        mag_padding = 0 # dB padding
-        mag_min_calc = np.min(mag_focus)
-        mag_max_calc = np.max(mag_focus)
-
-        mag_span = mag_max_calc - mag_min_calc
-
-        if mag_span <= 30:
-             base_step_mag = 5
-        elif mag_span <= 60:
-             base_step_mag = 10
-        elif mag_span <=100 :
-             base_step_mag = 20
+        The Bode data used for range finding is the plotting data itself, so every
+        BodePlot evaluates the system only once.
+        """
+        if freq_range is not None:
+            min_freq, max_freq = freq_range[:2]
+            if max_freq > self._nyquist_frequency():
+                warnings.warn("freq_range extends beyond the Nyquist frequency pi/dt, where the "
+                              "response of a discrete-time system folds. Limiting it to pi/dt.", UserWarning)
+                max_freq = self._nyquist_frequency()
         else:
-            base_step_mag = 30
-
-        mag_min = np.floor((mag_min_calc - mag_padding) / base_step_mag) * base_step_mag
-        mag_max = np.ceil((mag_max_calc + mag_padding) / base_step_mag) * base_step_mag
+            min_freq, max_freq = self._auto_freq_range()
 
+        # Step 2: Calculate the plotting data in the frequency range and reuse it for range finding
+        self.freq_range = (float(min_freq), float(max_freq))
+        self._calculate_bode_data()
+        mag_focus = getattr(self, 'family_magnitudes', self.magnitudes)
+        # Unwrapped phase with DC gain based alignment
+        phase_focus_aligned = getattr(self, 'family_phases', self.phases)
 
         return {
-            'freq_range': (float(min_freq), float(max_freq)),
-            'mag_range': (float(mag_min), float(mag_max), None),
-            'phase_range': (float(self.phase_min), float(self.phase_max), None)
+            'freq_range': self.freq_range,
+            'mag_range': magnitude_range(mag_focus),
+            'phase_range': phase_range(phase_focus_aligned)
         }
 
     
-    # calculate the bode data using Scipy.signal
+    # calculate the bode data using the shared frequency response engine
     def _calculate_bode_data(self):
-        """Calculate the Bode plot data using scipy.signal."""
+        """Calculate the Bode plot data on a uniform or adaptive logarithmic frequency grid."""
+        grid_key = (tuple(self.freq_range[:2]), self.sampling, self.tol_db, self.tol_deg)
+        # The axes are rebuilt on every layout change, but the data only depends on the grid
+        if getattr(self, '_bode_grid_key', None) == grid_key:
+            return
+        self._bode_grid_key = grid_key
+
         w = np.logspace(
             np.log10(self.freq_range[0]),
             np.log10(self.freq_range[1]),
             1000
         )
-        
-        try:
-            # Ensure we work with a TransferFunction object
-            if isinstance(self.system, (signal.TransferFunction, signal.ZerosPolesGain, signal.StateSpace)):
-                 system_tf = self.system
-            else:
-                 system_tf = signal.TransferFunction(*self.system)
-
-            w, mag, self.phase_raw = signal.bode(system_tf, w)
-
-            phase_unwrapped = np.unwrap(self.phase_raw * np.pi/180) * 180/np.pi
-            
-            # --- Apply DC Gain Based Phase Alignment ---
-            phase_aligned = np.copy(phase_unwrapped) # Work on a copy
-            try:
-                # Calculate DC Gain
-                G0 = system_tf.horner(0)
-
-                # Check if DC gain is finite and non-zero
-                if not np.isclose(G0, 0) and np.isfinite(G0):
-                    # Determine the target starting phase (0 or 180)
-                    target_dc_phase = 180 if np.real(G0) < 0 else 0 # Use real part to be safe
-
-                    # Calculate the shift needed to align the lowest freq phase to the target
-                    phase_at_low_freq = phase_unwrapped[0]
-                    shift = target_dc_phase - phase_at_low_freq
 
-                    # Normalize shift to be within +/- 180 degrees around 0
-                    shift = (shift + 180) % 360 - 180
-
-                    # Apply the shift to the phase data
-                    phase_aligned += shift
-                # else: If G0 is 0 or inf, the phase doesn't settle to 0/180,
-                #       so no DC alignment is applied. Use the unwrapped phase as is.
-
-            except Exception as e_align:
-                 print(f"Warning: Could not perform DC phase alignment: {e_align}")
-                 # Fallback: Use the unwrapped phase without alignment if alignment fails
-                 phase_aligned = phase_unwrapped
+        if getattr(self, '_family_systems', None):
+            self._calculate_family_data(w)
+            return
 
+        try:
+            self.freq_response = bode_response(self.system, self.freq_range, sampling=self.sampling,
+                                               tol_db=self.tol_db, tol_deg=self.tol_deg)
+            w = self.freq_response.omega
+            mag = self.freq_response.magnitude_db
+            self.phase_raw = self.freq_response.phase
+            phase_aligned = self.freq_response.aligned_phase
 
         except Exception as e:
-            print(f"Error calculating Bode data: {e}")
-            w = np.logspace(np.log10(self.freq_range[0]), np.log10(self.freq_range[1]), 1000)
+            warnings.warn(f"Error calculating Bode data: {e}", RuntimeWarning)
+            self.freq_response = None
             mag = np.zeros_like(w)
             phase_aligned = np.zeros_like(w) # Use aligned name even if alignment failed
 
-
         self.frequencies = w
         self.magnitudes = mag
         self.phases = phase_aligned # Store the aligned phase
 
+    def _calculate_family_data(self, w):
+        """Calculate the Bode data of all members of a system family on one shared grid."""
+        if self._family_coeffs is not None:
+            responses = evaluate_family(*self._family_coeffs, w, dt=self.dt)
+        else:
+            responses = family_response(self._family_systems, w)
+
+        with np.errstate(divide='ignore'):
+            self.family_magnitudes = 20 * np.log10(np.abs(responses))
+        phases_raw = np.unwrap(np.angle(responses), axis=1) * 180 / np.pi
+        self.family_phases = np.array([align_phase(phase, member)
+                                       for phase, member in zip(phases_raw, self._family_systems)])
+
+        self.freq_response = None
+        self.phase_raw = phases_raw[0]
+        self.frequencies = w
+        self.magnitudes = self.family_magnitudes[0]
+        self.phases = self.family_phases[0]
+
     # Plot the actual data
     def _plot_bode_response(self):
         """Create the Bode plot curves with proper out-of-range handling."""
+        if not getattr(self, '_family_systems', None):
+            self.mag_plot, self.phase_plot = self._create_bode_curves(self.magnitudes, self.phases, self.plotcolor)
+            return
+
+        # One pair of curves per member of a system family
+        colors = self.family_colors or [self.plotcolor]
+        curves = [self._create_bode_curves(mag, phase, colors[i % len(colors)])
+                  for i, (mag, phase) in enumerate(zip(self.family_magnitudes, self.family_phases))]
+        self.mag_plots = [mag_plot for mag_plot, _ in curves]
+        self.phase_plots = [phase_plot for _, phase_plot in curves]
+        self.mag_plot, self.phase_plot = self.mag_plots[0], self.phase_plots[0]
+
+    def _create_bode_curves(self, magnitudes, phases, color):
+        """Create the magnitude and phase curve of one frequency response."""
+        mag_plot = VMobject().set_color(color).set_stroke(width=self.plot_stroke_width)
+        phase_plot = VMobject().set_color(color=color).set_stroke(width=self.plot_stroke_width)
+        return self._draw_bode_curves(mag_plot, phase_plot, magnitudes, phases)
+
+    def _draw_bode_curves(self, mag_plot, phase_plot, magnitudes, phases):
+        """Write the points of one frequency response into existing magnitude and phase curves."""
         log_w = np.log10(self.frequencies)
         
-        # Magnitude plot - don't clip, but exclude points completely outside range
-        valid_mag = (self.magnitudes >= self.magnitude_yrange[0]) & \
-                    (self.magnitudes <= self.magnitude_yrange[1])
-        
-        # Create discontinuous plot when leaving/entering valid range
-        mag_points = []
-        prev_valid = False
-        for x, y, valid in zip(log_w, self.magnitudes, valid_mag):
-            if valid:
-                mag_points.append(self.mag_axes.coords_to_point(x, y))
-            elif prev_valid:
-                # Add break point when leaving valid range
-                mag_points.append(None)  # Creates discontinuity
-            prev_valid = valid
-        
-        self.mag_plot = VMobject()
-        if mag_points:
-            # Filter out None values and create separate segments
-            segments = []
-            current_segment = []
-            for point in mag_points:
-                if point is None:
-                    if current_segment:
-                        segments.append(current_segment)
-                        current_segment = []
-                else:
-                    current_segment.append(point)
-            if current_segment:
-                segments.append(current_segment)
-            
-            # Create separate VMobjects for each continuous segment
-            for seg in segments:
-                if len(seg) > 1:
-                    new_seg = VMobject().set_points_as_corners(seg)
-                    new_seg.set_color(self.plotcolor).set_stroke(width=self.plot_stroke_width)
-                    self.mag_plot.add(new_seg)
-
-        # Phase plot (unchanged)
-        phase_points = [self.phase_axes.coords_to_point(x, y) 
-                    for x, y in zip(log_w, self.phases)]
-        self.phase_plot = VMobject().set_points_as_corners(phase_points)
-        self.phase_plot.set_color(color=self.plotcolor).set_stroke(width=self.plot_stroke_width)
+        # Magnitude plot - don't clip, but exclude points completely outside range.
+        # Each run of visible points becomes a separate subpath of one VMobject.
+        valid_mag = (magnitudes >= self.magnitude_yrange[0]) & \
+                    (magnitudes <= self.magnitude_yrange[1])
+        masked_polyline(mag_plot, self.mag_axes, log_w, magnitudes, valid_mag, tol=self.simplify_tol)
+
+        # Phase plot
+        masked_polyline(phase_plot, self.phase_axes, log_w, phases, np.isfinite(phases),
+                        tol=self.simplify_tol)
+        return mag_plot, phase_plot
 
     def _get_critical_points(self):
         """Identify critical points (resonance, crossover, etc.)"""
@@ -896,97 +880,107 @@ class BodePlot(VGroup):
     
     def _calculate_asymptotes(self):
         """Calculate asymptotes with proper transfer function handling (multiplicity fixed)."""
-        if isinstance(self.system, (signal.TransferFunction, signal.ZerosPolesGain, signal.StateSpace)):
-            tf = self.system
-            if not isinstance(tf, signal.TransferFunction):
-                tf = tf.to_tf()
-        else:
-            tf = signal.TransferFunction(*self.system)
-
+        tf = self.system
         zeros = tf.zeros
         poles = tf.poles
 
-        tol = 1e-6
-        # Cancel pole-zero pairs but preserve multiplicity
-        for z in zeros.copy():
-            for p in poles.copy():
-                if abs(z - p) < tol:
-                    zeros = np.delete(zeros, np.where(zeros == z))
-                    poles = np.delete(poles, np.where(poles == p))
-                    break
-
-        self.mag_asymp = np.zeros_like(self.frequencies)
-        self.phase_asymp = np.zeros_like(self.frequencies)
-
-        # Group poles and zeros by frequency with multiplicity
-        def group_by_freq(arr):
-            freq_map = {}
-            for val in arr:
-                if np.isclose(val, 0, atol=1e-8):
-                    continue
-                f = round(abs(val), 8)  # rounding to avoid floating-point mismatch
-                freq_map[f] = freq_map.get(f, 0) + 1
-            return freq_map
-
-        pole_groups = group_by_freq(poles)
-        zero_groups = group_by_freq(zeros)
+        # Cancel pole-zero pairs but preserve multiplicity: within a cluster of coinciding
+        # zeros and poles, the k-th zero cancels the k-th pole
+        close = np.abs(zeros[:, None] - poles[None, :]) < 1e-6
+        zero_rank = np.cumsum(close, axis=0) * close
+        pole_rank = np.cumsum(close, axis=1) * close
+        pairs = close & (zero_rank == pole_rank)
+        zeros = zeros[~pairs.any(axis=1)]
+        poles = poles[~pairs.any(axis=0)]
+
+        # Group poles and zeros by frequency; the multiplicity becomes the weight of a break
+        # (+1 per zero, -1 per pole)
+        def break_frequencies(arr):
+            arr = arr[~np.isclose(arr, 0, atol=1e-8)]
+            return np.round(np.abs(arr), 8)  # rounding to avoid floating-point mismatch
+
+        pole_freqs, zero_freqs = break_frequencies(poles), break_frequencies(zeros)
+        break_freqs, inverse = np.unique(np.concatenate([zero_freqs, pole_freqs]), return_inverse=True)
+        signs = np.concatenate([np.ones(len(zero_freqs)), -np.ones(len(pole_freqs))])
+        weights = np.bincount(inverse, weights=signs, minlength=len(break_freqs))
 
         # Keep sorted break frequencies
-        mag_break_freqs = sorted(set(list(pole_groups.keys()) + list(zero_groups.keys())))
-        self.mag_break_freqs = [f for f in mag_break_freqs if self.freq_range[0] <= f <= self.freq_range[1]]
+        self.mag_break_freqs = [f for f in break_freqs if self.freq_range[0] <= f <= self.freq_range[1]]
+        self._asymp_breaks = (break_freqs, weights)
 
         # DC gain
-        num = np.poly1d(tf.num)
-        den = np.poly1d(tf.den)
         w0 = self.freq_range[0]
-        dc_gain = 20 * np.log10(np.abs(num(w0*1j)/den(w0*1j)))
+        g0 = evaluate(tf, np.array([w0]))[0]
+        self._asymp_dc_gain = 20 * np.log10(np.abs(g0))
 
         # DC phase
         n_zeros_origin = sum(np.isclose(zeros, 0, atol=1e-8))
         n_poles_origin = sum(np.isclose(poles, 0, atol=1e-8))
+        self._asymp_origin_order = n_zeros_origin - n_poles_origin
         start_phase = (n_zeros_origin - n_poles_origin) * 90
         if n_zeros_origin == 0 and n_poles_origin == 0:
-            dc_ph = num(w0*1j) / den(w0*1j)
-            if np.real(dc_ph) < 0:
+            if np.real(g0) < 0:
                 start_phase += 180
             else:
                 start_phase = 0
+        self._asymp_start_phase = start_phase
 
-        # Magnitude asymptote calculation (with multiplicity)
-        for i, freq in enumerate(self.frequencies):
-            current_mag = dc_gain
-            # Origin effects
-            current_mag += (n_zeros_origin - n_poles_origin) * 20 * np.log10(freq / w0)
-
-            # Poles
-            for f_break, count in pole_groups.items():
-                if freq >= f_break:
-                    current_mag += -20 * count * np.log10(freq / f_break)
-
-            # Zeros
-            for f_break, count in zero_groups.items():
-                if freq >= f_break:
-                    current_mag += 20 * count * np.log10(freq / f_break)
-
-            self.mag_asymp[i] = current_mag
-
-        # Phase asymptote calculation (with multiplicity)
-        for i, freq in enumerate(self.frequencies):
-            current_phase = start_phase
+        self.mag_asymp, self.phase_asymp = self._evaluate_asymptotes(self.frequencies)
 
-            # Real poles
-            for f_break, count in pole_groups.items():
-                if freq >= f_break:
-                    current_phase += -90 * count
+    def _evaluate_asymptotes(self, frequencies):
+        """
+        Evaluates the magnitude and phase asymptotes on a frequency grid in one broadcast
+        over a (frequency x break) matrix.
+        """
+        break_freqs, weights = self._asymp_breaks
+        log_w = np.log10(frequencies)
 
-            # Real zeros
-            for f_break, count in zero_groups.items():
-                if freq >= f_break:
-                    current_phase += 90 * count
+        # Decades past every break frequency, zero below it
+        decades = log_w[:, None] - np.log10(break_freqs)[None, :]
+        past_break = decades >= 0
 
-            self.phase_asymp[i] = current_phase
+        mag = (self._asymp_dc_gain
+               + self._asymp_origin_order * 20 * (log_w - np.log10(self.freq_range[0]))
+               + 20 * (np.where(past_break, decades, 0) @ weights))
+        phase = self._asymp_start_phase + 90 * (past_break @ weights)
+        return mag, phase
 
-    def show_asymptotes(self, color=YELLOW, add_directly=True, **kwargs):
+    def _asymptote_vertices(self):
+        """
+        Returns the corner points of the asymptotes within the frequency range as
+        (log_w_mag, mag, log_w_phase, phase). The magnitude is piecewise linear in
+        log frequency; the phase is a staircase with a vertical step at every break.
+        """
+        break_freqs, weights = self._asymp_breaks
+        lo, hi = np.log10(self.freq_range[0]), np.log10(self.freq_range[1])
+        log_breaks = np.log10(break_freqs)
+        inner = (weights != 0) & (log_breaks > lo) & (log_breaks <= hi)
+        log_breaks, weights = log_breaks[inner], weights[inner]
+
+        log_w_mag = np.unique(np.concatenate([[lo], log_breaks, [hi]]))
+        mag, _ = self._evaluate_asymptotes(10**log_w_mag)
+
+        # Each step is drawn from the phase just before the break to the phase just after it
+        _, start_phase = self._evaluate_asymptotes(10**np.array([lo]))
+        levels = start_phase[0] + 90 * np.concatenate([[0], np.cumsum(weights)])
+        log_w_phase = np.concatenate([[lo], np.repeat(log_breaks, 2), [hi]])
+        phase = np.repeat(levels, 2)
+        return log_w_mag, mag, log_w_phase, phase
+
+    @staticmethod
+    def _insert_level_crossings(x, y, levels):
+        """Insert the points where a polyline with increasing x crosses the given y levels."""
+        for level in levels:
+            d = y - level
+            idx = np.flatnonzero(d[:-1] * d[1:] < 0)
+            t = d[idx] / (d[idx] - d[idx + 1])
+            x_cross = x[idx] + t * (x[idx + 1] - x[idx])
+            order = np.argsort(np.concatenate([x, x_cross]), kind='stable')
+            x = np.concatenate([x, x_cross])[order]
+            y = np.concatenate([y, np.full(len(idx), level)])[order]
+        return x, y
+
+    def show_asymptotes(self, color=YELLOW, add_directly=True, vertices_only=False, **kwargs):
         """Plot asymptotes of the Bode plot.
         
         PARAMETERS
@@ -996,12 +990,18 @@ class BodePlot(VGroup):
             Color of the asymptotes
         add_directly : bool
             If true, the asymptotes are added directly to the Bode plot. To animate the asymptotes set add_directly to false
+        vertices_only : bool
+            If true, the asymptotes are drawn through their break point corners only, instead of
+            through every sample of the frequency grid. The lines are identical, with far fewer points.
         **kwargs : any
             Any arguments to be passed to Line:
             -stroke_width: Thickness of the asymptote lines
             -stroke_opacity: Opacity of the asymptote lines
 
         """
+        if self.dt is not None:
+            warnings.warn("Straight-line asymptotes are only defined for continuous-time systems.", UserWarning)
+            return self
         self._remove_existing_asymptotes()
         self.show_asymptotes_r = True
         if not hasattr(self, 'mag_asymp'):
@@ -1009,20 +1009,25 @@ class BodePlot(VGroup):
 
         mag_min, mag_max = self.magnitude_yrange[0], self.magnitude_yrange[1]
         phase_min, phase_max = self.phase_yrange[0], self.phase_yrange[1]
-        clipped_mag_asymp = np.clip(self.mag_asymp, mag_min, mag_max)
-        clipped_phase_asymp = np.clip(self.phase_asymp, phase_min, phase_max)
+        if vertices_only:
+            log_w_mag, mag_asymp, log_w_phase, phase_asymp = self._asymptote_vertices()
+            # Keep the corners where the magnitude leaves the visible range, so clipping keeps the slopes
+            log_w_mag, mag_asymp = self._insert_level_crossings(log_w_mag, mag_asymp, (mag_min, mag_max))
+        else:
+            log_w_mag = log_w_phase = np.log10(self.frequencies)
+            mag_asymp, phase_asymp = self.mag_asymp, self.phase_asymp
+        clipped_mag_asymp = np.clip(mag_asymp, mag_min, mag_max)
+        clipped_phase_asymp = np.clip(phase_asymp, phase_min, phase_max)
 
         # Magnitude Plot
-        self.mag_asymp_plot = VMobject()
-        mag_points = [self.mag_axes.coords_to_point(np.log10(f), m) 
-                    for f, m in zip(self.frequencies, clipped_mag_asymp)]
-        self.mag_asymp_plot.set_points_as_corners(mag_points).set_color(color).set_stroke(**kwargs)
+        self.mag_asymp_plot = masked_polyline(VMobject(), self.mag_axes, log_w_mag, clipped_mag_asymp,
+                                              tol=self.simplify_tol)
+        self.mag_asymp_plot.set_color(color).set_stroke(**kwargs)
 
         # Phase Plot
-        self.phase_asymp_plot = VMobject()
-        phase_points = [self.phase_axes.coords_to_point(np.log10(f), p) 
-                        for f, p in zip(self.frequencies, clipped_phase_asymp)]
-        self.phase_asymp_plot.set_points_as_corners(phase_points).set_color(color).set_stroke(**kwargs)
+        self.phase_asymp_plot = masked_polyline(VMobject(), self.phase_axes, log_w_phase, clipped_phase_asymp,
+                                                tol=self.simplify_tol)
+        self.phase_asymp_plot.set_color(color).set_stroke(**kwargs)
 
         if self._show_magnitude and add_directly:
             self.mag_group.add(self.mag_asymp_plot)
@@ -1035,8 +1040,10 @@ class BodePlot(VGroup):
     def _remove_existing_asymptotes(self):
         """Clean up previous asymptote plots"""
         for attr in ['mag_asymp_plot', 'phase_asymp_plot']:
-            if hasattr(self, attr) and getattr(self, attr) in getattr(self, attr.split('_')[0] + '_components'):
-                getattr(self, attr.split('_')[0] + '_components').remove(getattr(self, attr))
+            if hasattr(self, attr):
+                # The magnitude asymptotes are added to the (retained) magnitude group
+                for group in (self.mag_group, self.mag_components, self.phase_components):
+                    group.remove(getattr(self, attr))
 
     def show_margins(self, show_values=True, show_pm=True, show_gm=True, gm_in_dB=True, pm_color=GREEN_C, add_directly=True,
                      gm_color=YELLOW, text_color_white=True,font_size=24, gm_label=None, pm_label=None, pm_label_pos=DOWN+LEFT, gm_label_pos=UP+RIGHT,**kwargs):
@@ -1100,8 +1107,9 @@ class BodePlot(VGroup):
                     if add_directly:
                         margin_group.add(self.vert_gain_line)
                 
+                # On the plotted phase curve, which may cross on another branch than -180 degrees
                 self.gm_dot = Dot(
-                    self.phase_axes.c2p(log_wg, -180),
+                    self.phase_axes.c2p(log_wg, phase_at_wg),
                     color=gm_color, radius=0.05)
                 
                 # Only add GM vector if it will have positive length
@@ -1218,65 +1226,13 @@ class BodePlot(VGroup):
         - wp: phase crossover frequency (where gain crosses 0 dB)
         - ws: stability margin frequency
         """
-        # Find phase crossover (where phase crosses -180°)
-        phase_crossings = np.where(np.abs(self.phases + 180) < 0.5)[0]
-        
-        gms = []
-        wgs = []
-        for idx in phase_crossings:
-            wg = np.interp(-180, self.phases[idx:idx+2], self.frequencies[idx:idx+2])
-            mag_at_wg = np.interp(wg, self.frequencies, self.magnitudes)
-            gm_db = -mag_at_wg  # Gain margin in dB
-            gm_linear = 10**(gm_db/20)  # Convert to linear scale for comparison
-            
-            gms.append(gm_db)
-            wgs.append(wg)
-        
-        # Select the gain margin closest to 1 in linear scale
-        if gms:
-            gms_linear = [10**(gm/20) for gm in gms]
-            closest_idx = np.argmin([abs(gm_linear - 1) for gm_linear in gms_linear])
-            gm = gms[closest_idx]
-            wg = wgs[closest_idx]
-        else:
-            wg = np.inf
-            gm = np.inf
-        
-        # Find all gain crossovers (where magnitude crosses 0 dB)
-        gain_crossings = []
-        for i in range(len(self.magnitudes)-1):
-            if self.magnitudes[i] * self.magnitudes[i+1] <= 0:
-                gain_crossings.append(i)
-        
-        pms = []
-        wps = []
-        for idx in gain_crossings:
-            wp = np.interp(0, 
-                        [self.magnitudes[idx], self.magnitudes[idx+1]],
-                        [self.frequencies[idx], self.frequencies[idx+1]])
+        # Exact crossovers from the margin engine, limited to the plotted frequency range
+        gm, pm, sm, wg, wp, ws = stability_margins(self.system, self.freq_range)
+
+        if np.isfinite(pm):
+            # Express the phase margin on the branch of the plotted (unwrapped, DC-aligned) phase curve
             phase_at_wp = np.interp(wp, self.frequencies, self.phases)
-            pm = 180 + phase_at_wp
-            
-            pms.append(pm)
-            wps.append(wp)
-        
-        # Select the phase margin closest to 0 degrees
-        if pms:
-            closest_idx = np.argmin([abs(pm) for pm in pms])
-            pm = pms[closest_idx]
-            wp = wps[closest_idx]
-        else:
-            wp = np.inf
-            pm = np.inf
-        
-        # Calculate stability margin (minimum distance to -1 point)
-        if len(self.frequencies) > 0:
-            nyquist = (1 + 10**(self.magnitudes/20) * np.exp(1j * self.phases * np.pi/180))
-            sm = 1 / np.min(np.abs(nyquist))
-            ws = self.frequencies[np.argmin(np.abs(nyquist))]
-        else:
-            sm = np.inf
-            ws = np.inf
+            pm = pm + 360 * np.round((180 + phase_at_wp - pm) / 360)
         
         return gm, pm, sm, wg, wp, ws
     
\ No newline at end of file
@@ -1,14 +1,7 @@
 from manim import *
 import numpy as np
 import warnings
-from scipy import signal
-import sympy as sp
 from collections import OrderedDict
-from manim import TexTemplate
-from scipy.interpolate import interp1d 
-
-my_template = TexTemplate()
-my_template.add_to_preamble(r"\usepackage{amsmath}")  # Add required packages
 
 #Control loop system classes
 __all__ = ['ControlSystem', 'ControlBlock', 'Connection']
@@ -0,0 +1,302 @@
+import numpy as np
+
+# Vectorized construction of plot curves in scene coordinates, shared by the plot classes
+
+def axes_transform(axes):
+    """
+    Affine map from data coordinates of linear axes (Axes, NumberPlane, ComplexPlane) to
+    scene points, sampled from three coords_to_point calls.
+
+    RETURNS
+    -------
+    numpy.ndarray
+        3x3 matrix M such that [x, y, 1] @ M is the scene point of (x, y).
+    """
+    x0, x1 = float(axes.x_range[0]), float(axes.x_range[1])
+    y0, y1 = float(axes.y_range[0]), float(axes.y_range[1])
+    origin = np.asarray(axes.coords_to_point(x0, y0), dtype=float)
+    ex = (np.asarray(axes.coords_to_point(x1, y0), dtype=float) - origin) / (x1 - x0)
+    ey = (np.asarray(axes.coords_to_point(x0, y1), dtype=float) - origin) / (y1 - y0)
+    return np.array([ex, ey, origin - x0 * ex - y0 * ey])
+
+def to_scene(axes, x, y, transform=None):
+    """
+    Maps arrays of data coordinates to an (N, 3) array of scene points in one matrix product.
+
+    PARAMETERS
+    ----------
+    axes : manim.Axes
+        Linear axes the data is plotted on.
+    x, y : array_like
+        Data coordinates.
+    transform : numpy.ndarray | None
+        A matrix from axes_transform, to skip sampling the axes again.
+    """
+    if transform is None:
+        transform = axes_transform(axes)
+    x, y = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+    return np.column_stack([x.ravel(), y.ravel(), np.ones(x.size)]) @ transform
+
+def segment_points(start, end):
+    """
+    Bezier control points of independent straight line segments from start[i] to end[i],
+    as VMobject.set_points_as_corners would create them. Segments that end where the next
+    one starts form one subpath; everywhere else a new subpath begins.
+
+    RETURNS
+    -------
+    numpy.ndarray
+        (4M, 3) array with one cubic Bezier curve per segment.
+    """
+    start, end = np.asarray(start, dtype=float), np.asarray(end, dtype=float)
+    alphas = np.linspace(0, 1, 4)[None, :, None]
+    curves = start[:, None, :] + alphas * (end - start)[:, None, :]
+    return curves.reshape(-1, 3)
+
+def polyline_points(points, joined=None, tol=None):
+    """
+    Bezier control points of a polyline, as VMobject.set_points_as_corners would create them,
+    split into separate subpaths wherever two consecutive points are not joined.
+
+    PARAMETERS
+    ----------
+    points : numpy.ndarray
+        (N, 3) array of corner points.
+    joined : array_like | None
+        N-1 booleans telling whether each point is connected to the next one. If None,
+        all points form one path.
+    tol : float | None
+        If given, every subpath is first simplified to this tolerance in scene units
+        (see simplify_polyline).
+
+    RETURNS
+    -------
+    numpy.ndarray
+        (4M, 3) array with one cubic Bezier curve (straight line) per joined pair.
+    """
+    points = np.asarray(points, dtype=float)
+    if len(points) < 2:
+        return np.zeros((0, 3))
+    if joined is None:
+        joined = np.ones(len(points) - 1, dtype=bool)
+    joined = np.asarray(joined, dtype=bool)
+    if tol is not None:
+        # Simplify every run of joined points on its own, so the subpaths keep their ends
+        keep = ~np.concatenate([[False], joined]) | ~np.concatenate([joined, [False]])
+        starts, ends = run_lengths(joined)
+        for start, end in zip(starts, ends + 1):
+            keep[start:end] = simplify_polyline(points[start:end], tol)
+        kept = np.flatnonzero(keep)
+        # Two kept points are joined if no break lies between them
+        breaks = np.concatenate([[0], np.cumsum(~joined)])
+        joined = breaks[kept[1:]] == breaks[kept[:-1]]
+        points = points[kept]
+    return segment_points(points[:-1][joined], points[1:][joined])
+
+def dash_segments(start, end, dash_length=0.05, dashed_ratio=0.5):
+    """
+    Splits straight lines into dashes laid out like manim's DashedLine: at least two dashes,
+    the first starting at the start point and the last ending at the end point.
+
+    RETURNS
+    -------
+    tuple[numpy.ndarray]
+        (start, end) points of all dashes.
+    """
+    start, end = np.asarray(start, dtype=float), np.asarray(end, dtype=float)
+    if len(start) == 0:
+        return start, end
+    lengths = np.linalg.norm(end - start, axis=1)
+    num_dashes = np.maximum(2, np.ceil(lengths / dash_length * dashed_ratio)).astype(int)
+    line = np.repeat(np.arange(len(start)), num_dashes)
+    index = np.arange(len(line)) - np.repeat(np.cumsum(num_dashes) - num_dashes, num_dashes)
+    n = num_dashes[line]
+    period = dashed_ratio / n + (1 - dashed_ratio) / (n - 1)
+    alpha_start = (index * period)[:, None]
+    alpha_end = alpha_start + (dashed_ratio / n)[:, None]
+    delta = end[line] - start[line]
+    return start[line] + alpha_start * delta, start[line] + alpha_end * delta
+
+def edge_ticks(axes, values, axis, length, transform=None):
+    """
+    Tick marks at the given values on both edges of the plot box: at the bottom and top for
+    axis="x", at the left and right for axis="y". They point length scene units inwards.
+
+    RETURNS
+    -------
+    tuple[numpy.ndarray]
+        (start, end) points of all tick marks.
+    """
+    values = np.asarray(values, dtype=float)
+    if axis == "x":
+        lower = to_scene(axes, values, axes.y_range[0], transform)
+        upper = to_scene(axes, values, axes.y_range[1], transform)
+        offset = np.array([0, length, 0])
+    else:
+        lower = to_scene(axes, axes.x_range[0], values, transform)
+        upper = to_scene(axes, axes.x_range[1], values, transform)
+        offset = np.array([length, 0, 0])
+    return np.concatenate([lower, upper - offset]), np.concatenate([lower + offset, upper])
+
+def line_set(start, end, **kwargs):
+    """
+    One VMobject holding many straight lines (a family of ticks or grid lines) as subpaths,
+    instead of a VGroup of Line objects that all have to be created, updated and rendered
+    one by one.
+
+    PARAMETERS
+    ----------
+    start, end : numpy.ndarray
+        (N, 3) end points of the lines.
+    **kwargs : Any
+        Style arguments passed to the VMobject constructor (color, stroke_width, ...).
+    """
+    from manim import VMobject
+    return VMobject(**kwargs).set_points(segment_points(start, end))
+
+def run_lengths(mask):
+    """
+    Start and end (exclusive) indices of the runs of True values in a boolean array.
+
+    RETURNS
+    -------
+    tuple[numpy.ndarray]
+        (starts, ends)
+    """
+    edges = np.diff(np.concatenate([[0], np.asarray(mask, dtype=np.int8), [0]]))
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+def simplify_polyline(points, tol):
+    """
+    Ramer-Douglas-Peucker simplification of a polyline in scene units.
+
+    Corners are only removed where the simplified line stays within tol of every original
+    point, so with a tolerance below a pixel the drawn curve does not visibly change.
+
+    PARAMETERS
+    ----------
+    points : numpy.ndarray
+        (N, 3) array of corner points.
+    tol : float
+        Maximum distance in scene units between a removed point and the simplified line.
+
+    RETURNS
+    -------
+    numpy.ndarray
+        Boolean mask of the points to keep. The first and last point are always kept.
+    """
+    points = np.asarray(points, dtype=float)
+    keep = np.zeros(len(points), dtype=bool)
+    keep[[0, -1]] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        a, ab = points[first], points[last] - points[first]
+        inner = points[first + 1:last] - a
+        length2 = ab @ ab
+        t = np.clip(inner @ ab / length2, 0, 1) if length2 > 0 else np.zeros(len(inner))
+        distances = np.linalg.norm(inner - t[:, None] * ab, axis=1)
+        k = int(np.argmax(distances))
+        if distances[k] > tol:
+            k += first + 1
+            keep[k] = True
+            stack.extend([(first, k), (k, last)])
+    return keep
+
+def pixel_tolerance(pixels=0.5):
+    """Length in scene units of the given number of pixels at manim's current render resolution."""
+    from manim import config
+    return pixels * config.frame_width / config.pixel_width
+
+def resolve_tolerance(tol):
+    """Turns a simplify_tol argument (None, a length in scene units or "pixel") into a length or None."""
+    if tol is None:
+        return None
+    if tol == "pixel":
+        return pixel_tolerance()
+    return float(tol)
+
+def clip_segments(x, y, box):
+    """
+    Clips the polyline through (x, y) to a rectangle with the Liang-Barsky algorithm,
+    vectorized over all segments.
+
+    Segments crossing the border end exactly on it, so the curve leaves and re-enters the
+    box where it really does, instead of being joined by a chord across the plot.
+
+    PARAMETERS
+    ----------
+    x, y : array_like
+        Data coordinates of the polyline. Segments with non-finite ends are left out.
+    box : tuple[float]
+        (x_min, x_max, y_min, y_max)
+
+    RETURNS
+    -------
+    tuple[numpy.ndarray]
+        (start, end), the (M, 2) end points of the visible part of every segment.
+    """
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    x0, y0, dx, dy = x[:-1], y[:-1], np.diff(x), np.diff(y)
+    x_min, x_max, y_min, y_max = box
+
+    # Edge k is crossed at t = q[k]/p[k]; p < 0 enters the box, p > 0 leaves it
+    p = np.stack([-dx, dx, -dy, dy])
+    q = np.stack([x0 - x_min, x_max - x0, y0 - y_min, y_max - y0])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = q / p
+    t_enter = np.max(np.where(p < 0, t, 0.0), axis=0, initial=0.0)
+    t_leave = np.min(np.where(p > 0, t, 1.0), axis=0, initial=1.0)
+
+    finite = np.isfinite(x0) & np.isfinite(y0) & np.isfinite(dx) & np.isfinite(dy)
+    parallel_outside = np.any((p == 0) & (q < 0), axis=0)
+    visible = finite & ~parallel_outside & (t_enter < t_leave)
+
+    # Unclipped ends are copied exactly, so consecutive segments stay connected
+    points = np.column_stack([x, y])
+    first, last, delta = points[:-1][visible], points[1:][visible], (points[1:] - points[:-1])[visible]
+    t_enter, t_leave = t_enter[visible, None], t_leave[visible, None]
+    start = np.where(t_enter > 0, first + t_enter * delta, first)
+    end = np.where(t_leave < 1, first + t_leave * delta, last)
+    return start, end
+
+def set_polyline(vmobject, points, joined=None, tol=None):
+    """Replaces the points of a VMobject by a (possibly broken) polyline, see polyline_points."""
+    vmobject.set_points(polyline_points(points, joined, tol))
+    return vmobject
+
+def masked_polyline(vmobject, axes, x, y, mask=None, transform=None, tol=None):
+    """
+    Draws the data points (x, y) on axes into a single VMobject, leaving out the points
+    where mask is False. Every run of consecutive valid points becomes its own subpath.
+    """
+    points = to_scene(axes, x, y, transform)
+    if mask is None:
+        return set_polyline(vmobject, points, tol=tol)
+    mask = np.asarray(mask, dtype=bool)
+    return set_polyline(vmobject, points, mask[:-1] & mask[1:], tol)
+
+def clipped_points(axes, x, y, box=None, transform=None, tol=None):
+    """
+    Scene-space Bezier points of the polyline through the data points (x, y), clipped
+    to box (see clip_segments), which defaults to the range of the axes. If tol is given,
+    the visible pieces are simplified to it (see simplify_polyline).
+    """
+    if box is None:
+        box = (axes.x_range[0], axes.x_range[1], axes.y_range[0], axes.y_range[1])
+    if transform is None:
+        transform = axes_transform(axes)
+    start, end = clip_segments(x, y, box)
+    start = to_scene(axes, start[:, 0], start[:, 1], transform)
+    end = to_scene(axes, end[:, 0], end[:, 1], transform)
+    if tol is None or len(start) == 0:
+        return segment_points(start, end)
+
+    # Chain the segments back into polylines: a piece ends where the next segment starts elsewhere
+    last = np.flatnonzero(np.concatenate([np.any(start[1:] != end[:-1], axis=1), [True]]))
+    points = np.insert(start, last + 1, end[last], axis=0)
+    joined = np.ones(len(points) - 1, dtype=bool)
+    joined[(last + np.arange(1, len(last) + 1))[:-1]] = False
+    return polyline_points(points, joined, tol)
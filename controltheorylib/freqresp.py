@@ -0,0 +1,867 @@
+import hashlib
+import re
+import sys
+from collections import OrderedDict
+
+import numpy as np
+
+from .statespace import StateSpaceModel
+from .tfparser import parse_coefficients
+
+# Shared frequency-response core used by BodePlot, Nyquist and PoleZeroMap
+
+# scipy.signal and sympy are slow to import, so they are imported on first use. Objects
+# of a package can only exist once it has been imported, so type checks look it up in
+# sys.modules instead of importing it.
+def _is_sympy(obj):
+    sympy = sys.modules.get('sympy')
+    return sympy is not None and isinstance(obj, sympy.Basic)
+
+def _is_lti(obj):
+    signal = sys.modules.get('scipy.signal')
+    return signal is not None and isinstance(obj, (signal.TransferFunction, signal.ZerosPolesGain,
+                                                   signal.StateSpace))
+
+def _is_state_space(obj):
+    signal = sys.modules.get('scipy.signal')
+    return signal is not None and isinstance(obj, signal.StateSpace)
+
+def parse_system_input(system):
+    """
+    Parses the supported system specifications into a scipy LTI object or coefficient tuple.
+
+    PARAMETERS
+    ----------
+    system : various
+        System representation, which can be one of:
+        - scipy.signal.TransferFunction, ZerosPolesGain or StateSpace
+        - A StateSpaceModel
+        - Tuple/list of (numerator, denominator) coefficient arrays
+        - Tuple/list of (numerator_expr, denominator_expr) as strings or sympy expressions
+        - A complete sympy expression or string in 's' (or 'z' for discrete-time systems)
+        - A FrequencyResponse, whose already normalized system is reused
+
+    RETURNS
+    -------
+    scipy.signal.lti | StateSpaceModel | tuple
+        The LTI object itself or a (num_coeffs, den_coeffs) tuple.
+    """
+    # Reuse the normalized system of an earlier evaluation
+    if isinstance(system, FrequencyResponse):
+        return system.system
+
+    # Directly pass through valid scipy LTI system objects
+    if isinstance(system, StateSpaceModel) or _is_lti(system):
+        return system
+
+    # Handle sympy expression directly
+    if _is_sympy(system):
+        return symbolic_to_coefficients(system, 1)  # Denominator is 1 since it's already a complete expression
+
+    # Tuple: could be symbolic or coefficient list
+    if isinstance(system, (tuple, list)) and len(system) == 2:
+        num, den = system
+
+        # If any part is symbolic or a string, convert
+        if isinstance(num, str) or isinstance(den, str) or _is_sympy(num) or _is_sympy(den):
+            return symbolic_to_coefficients(num, den)
+        return (num, den)  # Already numeric
+
+    # Handle string-based symbolic transfer functions (e.g., "(s+1)/(s^2+2*s+1)")
+    if isinstance(system, str):
+        if '/' in system:
+            num_str, den_str = system.split('/', 1)
+            return symbolic_to_coefficients(num_str.strip(), den_str.strip())
+        return symbolic_to_coefficients(system.strip(), "1")
+
+    raise ValueError("Invalid system specification.")
+
+def symbolic_to_coefficients(num_expr, den_expr=1):
+    """
+    Converts symbolic numerator and denominator expressions to polynomial coefficients.
+
+    The polynomial variable is 's', unless the expressions only contain 'z',
+    in which case the system is treated as a discrete-time (z-domain) system.
+
+    PARAMETERS
+    ----------
+    num_expr : str | sympy.Basic | float
+        Numerator expression, or the complete transfer function if den_expr is 1.
+    den_expr : str | sympy.Basic | float
+        Denominator expression.
+
+    RETURNS
+    -------
+    tuple
+        (num_coeffs, den_coeffs) as lists of floats, highest power first.
+
+    Plain polynomial strings are parsed by the memoized tfparser fast path; sympy is only
+    used for sympy input and for expressions the fast path does not support.
+    """
+    if isinstance(num_expr, (str, int, float)) and isinstance(den_expr, (str, int, float)):
+        parsed = parse_coefficients(str(num_expr), str(den_expr))
+        if parsed is not None:
+            return (list(parsed[0]), list(parsed[1]))
+    import sympy as sp
+    try:
+        # If we got a complete expression (num_expr is the whole TF and den_expr is 1)
+        if den_expr == 1 and isinstance(num_expr, sp.Basic):
+            num_expr, den_expr = sp.fraction(sp.together(num_expr))
+
+        # Convert strings to sympy expressions
+        if isinstance(num_expr, str):
+            num_expr = sp.sympify(num_expr.replace('^', '**'))
+        if isinstance(den_expr, str):
+            den_expr = sp.sympify(den_expr.replace('^', '**'))
+        num_expr = sp.sympify(num_expr)
+        den_expr = sp.sympify(den_expr)
+
+        var = system_variable(num_expr, den_expr)
+        num_poly = sp.Poly(num_expr, var)
+        den_poly = sp.Poly(den_expr, var)
+
+        num_coeffs = [float(c) for c in num_poly.all_coeffs()]
+        den_coeffs = [float(c) for c in den_poly.all_coeffs()]
+
+        return (num_coeffs, den_coeffs)
+    except Exception as e:
+        raise ValueError(f"Could not parse transfer function: {e}") from e
+
+def system_variable(*exprs):
+    """Return the polynomial variable (s or z) used in the given expressions."""
+    import sympy as sp
+    names = set()
+    for expr in exprs:
+        if isinstance(expr, sp.Basic):
+            names.update(str(sym) for sym in expr.free_symbols)
+    if 'z' in names and 's' not in names:
+        return sp.symbols('z')
+    return sp.symbols('s')
+
+def ensure_tf(system):
+    """Convert system to TransferFunction if needed"""
+    from scipy import signal
+    if isinstance(system, signal.TransferFunction):
+        return system
+    if isinstance(system, (signal.ZerosPolesGain, signal.StateSpace)):
+        return system.to_tf()
+    return signal.TransferFunction(*system)
+
+def is_z_domain(system):
+    """Check whether a symbolic system specification is written in z (and not in s)."""
+    if isinstance(system, (tuple, list)) and len(system) == 2:
+        parts = [part for part in system if isinstance(part, str) or _is_sympy(part)]
+    elif isinstance(system, str) or _is_sympy(system):
+        parts = [system]
+    else:
+        return False
+    names = set()
+    for part in parts:
+        if isinstance(part, str):
+            names.update(re.findall(r'[A-Za-z_]\w*', part))
+        else:
+            names.update(str(sym) for sym in part.free_symbols)
+    return 'z' in names and 's' not in names
+
+def normalize_system(system, dt=None):
+    """
+    Parse any supported system specification once into a scipy TransferFunction.
+
+    State-space models are kept in state-space form (as a StateSpaceModel), so
+    high-order models are evaluated without a polynomial round-trip.
+
+    Discrete-time systems carry their sample time: scipy LTI objects keep their own dt,
+    a given dt turns the system into a discrete-time system, and expressions in z
+    without a dt get a sample time of 1 (frequencies in rad/sample).
+    """
+    if dt is None and is_z_domain(system):
+        dt = 1
+    system = parse_system_input(system)
+    if _is_state_space(system):
+        system = StateSpaceModel(system.A, system.B, system.C, system.D, dt=system.dt)
+    if isinstance(system, StateSpaceModel):
+        if dt is not None and system.dt != dt:
+            system = StateSpaceModel(system.A, system.B, system.C, system.D, dt=dt)
+        return system
+    tf = ensure_tf(system)
+    if dt is not None and tf.dt != dt:
+        from scipy import signal
+        tf = signal.TransferFunction(tf.num, tf.den, dt=dt)
+    return tf
+
+def s_plane_poles_zeros(system):
+    """
+    Poles and zeros as s-plane values, from which break frequencies are read.
+
+    Discrete-time roots are mapped with s = ln(z)/dt, so an integrator (z = 1) maps to
+    s = 0 and |s| is the frequency of the root. Roots at z = 0 (pure delays) are dropped.
+    """
+    tf = normalize_system(system)
+    poles, zeros = tf.poles, tf.zeros
+    if tf.dt is None:
+        return poles, zeros
+    def to_s_plane(roots):
+        roots = roots[roots != 0].astype(complex)
+        # Integrators map exactly to the origin
+        return np.where(np.isclose(roots, 1, rtol=0, atol=1e-12), 0, np.log(roots) / tf.dt)
+    return to_s_plane(poles), to_s_plane(zeros)
+
+def nyquist_frequency(system):
+    """The Nyquist frequency pi/dt of a discrete-time system, np.inf for continuous time."""
+    dt = normalize_system(system).dt
+    return np.inf if dt is None else np.pi / dt
+
+def evaluate(system, omega):
+    """
+    Evaluates G(jω) (or G(e^(jωdt)) for discrete-time systems) for all frequencies
+    in a single vectorized pass.
+
+    PARAMETERS
+    ----------
+    system : various
+        Any supported system specification (see parse_system_input).
+    omega : array_like
+        Frequencies in rad/s.
+
+    RETURNS
+    -------
+    np.ndarray
+        Complex frequency response with the same shape as omega.
+    """
+    tf = normalize_system(system)
+    s = 1j * np.asarray(omega, dtype=float)
+    if tf.dt is not None:
+        # Discrete time: evaluate on the unit circle z = e^(jωdt)
+        s = np.exp(s * tf.dt)
+    if isinstance(tf, StateSpaceModel):
+        return tf.response(s)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.polyval(tf.num, s) / np.polyval(tf.den, s)
+
+def dc_gain(system):
+    """Return G(0) (G(z=1) in discrete time), which is infinite for systems with integrators."""
+    tf = normalize_system(system)
+    if isinstance(tf, StateSpaceModel):
+        return tf.dc_gain()
+    if tf.dt is not None:
+        num1, den1 = np.sum(tf.num), np.sum(tf.den)
+        if abs(den1) <= 1e-12 * np.sum(np.abs(tf.den)):
+            return np.inf
+        return num1 / den1
+    num0, den0 = tf.num[-1], tf.den[-1]
+    if den0 == 0:
+        return np.inf
+    return num0 / den0
+
+def align_phase(phase, system):
+    """
+    Shifts an unwrapped phase curve (degrees) by whole turns so that it starts on the branch
+    closest to 0 or 180 degrees for systems with a finite, non-zero DC gain. Other systems are returned unchanged.
+    """
+    phase_aligned = np.copy(phase)  # Work on a copy
+    if len(phase_aligned) == 0:
+        return phase_aligned
+
+    G0 = dc_gain(system)
+    # Check if DC gain is finite and non-zero
+    if not np.isclose(G0, 0) and np.isfinite(G0):
+        # Determine the target starting phase (0 or 180)
+        target_dc_phase = 180 if np.real(G0) < 0 else 0
+
+        # Shift by whole turns only, so the curve keeps its true phase at the lowest
+        # frequency and only lands on the branch closest to the target
+        phase_aligned += 360 * np.round((target_dc_phase - phase_aligned[0]) / 360)
+    # else: If G0 is 0 or inf, the phase doesn't settle to 0/180,
+    #       so no DC alignment is applied. Use the unwrapped phase as is.
+    return phase_aligned
+
+class FrequencyResponse:
+    """
+    Frequency response of a normalized system on a frequency grid.
+
+    The system is parsed only once and G(jω) is evaluated in one vectorized
+    pass. Derived quantities (magnitude, unwrapped and DC-aligned phase) are
+    computed on first access, so one object can be shared by a Bode plot,
+    a Nyquist plot and a pole-zero map of the same loop.
+
+    PARAMETERS
+    ----------
+    system : various
+        Any supported system specification (see parse_system_input).
+    omega : array_like
+        Frequencies in rad/s.
+    response : np.ndarray | None
+        Precomputed complex response on omega. If None, it is evaluated.
+    """
+    def __init__(self, system, omega, response=None):
+        self.system = normalize_system(system)
+        self.omega = np.asarray(omega, dtype=float)
+        if response is None:
+            response = evaluate(self.system, self.omega)
+        self.response = np.asarray(response, dtype=complex)
+        self._phase = None
+        self._aligned_phase = None
+
+    def __len__(self):
+        return len(self.omega)
+
+    @property
+    def real(self):
+        return np.real(self.response)
+
+    @property
+    def imag(self):
+        return np.imag(self.response)
+
+    @property
+    def magnitude(self):
+        """Linear magnitude |G(jω)|."""
+        return np.abs(self.response)
+
+    @property
+    def magnitude_db(self):
+        """Magnitude in dB."""
+        with np.errstate(divide='ignore'):
+            return 20 * np.log10(np.abs(self.response))
+
+    @property
+    def phase(self):
+        """Unwrapped phase in degrees."""
+        if self._phase is None:
+            self._phase = np.unwrap(np.angle(self.response)) * 180 / np.pi
+        return self._phase
+
+    @property
+    def aligned_phase(self):
+        """Unwrapped phase in degrees, aligned to the DC gain sign."""
+        if self._aligned_phase is None:
+            self._aligned_phase = align_phase(self.phase, self.system)
+        return self._aligned_phase
+
+    def evaluate(self, omega):
+        """Evaluate the same system on a new grid, reusing the parsed system."""
+        return FrequencyResponse(self.system, omega)
+
+def parameter_grid(param_grid):
+    """
+    Expands a {name: values} parameter grid into all combinations.
+
+    RETURNS
+    -------
+    dict
+        {name: 1-D array}, all arrays of length equal to the number of combinations.
+    """
+    names = list(param_grid)
+    values = [np.atleast_1d(np.asarray(param_grid[name], dtype=float)) for name in names]
+    mesh = np.meshgrid(*values, indexing='ij')
+    return {name: m.ravel() for name, m in zip(names, mesh)}
+
+def template_coefficients(template, param_grid):
+    """
+    Coefficients of a symbolic transfer function template for every point of a parameter grid.
+
+    The template is parsed with sympy only once. Its polynomial coefficients, which are
+    expressions in the parameters, are then evaluated for the whole grid with numpy.
+
+    PARAMETERS
+    ----------
+    template : str | sympy.Basic | tuple
+        Complete transfer function, or (numerator, denominator), in 's' (or 'z')
+        with the parameters as additional symbols, e.g. "K*(s+a)/(s*(s+10))".
+    param_grid : dict
+        {parameter name: values}. All combinations are evaluated.
+
+    RETURNS
+    -------
+    tuple
+        (params, nums, dens): the expanded grid (see parameter_grid) and the numerator and
+        denominator coefficients as (members x coefficients) arrays, highest power first.
+    """
+    import sympy as sp
+    try:
+        if isinstance(template, (tuple, list)) and len(template) == 2:
+            num_expr, den_expr = template
+        elif isinstance(template, str) and '/' in template:
+            num_expr, den_expr = template.split('/', 1)
+        else:
+            num_expr, den_expr = template, 1
+        num_expr, den_expr = [sp.sympify(e.replace('^', '**') if isinstance(e, str) else e)
+                              for e in (num_expr, den_expr)]
+        num_expr, den_expr = sp.fraction(sp.together(num_expr / den_expr))
+        var = system_variable(num_expr, den_expr)
+        num_coeffs = sp.Poly(num_expr, var).all_coeffs()
+        den_coeffs = sp.Poly(den_expr, var).all_coeffs()
+    except Exception as e:
+        raise ValueError(f"Could not parse transfer function template: {e}") from e
+
+    param_symbols = sorted((num_expr.free_symbols | den_expr.free_symbols) - {var}, key=str)
+    missing = [str(sym) for sym in param_symbols if str(sym) not in param_grid]
+    if missing:
+        raise ValueError(f"No values given for template parameters: {', '.join(missing)}")
+
+    params = parameter_grid(param_grid)
+    n_members = len(next(iter(params.values()))) if params else 1
+    args = [params[str(sym)] for sym in param_symbols]
+
+    def evaluate_coeffs(coeffs):
+        f = sp.lambdify(param_symbols, coeffs, 'numpy')
+        return np.stack([np.broadcast_to(np.asarray(c, dtype=float), (n_members,))
+                         for c in f(*args)], axis=1)
+
+    return params, evaluate_coeffs(num_coeffs), evaluate_coeffs(den_coeffs)
+
+def evaluate_family(nums, dens, omega, dt=None):
+    """
+    Evaluates many transfer functions on one frequency grid in a single broadcast pass.
+
+    PARAMETERS
+    ----------
+    nums, dens : np.ndarray
+        (members x coefficients) arrays, highest power first. Shorter polynomials are
+        padded with leading zeros.
+    omega : array_like
+        Frequencies in rad/s.
+    dt : float | None
+        Sample time of discrete-time members, which are evaluated at z = e^(jωdt).
+
+    RETURNS
+    -------
+    np.ndarray
+        Complex responses of shape (members, len(omega)).
+    """
+    s = 1j * np.asarray(omega, dtype=float)
+    if dt is not None:
+        s = np.exp(s * dt)
+
+    def horner(coeffs):
+        result = np.zeros((coeffs.shape[0], len(s)), dtype=complex)
+        for column in coeffs.T:
+            result = result * s + column[:, None]
+        return result
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return horner(np.atleast_2d(nums)) / horner(np.atleast_2d(dens))
+
+def family_response(systems, omega):
+    """
+    Evaluates a list of systems on one frequency grid.
+
+    Transfer functions with the same sample time are padded to a common degree and
+    evaluated together with evaluate_family; state-space models are evaluated one by one.
+
+    RETURNS
+    -------
+    np.ndarray
+        Complex responses of shape (len(systems), len(omega)).
+    """
+    systems = [normalize_system(system) for system in systems]
+    responses = np.empty((len(systems), len(omega)), dtype=complex)
+    tfs = [i for i, system in enumerate(systems) if not isinstance(system, StateSpaceModel)]
+    for dt in set(systems[i].dt for i in tfs):
+        tf_idx = [i for i in tfs if systems[i].dt == dt]
+        width = max(max(len(systems[i].num), len(systems[i].den)) for i in tf_idx)
+        nums = np.array([np.pad(systems[i].num, (width - len(systems[i].num), 0)) for i in tf_idx])
+        dens = np.array([np.pad(systems[i].den, (width - len(systems[i].den), 0)) for i in tf_idx])
+        responses[tf_idx] = evaluate_family(nums, dens, omega, dt=dt)
+    for i, system in enumerate(systems):
+        if isinstance(system, StateSpaceModel):
+            responses[i] = evaluate(system, omega)
+    return responses
+
+class ResponseCache:
+    """
+    Bounded least-recently-used cache of frequency responses.
+
+    Entries are keyed by the normalized coefficients of a system plus a description
+    of the frequency grid, so building a Bode plot, a Nyquist plot and the stability
+    margins of the same loop (or the same loop in several scenes) evaluates it only once.
+    Cached responses are shared between callers, so their arrays are made read-only.
+
+    PARAMETERS
+    ----------
+    max_bytes : int
+        Memory cap of the stored arrays. The least recently used entries are
+        evicted once it is exceeded.
+    """
+    def __init__(self, max_bytes=64 * 2**20):
+        self._entries = OrderedDict()
+        self._max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.enabled = True
+
+    @property
+    def max_bytes(self):
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value):
+        self._max_bytes = value
+        self._evict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def system_key(system):
+        """Hashable key of the normalized (den[0] = 1) transfer function coefficients."""
+        tf = normalize_system(system)
+        if isinstance(tf, StateSpaceModel):
+            return tf.key
+        return (tuple(np.asarray(tf.num, dtype=float).tolist()),
+                tuple(np.asarray(tf.den, dtype=float).tolist()), tf.dt)
+
+    @staticmethod
+    def grid_key(omega):
+        """Compact hashable key of an explicit frequency grid."""
+        omega = np.ascontiguousarray(omega, dtype=float)
+        return (omega.shape, hashlib.sha1(omega.tobytes()).hexdigest())
+
+    @staticmethod
+    def _size(value):
+        if isinstance(value, FrequencyResponse):
+            # Room for the lazily computed phase arrays as well
+            return value.response.nbytes + 3 * value.omega.nbytes
+        if isinstance(value, tuple):
+            return sum(getattr(v, 'nbytes', 8) for v in value)
+        return getattr(value, 'nbytes', 8)
+
+    def get_or_compute(self, key, compute):
+        """Return the cached value for key, calling compute() and storing its result on a miss."""
+        if not self.enabled:
+            return compute()
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key][0]
+
+        self.misses += 1
+        value = compute()
+        if isinstance(value, FrequencyResponse):
+            value.omega.flags.writeable = False
+            value.response.flags.writeable = False
+        size = self._size(value)
+        if size <= self._max_bytes:
+            self._entries[key] = (value, size)
+            self.nbytes += size
+            self._evict()
+        return value
+
+    def _evict(self):
+        while self.nbytes > self._max_bytes and self._entries:
+            _, (_, size) = self._entries.popitem(last=False)
+            self.nbytes -= size
+
+    def clear(self):
+        """Drop all entries and reset the hit/miss counters."""
+        self._entries.clear()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def info(self):
+        """Return the hit/miss counters and memory usage as a dict."""
+        return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._entries),
+                'nbytes': self.nbytes, 'max_bytes': self._max_bytes}
+
+# Shared by BodePlot, Nyquist and the margin routines
+response_cache = ResponseCache()
+
+def frequency_response(system, omega):
+    """
+    Evaluates the frequency response of any supported system on a frequency grid.
+
+    Results are stored in response_cache, so repeated evaluations of the same
+    system on the same grid return the same (read-only) object.
+
+    PARAMETERS
+    ----------
+    system : various
+        Any supported system specification (see parse_system_input).
+    omega : array_like
+        Frequencies in rad/s.
+
+    RETURNS
+    -------
+    FrequencyResponse
+        Reusable response object with magnitude, phase and complex data.
+    """
+    system = normalize_system(system)
+    omega = np.array(omega, dtype=float)
+    key = ('grid', response_cache.system_key(system), response_cache.grid_key(omega))
+    return response_cache.get_or_compute(key, lambda: FrequencyResponse(system, omega))
+
+def _initial_log_grid(system, freq_range, points_per_decade):
+    """Coarse log10 grid over freq_range, seeded with the pole and zero break frequencies."""
+    lo, hi = np.log10(freq_range[0]), np.log10(freq_range[1])
+    n_initial = max(2, int(np.ceil((hi - lo) * points_per_decade)) + 1)
+    log_w = np.linspace(lo, hi, n_initial)
+
+    # Seed the grid with the break frequencies, so narrow resonances cannot fall between samples
+    breaks = np.abs(np.concatenate(s_plane_poles_zeros(system)))
+    breaks = breaks[np.isfinite(breaks) & (breaks > 10**lo) & (breaks < 10**hi)]
+    return np.unique(np.concatenate([log_w, np.log10(breaks)])), (hi - lo) / (n_initial - 1)
+
+def _refine_grid(system, log_w, needs_refinement, max_points, min_width):
+    """
+    Bisects the intervals of a log10 frequency grid until needs_refinement(g_left, g_mid, g_right)
+    is False everywhere. All active intervals are evaluated in one vectorized batch per round.
+    """
+    response = evaluate(system, 10**log_w)
+    all_log_w = [log_w]
+    all_response = [response]
+    n_points = len(log_w)
+
+    left, right = log_w[:-1], log_w[1:]
+    g_left, g_right = response[:-1], response[1:]
+    while len(left) > 0 and n_points < max_points:
+        mid = (left + right) / 2
+        g_mid = evaluate(system, 10**mid)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            refine = needs_refinement(g_left, g_mid, g_right)
+        refine &= (right - left) / 2 > min_width
+        if not np.any(refine):
+            break
+
+        # Keep only the midpoints that were needed, bounded by the point budget
+        idx = np.flatnonzero(refine)[:max_points - n_points]
+        all_log_w.append(mid[idx])
+        all_response.append(g_mid[idx])
+        n_points += len(idx)
+
+        left, right = np.concatenate([left[idx], mid[idx]]), np.concatenate([mid[idx], right[idx]])
+        g_left, g_right = np.concatenate([g_left[idx], g_mid[idx]]), np.concatenate([g_mid[idx], g_right[idx]])
+
+    log_w = np.concatenate(all_log_w)
+    response = np.concatenate(all_response)
+    order = np.argsort(log_w)
+    return FrequencyResponse(system, 10**log_w[order], response[order])
+
+def adaptive_frequency_response(system, freq_range, tol_db=0.05, tol_deg=0.5,
+                                points_per_decade=8, max_points=5000, max_depth=16):
+    """
+    Evaluates the frequency response on an adaptively refined logarithmic grid.
+
+    Starting from a coarse grid seeded with the pole and zero break frequencies,
+    every interval is bisected (in log frequency) as long as the straight line
+    between its end points misses the midpoint by more than tol_db in magnitude
+    or tol_deg in phase. Flat decades therefore keep only a few points, while
+    resonance peaks and fast phase changes are refined until they are accurate.
+
+    PARAMETERS
+    ----------
+    system : various
+        Any supported system specification (see parse_system_input).
+    freq_range : tuple[float]
+        Frequency range in rad/s as (min_freq, max_freq).
+    tol_db : float
+        Maximum interpolation error of the magnitude curve in dB.
+    tol_deg : float
+        Maximum interpolation error of the phase curve in degrees.
+    points_per_decade : int
+        Density of the initial grid.
+    max_points : int
+        Upper bound on the number of frequency points.
+    max_depth : int
+        Maximum number of bisections of an initial interval.
+
+    RETURNS
+    -------
+    FrequencyResponse
+        Response on the sorted, refined frequency grid.
+    """
+    system = normalize_system(system)
+    key = ('bode', response_cache.system_key(system), tuple(map(float, freq_range[:2])),
+           tol_db, tol_deg, points_per_decade, max_points, max_depth)
+    return response_cache.get_or_compute(key, lambda: _adaptive_frequency_response(
+        system, freq_range, tol_db, tol_deg, points_per_decade, max_points, max_depth))
+
+def _adaptive_frequency_response(system, freq_range, tol_db, tol_deg, points_per_decade, max_points, max_depth):
+    log_w, initial_width = _initial_log_grid(system, freq_range, points_per_decade)
+
+    def needs_refinement(g_left, g_mid, g_right):
+        db_left = 20 * np.log10(np.abs(g_left))
+        db_right = 20 * np.log10(np.abs(g_right))
+        db_mid = 20 * np.log10(np.abs(g_mid))
+        err_db = np.abs(db_mid - (db_left + db_right) / 2)
+        # Phase differences relative to the left end point, so no global unwrapping is needed
+        ph_mid = np.angle(g_mid / g_left, deg=True)
+        ph_right = np.angle(g_right / g_left, deg=True)
+        err_deg = np.abs(ph_mid - ph_right / 2)
+        return (err_db > tol_db) | (err_deg > tol_deg) | ~np.isfinite(err_db) | ~np.isfinite(err_deg)
+
+    return _refine_grid(system, log_w, needs_refinement, max_points, initial_width / 2**max_depth)
+
+def adaptive_nyquist_response(system, freq_range, scale=(1, 1), view=None, chord_tol=0.005,
+                              max_turn=10, points_per_decade=4, max_points=4000, max_depth=24):
+    """
+    Evaluates the frequency response on a grid adapted to the Nyquist curve as drawn on screen.
+
+    Intervals are bisected while the midpoint deviates more than chord_tol (in scene units)
+    from the chord between the end points, or while the curve turns by more than max_turn
+    degrees across the interval. Pieces of the curve that lie entirely outside the view are
+    not refined, so the number of points depends on what is visible rather than on how wide
+    the frequency range is.
+
+    PARAMETERS
+    ----------
+    system : various
+        Any supported system specification (see parse_system_input).
+    freq_range : tuple[float]
+        Frequency range in rad/s as (min_freq, max_freq).
+    scale : tuple[float]
+        Scene units per unit of the real and imaginary axis.
+    view : tuple[float] | None
+        Visible region as (x_min, x_max, y_min, y_max) in plane coordinates. If None, everything is refined.
+    chord_tol : float
+        Maximum on-screen distance between the drawn chords and the true curve.
+    max_turn : float
+        Maximum turning angle in degrees between consecutive chords.
+    points_per_decade : int
+        Density of the initial grid.
+    max_points : int
+        Upper bound on the number of frequency points.
+    max_depth : int
+        Maximum number of bisections of an initial interval.
+
+    RETURNS
+    -------
+    FrequencyResponse
+        Response on the sorted, refined frequency grid.
+    """
+    system = normalize_system(system)
+    key = ('nyquist', response_cache.system_key(system), tuple(map(float, freq_range[:2])),
+           tuple(scale), None if view is None else tuple(view), chord_tol, max_turn,
+           points_per_decade, max_points, max_depth)
+    return response_cache.get_or_compute(key, lambda: _adaptive_nyquist_response(
+        system, freq_range, scale, view, chord_tol, max_turn, points_per_decade, max_points, max_depth))
+
+def _adaptive_nyquist_response(system, freq_range, scale, view, chord_tol, max_turn,
+                               points_per_decade, max_points, max_depth):
+    log_w, initial_width = _initial_log_grid(system, freq_range, points_per_decade)
+    sx, sy = scale
+    max_turn_rad = np.deg2rad(max_turn)
+
+    if view is not None:
+        # Slightly enlarged view, so curves entering at the edges are refined as well
+        x_min, x_max, y_min, y_max = view
+        pad_x, pad_y = 0.05 * (x_max - x_min), 0.05 * (y_max - y_min)
+        x_min, x_max, y_min, y_max = x_min - pad_x, x_max + pad_x, y_min - pad_y, y_max + pad_y
+
+        def outcode(g):
+            return ((np.real(g) < x_min) * 1 | (np.real(g) > x_max) * 2
+                    | (np.imag(g) < y_min) * 4 | (np.imag(g) > y_max) * 8)
+
+    def needs_refinement(g_left, g_mid, g_right):
+        p_left = np.stack([sx * np.real(g_left), sy * np.imag(g_left)])
+        p_mid = np.stack([sx * np.real(g_mid), sy * np.imag(g_mid)])
+        p_right = np.stack([sx * np.real(g_right), sy * np.imag(g_right)])
+
+        # Distance from the midpoint to the chord between the end points
+        chord = p_right - p_left
+        chord_len = np.hypot(*chord)
+        to_mid = p_mid - p_left
+        cross = np.abs(chord[0] * to_mid[1] - chord[1] * to_mid[0])
+        chord_err = np.where(chord_len > 0, cross / np.where(chord_len > 0, chord_len, 1), np.hypot(*to_mid))
+
+        # Turning angle between the two half chords
+        d1, d2 = p_mid - p_left, p_right - p_mid
+        turn = np.abs(np.arctan2(d1[0] * d2[1] - d1[1] * d2[0], d1[0] * d2[0] + d1[1] * d2[1]))
+
+        refine = (chord_err > chord_tol) | ((turn > max_turn_rad) & (chord_len > chord_tol))
+        refine |= ~np.isfinite(chord_err)
+        if view is not None:
+            # Skip pieces that are guaranteed to be outside the same edge of the view
+            outside = outcode(g_left) & outcode(g_mid) & outcode(g_right)
+            refine &= outside == 0
+        return refine
+
+    return _refine_grid(system, log_w, needs_refinement, max_points, initial_width / 2**max_depth)
+
+
+def fft_frequency_response(system, n_points):
+    """
+    Evaluates a discrete-time system on the uniform unit-circle grid ω_k = k·ω_N/n_points,
+    k = 0..n_points, where ω_N = π/dt is the Nyquist frequency.
+
+    With N(z) = z^n·Σ b_i z^-i, the sums Σ b_i z^-i on the grid are one zero-padded real
+    FFT of the coefficients, so all points cost O(N log N) instead of a polynomial
+    evaluation per point. State-space models are evaluated directly instead.
+
+    PARAMETERS
+    ----------
+    system : various
+        Any supported discrete-time system specification (see normalize_system).
+    n_points : int
+        Number of frequency intervals between 0 and the Nyquist frequency.
+
+    RETURNS
+    -------
+    FrequencyResponse
+        Response on the n_points + 1 grid frequencies.
+    """
+    tf = normalize_system(system)
+    if tf.dt is None:
+        raise ValueError("FFT evaluation needs a discrete-time system (with a sample time dt).")
+    omega = np.arange(n_points + 1) * (np.pi / tf.dt) / n_points
+    size = 2 * n_points
+    if isinstance(tf, StateSpaceModel) or max(len(tf.num), len(tf.den)) > size:
+        return FrequencyResponse(tf, omega)
+
+    z = np.exp(1j * omega * tf.dt)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        response = (z**(len(tf.num) - len(tf.den)) * np.fft.rfft(tf.num, size) / np.fft.rfft(tf.den, size))
+    return FrequencyResponse(tf, omega, response)
+
+def discrete_frequency_response(system, freq_range, num=1000):
+    """
+    Evaluates a discrete-time system on a logarithmic grid up to the Nyquist frequency.
+
+    The upper end of freq_range is limited to the Nyquist frequency π/dt, beyond which the
+    response only repeats (folds). Where the bins of a zero-padded FFT (see
+    fft_frequency_response) are at least as dense as the logarithmic grid, the grid points
+    are snapped to the nearest bin and taken from one FFT. Only the remaining low-frequency
+    points are evaluated directly.
+
+    PARAMETERS
+    ----------
+    system : various
+        Any supported discrete-time system specification (see normalize_system).
+    freq_range : tuple[float]
+        Frequency range in rad/s as (min_freq, max_freq).
+    num : int
+        Number of points of the logarithmic grid.
+
+    RETURNS
+    -------
+    FrequencyResponse
+        Response on the sorted frequency grid.
+    """
+    tf = normalize_system(system)
+    key = ('discrete', response_cache.system_key(tf), tuple(map(float, freq_range[:2])), num)
+    return response_cache.get_or_compute(key, lambda: _discrete_frequency_response(tf, freq_range, num))
+
+def _discrete_frequency_response(tf, freq_range, num):
+    w_nyquist = np.pi / tf.dt
+    lo, hi = freq_range[0], min(freq_range[1], w_nyquist)
+    w = np.logspace(np.log10(lo), np.log10(hi), num)
+    ratio = (hi / lo)**(1 / max(num - 1, 1))
+    if ratio <= 1:
+        return FrequencyResponse(tf, w)
+
+    # FFT size such that its bins cover at least the top decade below the Nyquist frequency
+    n_fft = int(2**np.ceil(np.log2(max(10 / (ratio - 1), 16))))
+    delta = w_nyquist / n_fft
+    from_fft = w >= delta / (ratio - 1)
+    low = w[~from_fft]
+    bins = np.unique(np.round(w[from_fft] / delta).astype(int))
+    bins = bins[bins * delta > (low[-1] if len(low) else 0)]
+    if len(bins) == 0:
+        return FrequencyResponse(tf, w)
+
+    fft = fft_frequency_response(tf, n_fft)
+    omega = np.concatenate([low, fft.omega[bins]])
+    response = np.concatenate([evaluate(tf, low), fft.response[bins]])
+    return FrequencyResponse(tf, omega, response)
@@ -0,0 +1,288 @@
+import numpy as np
+
+from .freqresp import normalize_system, evaluate, response_cache, s_plane_poles_zeros
+from .statespace import StateSpaceModel
+
+# Analytic gain/phase crossover and stability margin solver
+
+def _jw_polynomial(coeffs):
+    """Real and imaginary part of P(jω) as polynomials in ω (highest power first)."""
+    coeffs = np.asarray(coeffs, dtype=float)
+    powers = np.arange(len(coeffs) - 1, -1, -1)
+    c = coeffs * (1j)**powers
+    return np.real(c), np.imag(c)
+
+def _trim(poly):
+    """Strip leading coefficients that are negligible compared to the largest one."""
+    poly = np.atleast_1d(poly)
+    scale = np.max(np.abs(poly)) if len(poly) else 0
+    if scale == 0:
+        return np.zeros(1)
+    nonzero = np.flatnonzero(np.abs(poly) > 1e-12 * scale)
+    return poly[nonzero[0]:]
+
+def _positive_real_roots(poly):
+    """Candidate positive real roots of a real polynomial."""
+    poly = _trim(poly)
+    if len(poly) < 2:
+        return np.array([])
+    roots = np.roots(poly)
+    tol = 1e-6 * np.maximum(1, np.abs(roots))
+    roots = np.real(roots[(np.abs(np.imag(roots)) <= tol) & (np.real(roots) > 0)])
+    return np.unique(roots)
+
+def _polish(f, root):
+    """Refine a root of f by bisection-safe root finding on a bracket around it, if one exists."""
+    from scipy import optimize
+    for eps in (1e-6, 1e-4, 1e-2):
+        a, b = root * (1 - eps), root * (1 + eps)
+        fa, fb = f(a), f(b)
+        if np.isfinite(fa) and np.isfinite(fb) and fa * fb < 0:
+            return optimize.brentq(f, a, b, xtol=1e-14 * root, rtol=1e-14)
+    return root
+
+def _bracketed_roots(f, freq_range, num=2000):
+    """Fallback: locate sign changes of f on a log grid and polish them."""
+    from scipy import optimize
+    w = np.logspace(np.log10(freq_range[0]), np.log10(freq_range[1]), num)
+    values = f(w)
+    idx = np.flatnonzero(np.isfinite(values[:-1]) & np.isfinite(values[1:]) & (values[:-1] * values[1:] < 0))
+    return np.array([optimize.brentq(f, w[i], w[i+1]) for i in idx])
+
+def _feature_range(system):
+    """Frequency range two decades beyond the outermost pole and zero break frequencies."""
+    breaks = np.abs(np.concatenate(s_plane_poles_zeros(system)))
+    breaks = breaks[np.isfinite(breaks) & (breaks > 0)]
+    if len(breaks) == 0:
+        return (1e-3, 1e3)
+    return (np.min(breaks) / 100, np.max(breaks) * 100)
+
+def _uses_grid_search(tf):
+    """State-space and discrete-time systems have no polynomials in ω and are searched on a grid."""
+    return isinstance(tf, StateSpaceModel) or tf.dt is not None
+
+def _search_range(tf, freq_range):
+    """Grid search range; discrete-time responses fold at the Nyquist frequency, so stop there."""
+    lo, hi = freq_range[:2] if freq_range is not None else _feature_range(tf)
+    if tf.dt is not None:
+        hi = min(hi, np.pi / tf.dt)
+        lo = min(lo, hi / 1e6)
+    return (lo, hi)
+
+def _grid_minimum(f, freq_range, num=2000):
+    """Frequency of the minimum of f on a log grid, refined by a bounded scalar search."""
+    from scipy import optimize
+    log_w = np.linspace(np.log10(freq_range[0]), np.log10(freq_range[1]), num)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        values = f(10**log_w)
+    values = np.where(np.isfinite(values), values, np.inf)
+    i = np.argmin(values)
+    lo, hi = log_w[max(i - 1, 0)], log_w[min(i + 1, num - 1)]
+    result = optimize.minimize_scalar(lambda x: f(np.array([10**x]))[0], bounds=(lo, hi),
+                                      method='bounded', options={'xatol': 1e-12})
+    best = result.x if result.fun <= values[i] else log_w[i]
+    return np.array([10**best])
+
+def _in_range(w, freq_range):
+    """Keep the frequencies that fall inside freq_range (all of them if it is None)."""
+    w = np.sort(np.asarray(w, dtype=float))
+    if freq_range is None:
+        return w
+    return w[(w >= freq_range[0]) & (w <= freq_range[1])]
+
+def gain_crossover_frequencies(system, freq_range=None):
+    """
+    Returns the exact frequencies where |G(jω)| = 1 (0 dB).
+
+    The crossovers are the positive real roots of |N(jω)|² - |D(jω)|², polished
+    on |G(jω)| - 1. If the polynomial roots cannot be computed, or the system is a
+    state-space or discrete-time model that has no polynomials in ω, sign changes
+    on a dense grid over freq_range are polished instead.
+
+    PARAMETERS
+    ----------
+    system : various
+        Any supported system specification (see freqresp.parse_system_input).
+    freq_range : tuple[float] | None
+        Only return crossovers in (min_freq, max_freq). If None, all are returned.
+
+    RETURNS
+    -------
+    np.ndarray
+        Sorted gain crossover frequencies in rad/s.
+    """
+    tf = normalize_system(system)
+
+    def f(w):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.log(np.abs(evaluate(tf, w)))
+
+    if _uses_grid_search(tf):
+        roots = _bracketed_roots(f, _search_range(tf, freq_range))
+    else:
+        nr, ni = _jw_polynomial(tf.num)
+        dr, di = _jw_polynomial(tf.den)
+        poly = np.polysub(np.polyadd(np.polymul(nr, nr), np.polymul(ni, ni)),
+                          np.polyadd(np.polymul(dr, dr), np.polymul(di, di)))
+        try:
+            roots = np.array([_polish(f, r) for r in _positive_real_roots(poly)])
+        except np.linalg.LinAlgError:
+            roots = _bracketed_roots(f, freq_range or (1e-6, 1e6))
+    # Reject spurious roots of an ill-conditioned polynomial
+    roots = roots[np.abs(f(roots)) < 1e-6] if len(roots) else roots
+    return _in_range(roots, freq_range)
+
+def phase_crossover_frequencies(system, freq_range=None):
+    """
+    Returns the exact frequencies where the phase of G(jω) crosses -180° (modulo 360°).
+
+    The crossovers are the positive real roots of Im(N(jω)·conj(D(jω))) at which
+    Re(N(jω)·conj(D(jω))) is negative, polished on Im(G(jω))/|G(jω)|. State-space
+    and discrete-time models are searched for sign changes on a dense grid instead.
+
+    PARAMETERS
+    ----------
+    system : various
+        Any supported system specification (see freqresp.parse_system_input).
+    freq_range : tuple[float] | None
+        Only return crossovers in (min_freq, max_freq). If None, all are returned.
+
+    RETURNS
+    -------
+    np.ndarray
+        Sorted phase crossover frequencies in rad/s.
+    """
+    tf = normalize_system(system)
+
+    def f(w):
+        g = evaluate(tf, w)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.imag(g) / np.abs(g)
+
+    if _uses_grid_search(tf):
+        roots = _bracketed_roots(f, _search_range(tf, freq_range))
+    else:
+        nr, ni = _jw_polynomial(tf.num)
+        dr, di = _jw_polynomial(tf.den)
+        poly = np.polysub(np.polymul(ni, dr), np.polymul(nr, di))
+        try:
+            roots = np.array([_polish(f, r) for r in _positive_real_roots(poly)])
+        except np.linalg.LinAlgError:
+            roots = _bracketed_roots(f, freq_range or (1e-6, 1e6))
+    if len(roots):
+        g = evaluate(tf, roots)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            on_negative_axis = (np.real(g) < 0) & (np.abs(np.imag(g)) <= 1e-6 * np.abs(g))
+        roots = roots[on_negative_axis]
+    return _in_range(roots, freq_range)
+
+def modulus_margin(system, freq_range=None):
+    """
+    Returns the minimum distance of G(jω) to the critical point -1 and its frequency.
+
+    The minimum of |1 + G(jω)|² = |N + D|²/|D|² is found among the stationary points
+    (real roots of the derivative numerator) and the ends of the frequency range.
+    For state-space and discrete-time models the minimum on a dense grid is refined with a bounded search.
+
+    RETURNS
+    -------
+    tuple
+        (distance, frequency). The frequency is np.inf when the minimum is reached at ω → ∞.
+    """
+    tf = normalize_system(system)
+    if _uses_grid_search(tf):
+        search_range = _search_range(tf, freq_range)
+        candidates = _grid_minimum(lambda w: np.abs(1 + evaluate(tf, w)), search_range)
+        if tf.dt is not None:
+            candidates = np.concatenate([candidates, search_range])
+    else:
+        sr, si = _jw_polynomial(np.polyadd(tf.num, tf.den))
+        dr, di = _jw_polynomial(tf.den)
+        a = np.polyadd(np.polymul(sr, sr), np.polymul(si, si))
+        b = np.polyadd(np.polymul(dr, dr), np.polymul(di, di))
+        stationary = np.polysub(np.polymul(np.polyder(a), b), np.polymul(a, np.polyder(b)))
+        try:
+            candidates = _positive_real_roots(stationary)
+        except np.linalg.LinAlgError:
+            candidates = np.array([])
+    if freq_range is not None:
+        candidates = np.concatenate([_in_range(candidates, freq_range), freq_range[:2]])
+    else:
+        candidates = np.concatenate([candidates, [np.finfo(float).tiny]])
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        distances = np.abs(1 + evaluate(tf, candidates))
+    distances = np.where(np.isfinite(distances), distances, np.inf)
+    idx = np.argmin(distances)
+    distance, w = distances[idx], candidates[idx]
+
+    if freq_range is None and tf.dt is None:
+        # Limit for ω → ∞ (1 for strictly proper systems). Improper systems have
+        # |G(jω)| → ∞ there, so the limit is no candidate for the minimum.
+        if isinstance(tf, StateSpaceModel):
+            g_inf = tf.D[0, 0]
+        else:
+            n_den = len(_trim(tf.den))
+            num = _trim(tf.num)
+            if len(num) > n_den:
+                g_inf = np.inf
+            else:
+                g_inf = num[0] / _trim(tf.den)[0] if len(num) == n_den else 0.0
+        if np.isfinite(g_inf) and abs(1 + g_inf) < distance:
+            distance, w = abs(1 + g_inf), np.inf
+    return distance, w
+
+def stability_margins(system, freq_range=None):
+    """
+    Calculates gain margin, phase margin and modulus margin from the exact crossovers.
+
+    When a system has several crossovers, the most critical margins are returned:
+    the gain margin closest to 0 dB and the phase margin closest to 0 degrees.
+
+    PARAMETERS
+    ----------
+    system : various
+        Any supported system specification (see freqresp.parse_system_input).
+    freq_range : tuple[float] | None
+        Only consider crossovers in (min_freq, max_freq). If None, all frequencies are used.
+
+    RETURNS
+    -------
+    tuple
+        (gm, pm, mm, wg, wp, wm) where:
+        - gm: gain margin (dB), np.inf if the phase never crosses -180°
+        - pm: phase margin (degrees, in (-180, 180]), np.inf if the gain never crosses 0 dB
+        - mm: modulus margin as 1/min|1 + G(jω)|
+        - wg: phase crossover frequency (where the phase crosses -180°)
+        - wp: gain crossover frequency (where the gain crosses 0 dB)
+        - wm: frequency of the modulus margin
+
+    Results are stored in freqresp.response_cache.
+    """
+    tf = normalize_system(system)
+    key = ('margins', response_cache.system_key(tf),
+           None if freq_range is None else tuple(map(float, freq_range[:2])))
+    return response_cache.get_or_compute(key, lambda: _stability_margins(tf, freq_range))
+
+def _stability_margins(tf, freq_range):
+    wgs = phase_crossover_frequencies(tf, freq_range)
+    if len(wgs):
+        gms = -20 * np.log10(np.abs(evaluate(tf, wgs)))
+        idx = np.argmin(np.abs(gms))
+        gm, wg = gms[idx], wgs[idx]
+    else:
+        gm, wg = np.inf, np.inf
+
+    wps = gain_crossover_frequencies(tf, freq_range)
+    if len(wps):
+        pms = 180 + np.angle(evaluate(tf, wps), deg=True)
+        pms = (pms + 180) % 360 - 180
+        pms[pms == -180] = 180
+        idx = np.argmin(np.abs(pms))
+        pm, wp = pms[idx], wps[idx]
+    else:
+        pm, wp = np.inf, np.inf
+
+    distance, wm = modulus_margin(tf, freq_range)
+    mm = 1 / distance if distance > 0 else np.inf
+    return gm, pm, mm, wg, wp, wm
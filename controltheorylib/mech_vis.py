@@ -22,12 +22,13 @@ def spring(start=ORIGIN, end=UP * 3, num_coils=6, coil_width=0.4, type="zigzag",
     color : Color
         Color of the spring.
     **kwargs : Any
-        Additional parameters passed to Manim's Line and VMobject constructors.
+        Stroke options of the spring (color, stroke_width, ...).
 
     RETURNS
     -------
-    VGroup
-        A Manim VGroup containing the constructed spring.
+    Spring
+        A Manim VGroup containing the constructed spring. It can be stretched between
+        new end points with set_endpoints(start, end).
     """
 
     # Validate parameters
@@ -43,6 +44,10 @@ def spring(start=ORIGIN, end=UP * 3, num_coils=6, coil_width=0.4, type="zigzag",
         warnings.warn("Invalid spring type, setting to default ('zigzag')", UserWarning)
         type = "zigzag"
 
+    return Spring(start, end, num_coils, coil_width, type, **kwargs)
+
+def _spring_vertices(start, end, num_coils, coil_width, type):
+    """Corner points of a spring shape between two points, see spring()."""
     # Convert start and end to numpy arrays
     start = np.array(start, dtype=float)
     end = np.array(end, dtype=float)
@@ -55,13 +60,6 @@ def spring(start=ORIGIN, end=UP * 3, num_coils=6, coil_width=0.4, type="zigzag",
     # Perpendicular vector
     perp_vector = np.array([-unit_dir[1], unit_dir[0], 0])
 
-    # Setup stroke kwargs early
-    stroke_kwargs = kwargs.copy()
-    if "stroke_width" in stroke_kwargs:
-        stroke_kwargs["width"] = stroke_kwargs.pop("stroke_width")
-
-    spring = VGroup()
-
     # side bits
     g_star = 0.1 # length of side bits before spring starts
     def g(L):
@@ -74,33 +72,24 @@ def spring(start=ORIGIN, end=UP * 3, num_coils=6, coil_width=0.4, type="zigzag",
         def sawtooth(x):
             return 2 * np.abs(np.mod(2 * x - 0.5, 2) - 1) - 1
 
-        num_pts = 1000
-        x = np.linspace(0, total_length, num_pts)
-
-        # Step 1: define full sawtooth
-        shifted_x = (x - gL) / (total_length - 2 * gL)
-        y = coil_width * sawtooth(num_coils * shifted_x)
-
-        # Step 2: zero ends where x < g(L) or x > L - g(L)
-        y[x < gL] = 0
-        y[x > total_length - gL] = 0
-
-        # Step 3: rotate spring
-        x_rot = x * unit_dir[0] - y * perp_vector[0]
-        y_rot = x * unit_dir[1] - y * perp_vector[1]
-
-        points = np.array([x_rot + start[0], y_rot + start[1], np.zeros(num_pts)]).T
-        # spring = VMobject().set_points_as_corners(points).set_stroke(**stroke_kwargs)
-        spring = VGroup(*[Line(points[i], points[i+1], **stroke_kwargs) for i in range(len(points)-1)])
-
-
-    elif type == 'helical':
-        stroke_kwargs = kwargs.copy()
-        if "stroke_width" in stroke_kwargs:
-            stroke_kwargs["width"] = stroke_kwargs.pop("stroke_width")
+        # Only the corners of the sawtooth are needed: it starts at 0, has its peaks at
+        # a quarter and three quarters of every coil and ends at sawtooth(num_coils)
+        coil_length = total_length - 2 * gL
+        if coil_length > 0:
+            peaks = np.arange(0.25, num_coils, 0.5)
+            u = np.concatenate([[0], peaks, [num_coils]])
+            x = np.concatenate([[0], gL + u / num_coils * coil_length, [total_length]])
+            y = np.concatenate([[0], coil_width * sawtooth(u), [0]])
+            if not np.isclose(y[-2], 0):
+                # A fractional last coil drops back to the axis at the end of the coils
+                x = np.insert(x, -1, x[-2])
+                y = np.insert(y, -1, 0)
+        else:
+            # Too short for coils, only the side bits remain
+            x, y = np.array([0, total_length]), np.zeros(2)
 
-        num_pts = 1000  # Smooth helical shape
-        coil_spacing = (total_length-2*coil_width)/num_coils
+    else:
+        num_pts = int(np.ceil(40 * (num_coils + 0.5))) + 1  # 40 points per turn for a smooth shape
         alpha = np.pi*(2*num_coils+1)/(total_length-2*coil_width)
 
         # Generate helical spring points
@@ -108,15 +97,40 @@ def spring(start=ORIGIN, end=UP * 3, num_coils=6, coil_width=0.4, type="zigzag",
         x = t+coil_width*np.cos(alpha*t-np.pi)+coil_width
         y = coil_width*np.sin(alpha*t-np.pi)
 
-        # Rotate and shift
-        x_rot = x*unit_dir[0]-y*perp_vector[0]
-        y_rot = x*unit_dir[1]-y*perp_vector[1]
+    # Rotate and shift
+    x_rot = x*unit_dir[0]-y*perp_vector[0]
+    y_rot = x*unit_dir[1]-y*perp_vector[1]
 
-        points = np.array([x_rot+start[0], y_rot+start[1], np.zeros(num_pts)]).T
-        helical_spring = VMobject().set_points_as_corners(points).set_stroke(**stroke_kwargs)
-        
-        spring.add(helical_spring)  
-    return spring
+    return np.array([x_rot+start[0], y_rot+start[1], np.zeros(len(x))]).T
+
+class Spring(VGroup):
+    """
+    Spring shape between two points, as created by spring(). The spring is a single
+    VMobject through the corners of the shape, which set_endpoints rewrites in place.
+    """
+    def __init__(self, start, end, num_coils=6, coil_width=0.4, type="zigzag", **kwargs):
+        super().__init__()
+        self.num_coils = num_coils
+        self.coil_width = coil_width
+        self.type = type
+
+        stroke_kwargs = kwargs.copy()
+        if "stroke_width" in stroke_kwargs:
+            stroke_kwargs["width"] = stroke_kwargs.pop("stroke_width")
+        # One VMobject with a corner per vertex instead of a Line per segment
+        self.add(VMobject().set_stroke(**stroke_kwargs))
+        self.set_endpoints(start, end)
+
+    def set_endpoints(self, start, end):
+        """
+        Stretches the spring between new end points. Only the points of the existing
+        VMobject are replaced, so this is cheap enough for an updater.
+        """
+        self.start = np.array(start, dtype=float)
+        self.end = np.array(end, dtype=float)
+        vertices = _spring_vertices(self.start, self.end, self.num_coils, self.coil_width, self.type)
+        self.submobjects[0].set_points_as_corners(vertices)
+        return self
 
 ############## SPRING AND DAMPER ###########
 
@@ -397,8 +411,21 @@ def damper(start=ORIGIN, end=UP*3, width=0.5, fluid_color=BLUE, **kwargs):
 
     RETURNS
     -------
-    VGroup
-        A Manim VGroup containing the damper box and damper rod.
+    Damper
+        A Manim VGroup containing the damper box and damper rod. It can be moved between
+        new end points with set_endpoints(start, end).
+    """
+    return Damper(start, end, width, fluid_color, **kwargs)
+
+def _damper_segments(start, end, width):
+    """
+    End points of the lines of a damper shape between two points, see damper().
+
+    RETURNS
+    -------
+    tuple
+        (box, rod, fluid): the (start, end) pairs of the six box lines and the two rod lines,
+        and the four corners of the fluid.
     """
     start = np.array(start, dtype=float)
     end = np.array(end, dtype=float)
@@ -429,30 +456,68 @@ def damper(start=ORIGIN, end=UP*3, width=0.5, fluid_color=BLUE, **kwargs):
     perp_vector = np.array([-unit_dir[1], unit_dir[0], 0])
 
     # Rod
-    damp_vertical_top = Line(end, end - unit_dir * (piston_length), **kwargs)
-    damp_vertical_bottom = Line(start, start + unit_dir * end_length_L, **kwargs)
-    damp_hor_top = Line(damp_vertical_top.get_end() - (perp_vector * (width / 2 - 0.02)),
-                        damp_vertical_top.get_end() + (perp_vector * (width / 2 - 0.02)), **kwargs)
+    piston = end - unit_dir * (piston_length)
+    bottom = start + unit_dir * end_length_L
+    damp_vertical_top = (end, piston)
+    damp_vertical_bottom = (start, bottom)
+    damp_hor_top = (piston - (perp_vector * (width / 2 - 0.02)),
+                    piston + (perp_vector * (width / 2 - 0.02)))
 
     # Box
-    hor_damper = Line(damp_vertical_bottom.get_end() - (perp_vector * width / 2),
-                        damp_vertical_bottom.get_end() + (perp_vector * width / 2), **kwargs)
-    right_wall = Line(hor_damper.get_start(), hor_damper.get_start() + unit_dir * box_length_L, **kwargs)
-    left_wall = Line(hor_damper.get_end(), hor_damper.get_end() + unit_dir * box_length_L, **kwargs)
-    left_closing = Line(left_wall.get_end(), left_wall.get_end() - perp_vector * (width / 2 - 0.05), **kwargs)
-    right_closing = Line(right_wall.get_end(), right_wall.get_end() + perp_vector * (width / 2 - 0.05), **kwargs)
+    hor_damper = (bottom - (perp_vector * width / 2), bottom + (perp_vector * width / 2))
+    right_wall = (hor_damper[0], hor_damper[0] + unit_dir * box_length_L)
+    left_wall = (hor_damper[1], hor_damper[1] + unit_dir * box_length_L)
+    left_closing = (left_wall[1], left_wall[1] - perp_vector * (width / 2 - 0.05))
+    right_closing = (right_wall[1], right_wall[1] + perp_vector * (width / 2 - 0.05))
 
     # Fluid
-    fluid_corners = [
-        hor_damper.get_start(),
-        hor_damper.get_end(),
-        left_wall.get_end(),
-        right_wall.get_end(),
-    ]
-    fluid_fill = Polygon(*fluid_corners, fill_color=fluid_color, fill_opacity=0.4, stroke_width=0)
-
-    damper_box = VGroup(hor_damper, left_wall, right_wall,
-                        damp_vertical_bottom, left_closing, right_closing, fluid_fill)
-    damper_rod = VGroup(damp_vertical_top, damp_hor_top)
-
-    return VGroup(damper_box, damper_rod)   
\ No newline at end of file
+    fluid_corners = [hor_damper[0], hor_damper[1], left_wall[1], right_wall[1]]
+
+    box = [hor_damper, left_wall, right_wall, damp_vertical_bottom, left_closing, right_closing]
+    rod = [damp_vertical_top, damp_hor_top]
+    return box, rod, fluid_corners
+
+class Damper(VGroup):
+    """
+    Damper shape between two points, as created by damper(): a VGroup of the damper box
+    (including the fluid) and the damper rod, so box, rod = damper(...) unpacks it.
+    set_endpoints moves both parts by rewriting the points of their lines in place.
+    """
+    def __init__(self, start, end, width=0.5, fluid_color=BLUE, **kwargs):
+        super().__init__()
+        self.width = width
+        self.start = np.array(start, dtype=float)
+        self.end = np.array(end, dtype=float)
+        box, rod, fluid_corners = _damper_segments(self.start, self.end, width)
+
+        fluid_fill = Polygon(*fluid_corners, fill_color=fluid_color, fill_opacity=0.4, stroke_width=0)
+        self.damper_box = VGroup(*[Line(a, b, **kwargs) for a, b in box], fluid_fill)
+        self.damper_rod = VGroup(*[Line(a, b, **kwargs) for a, b in rod])
+        self.add(self.damper_box, self.damper_rod)
+
+    def set_endpoints(self, start, end, rod_only=False):
+        """
+        Moves the damper between new end points. Only the points of the existing lines
+        and the fluid are replaced, so this is cheap enough for an updater.
+
+        PARAMETERS
+        ----------
+        start : np.ndarray | Sequence[float]
+            The new start point of the damper.
+        end : np.ndarray | Sequence[float]
+            The new end point of the damper.
+        rod_only : bool
+            If True, only the rod is moved and the box keeps its current shape, as for a
+            damper whose casing stays in place (default: False).
+        """
+        self.start = np.array(start, dtype=float)
+        self.end = np.array(end, dtype=float)
+        box, rod, fluid_corners = _damper_segments(self.start, self.end, self.width)
+        for line, (a, b) in zip(self.damper_rod.submobjects, rod):
+            line.set_points_as_corners([a, b])
+        if not rod_only:
+            *box_lines, fluid_fill = self.damper_box.submobjects
+            for line, (a, b) in zip(box_lines, box):
+                line.set_points_as_corners([a, b])
+            fluid_fill.set_points_as_corners([*fluid_corners, fluid_corners[0]])
+        return self
@@ -1,14 +1,11 @@
 from manim import *
 import numpy as np
 import warnings
-from scipy import signal
-import sympy as sp
-from collections import OrderedDict
-from manim import TexTemplate
-from scipy.interpolate import interp1d 
-
-my_template = TexTemplate()
-my_template.add_to_preamble(r"\usepackage{amsmath}")  # Add required packages
+from .freqresp import FrequencyResponse, normalize_system, adaptive_nyquist_response, s_plane_poles_zeros
+from .analysis import is_proper, is_strictly_proper, nyquist_ranges, nyquist_response
+from .margins import stability_margins
+from .ticklabels import number_label
+from .curves import axes_transform, clipped_points, edge_ticks, line_set, resolve_tolerance, to_scene
 
 # ========================Nyquist=================
 #Nyquist plot class
@@ -16,12 +13,14 @@ class Nyquist(VGroup):
     def __init__(self, system, freq_range=None, x_range=None, y_range=None, 
                  color=BLUE, stroke_width=2, axis_dashed=True, y_axis_label="\\mathrm{Im}", x_axis_label="\\mathrm{Re}",
                  font_size_labels=20, show_unit_circle=False, unit_circle_dashed=False, circle_color= RED,show_minus_one_label=False,show_minus_one_marker=True,
-                  show_positive_freq=True, show_negative_freq=True, y_length=6, x_length=9, **kwargs):
+                  show_positive_freq=True, show_negative_freq=True, y_length=6, x_length=9,
+                  sampling="uniform", chord_tol=0.005, max_turn=10, dt=None, simplify_tol=None, **kwargs):
         """
         Generates a Nyquist plot visualization as a Manim VGroup
 
         The Nyquist plot displays the frequency response of a system in the complex plane by plotting
-        the real and imaginary parts of the transfer function evaluated along the imaginary axis (s = jω).
+        the real and imaginary parts of the transfer function evaluated along the imaginary axis (s = jω),
+        or along the unit circle (z = e^(jωdt)) for discrete-time systems.
         This visualization includes critical stability analysis features like the (-1,0) point,
         gain/phase margins, and optional unit circle reference.
 
@@ -30,7 +29,7 @@ class Nyquist(VGroup):
         system : various
             System representation, which can be one of:
             - scipy.signal.lti or transfer function coefficients (list/tuple of arrays)
-            - Symbolic expressions for numerator/denominator (using 's' as variable)
+            - Symbolic expressions for numerator/denominator (using 's' as variable, or 'z' for discrete time)
             - Tuple of (numerator_expr, denominator_expr) as strings or sympy expressions
         freq_range : tuple[float] | None
             Frequency range in rad/s as (min_freq, max_freq). If None, automatically determined.
@@ -68,6 +67,22 @@ class Nyquist(VGroup):
             The vertical length of the plot in Manim units
         x_length : float
             The horizonatal length of the plot in Manim units
+        sampling : str
+            Frequency sampling of the curve: "uniform" (10000 logspaced points, default) or "adaptive",
+            which places points by on-screen arc length and turning angle of the visible curve.
+        chord_tol : float
+            Maximum on-screen chord error in Manim units for adaptive sampling (default: 0.005).
+        max_turn : float
+            Maximum turning angle in degrees between consecutive chords for adaptive sampling (default: 10).
+        dt : float | None
+            Sample time of a discrete-time system. The curve then runs from ω = 0 to the Nyquist
+            frequency π/dt, beyond which the response folds. Expressions in z without a dt use
+            dt = 1 (default: None, continuous time unless the system has its own dt).
+        simplify_tol : float | str | None
+            Removes curve corners that lie within this distance (in Manim units) of the
+            simplified curve before drawing (Ramer-Douglas-Peucker), which makes every frame
+            cheaper to render. "pixel" uses half a pixel at the current render resolution
+            (default: None, every sample is drawn).
         **kwargs : Any
             Additional keyword arguments passed to the VGroup constructor.
 
@@ -83,8 +98,15 @@ class Nyquist(VGroup):
             - Stability margin indicators (via show_margins() method)
         """
         super().__init__(**kwargs)
-        self.system = self._parse_system_input(system)
-        self.system = self._ensure_tf(self.system)
+        self.system = normalize_system(system, dt=dt)
+        self.dt = self.system.dt
+        if sampling not in ["uniform", "adaptive"]:
+            warnings.warn("Invalid sampling, setting to default ('uniform')", UserWarning)
+            sampling = "uniform"
+        self.sampling = sampling
+        self.chord_tol = chord_tol
+        self.simplify_tol = resolve_tolerance(simplify_tol)
+        self.max_turn = max_turn
         self._show_grid = False  # Grid off by default
         self.plotcolor = color
         self.plot_stroke_width = stroke_width
@@ -109,10 +131,7 @@ class Nyquist(VGroup):
         self.grid_lines = VGroup()
         self.unit_circle = VGroup()
 
-        auto_ranges = self._auto_determine_ranges()
-        self.freq_range = freq_range if freq_range is not None else auto_ranges['freq_range']
-        self.x_range = x_range if x_range is not None else auto_ranges['x_range']
-        self.y_range = y_range if y_range is not None else auto_ranges['y_range']
+        self._set_ranges(self._auto_determine_ranges(), freq_range, x_range, y_range)
         
         self._title = None
         self._use_math_tex = False
@@ -120,15 +139,6 @@ class Nyquist(VGroup):
 
         self.y_axis_label = y_axis_label
         self.x_axis_label = x_axis_label
-
-        self.x_min, self.x_max = self._validate_range(self.x_range)
-        self.y_min, self.y_max = self._validate_range(self.y_range)
-
-        self.x_span = self.x_max - self.x_min
-        self.y_span = self.y_max - self.y_min
-
-        self.x_step = self._calculate_step(self.x_span)
-        self.y_step = self._calculate_step(self.y_span)
         
         # Create all components
         self._create_axes()
@@ -149,58 +159,140 @@ class Nyquist(VGroup):
         else:
             return 10
 
-    def _parse_system_input(self, system):
-        """Parse different input formats for the system specification."""
-        # Directly pass through valid scipy LTI system objects or coefficient lists
-        if isinstance(system, (signal.TransferFunction, signal.ZerosPolesGain, signal.StateSpace)):
-            return system
+    def _set_ranges(self, auto_ranges, freq_range=None, x_range=None, y_range=None):
+        """Set the frequency and axis ranges, using the automatic ranges where none is given."""
+        self.freq_range = freq_range if freq_range is not None else auto_ranges['freq_range']
+        if self.dt is not None and self.freq_range[1] > np.pi / self.dt:
+            warnings.warn("freq_range extends beyond the Nyquist frequency pi/dt, where the "
+                          "response of a discrete-time system folds. Limiting it to pi/dt.", UserWarning)
+            self.freq_range = (self.freq_range[0], np.pi / self.dt)
+        self.x_range = x_range if x_range is not None else auto_ranges['x_range']
+        self.y_range = y_range if y_range is not None else auto_ranges['y_range']
 
-        # Tuple: could be symbolic or coefficient list
-        if isinstance(system, tuple) and len(system) == 2:
-            num, den = system
+        self.x_min, self.x_max = self._validate_range(self.x_range)
+        self.y_min, self.y_max = self._validate_range(self.y_range)
 
-            # If any part is symbolic or a string, convert
-            if isinstance(num, (str, sp.Basic)) or isinstance(den, (str, sp.Basic)):
-                return self._symbolic_to_coefficients(num, den)
-            else:
-                return (num, den)  # Already numeric
+        self.x_span = self.x_max - self.x_min
+        self.y_span = self.y_max - self.y_min
 
-        # Handle string-based symbolic transfer functions (e.g., "s+1 / (s^2+2*s+1)")
-        if isinstance(system, str):
-            if '/' in system:
-                num_str, den_str = system.split('/', 1)
-                return self._symbolic_to_coefficients(num_str.strip(), den_str.strip())
-            else:
-                return self._symbolic_to_coefficients(system.strip(), "1")
+        self.x_step = self._calculate_step(self.x_span)
+        self.y_step = self._calculate_step(self.y_span)
 
-        raise ValueError("Invalid system specification.")
+    def update_system(self, system, keep_ranges=True, animate=True, **kwargs):
+        """
+        Replaces the plotted system, reusing the plane, ticks, labels and grid of the plot.
 
-    def _symbolic_to_coefficients(self, num_expr, den_expr):
-        """Convert symbolic expressions to polynomial coefficients."""
-        s = sp.symbols('s')
-        try:
-            # Convert strings to sympy expressions
-            if isinstance(num_expr, str):
-                num_expr = sp.sympify(num_expr.replace('^', '**'))
-            if isinstance(den_expr, str):
-                den_expr = sp.sympify(den_expr.replace('^', '**'))
+        The Nyquist curve keeps its identity, so it can be animated directly instead of
+        transforming into the curve of a second Nyquist plot.
 
-            num_poly = sp.Poly(num_expr, s)
-            den_poly = sp.Poly(den_expr, s)
+        PARAMETERS
+        ----------
+        system : various
+            The new system, in any format accepted by Nyquist. A continuous-time system
+            gets the sample time of the plot if the plot is discrete-time.
+        keep_ranges : bool
+            If true, the new response is evaluated on the current frequency range and drawn
+            on the current plane (default). Otherwise the ranges are determined again for the
+            new system and the plane, ticks and labels are rebuilt; only the curve is animated.
+        animate : bool
+            If true, an animation transforming the current curve into the new one is
+            returned (default). Otherwise the curve is updated right away.
+        **kwargs : Any
+            Arguments passed to the Transform animation (run_time, rate_func, ...).
+
+        RETURNS
+        -------
+        Animation | Nyquist
+            The animation of the curve if animate is true, otherwise the Nyquist plot itself.
+            Margins and critical points shown before are not updated, and are removed
+            if the ranges are determined again.
+        """
+        self.system = normalize_system(system, dt=self.dt)
+        self.dt = self.system.dt
+
+        old_plot = self.nyquist_plot
+        if keep_ranges:
+            # The range response is not reused
+            self._count_poles_at_zero()
+            self._range_response = None
+            self._calculate_nyquist_data()
+            self._plot_nyquist_response()
+            new_plot = self.nyquist_plot
+            self.remove(new_plot)
+        else:
+            self._set_ranges(self._auto_determine_ranges())
+            center = self.plane.get_center()
+            self.remove(*self.submobjects)
+            self._create_axes()
+            self.shift(center - self.plane.get_center())
+            self._calculate_nyquist_data()
+            self._plot_nyquist_response()
+            self._add_plot_components()
+            # Put the existing curve object in the place of the new one
+            new_plot = self.nyquist_plot
+            self.submobjects[self.submobjects.index(new_plot)] = old_plot
+        self.nyquist_plot = old_plot
+
+        if animate:
+            return Transform(old_plot, new_plot, **kwargs)
+        old_plot.become(new_plot)
+        return self
 
-            num_coeffs = [float(c) for c in num_poly.all_coeffs()]
-            den_coeffs = [float(c) for c in den_poly.all_coeffs()]
+    def _count_poles_at_zero(self):
+        """Count the integrators of the system, which move the direction arrows."""
+        poles = s_plane_poles_zeros(self.system)[0]
+        self.num_poles_at_zero = int(np.sum(np.isclose(poles, 0)))
+
+    @classmethod
+    def live(cls, system_func, tracker, **kwargs):
+        """
+        Creates a Nyquist plot of a parameterized system that follows a ValueTracker.
+
+        Unlike rebuilding the whole plot with always_redraw, the updater of a live plot only
+        evaluates the new system on the fixed frequency grid of the plot and rewrites the
+        points of the existing curve and arrow tips. The plane, ticks and labels are built once.
+
+        PARAMETERS
+        ----------
+        system_func : callable
+            Function of the parameter value returning the system, in any format accepted
+            by Nyquist, e.g. lambda K: ([K], [1, 2, 1]). Coefficient input is evaluated
+            fastest, since expressions are parsed again for every new value.
+        tracker : ValueTracker
+            The tracker holding the parameter value (a gain K, a damping ratio, ...).
+        **kwargs : Any
+            Any other Nyquist argument (freq_range, x_range, y_range, color, ...). The
+            ranges are determined for the initial value if they are not given.
+
+        RETURNS
+        -------
+        Nyquist
+            A Nyquist plot with an updater. Margins and critical points are not updated;
+            remove the updater with clear_updaters() to freeze the plot.
+        """
+        plot = cls(system_func(tracker.get_value()), **kwargs)
+        plot._live_func = system_func
+        plot._live_value = tracker.get_value()
+        plot.add_updater(lambda mob: mob.set_parameter(tracker.get_value()))
+        return plot
+
+    def set_parameter(self, value):
+        """
+        Updates a live Nyquist plot (see Nyquist.live) to a new parameter value by evaluating
+        the system on the current frequency grid and rewriting the curve in place.
+        Nothing is done if the value did not change.
+        """
+        if value == self._live_value:
+            return self
+        self._live_value = value
+        self.system = normalize_system(self._live_func(value), dt=self.dt)
+        self._count_poles_at_zero()
+        # Every frame has a new system, so the response cache is bypassed
+        self.freq_response = FrequencyResponse(self.system, self.frequencies)
+        self._store_nyquist_data()
+        self._draw_nyquist_curve()
+        return self
 
-            return (num_coeffs, den_coeffs)
-        except Exception as e:
-            raise ValueError(f"Could not parse transfer function: {e}") from e
-        
-    def _ensure_tf(self, system):
-        """Convert system to TransferFunction if needed"""
-        if isinstance(system, signal.TransferFunction):
-            return system
-        return signal.TransferFunction(*system) 
-    
     def grid_on(self):
         """Turn on the grid lines."""
         self._show_grid = True
@@ -214,308 +306,77 @@ class Nyquist(VGroup):
         return self
 
     def _update_grid_visibility(self):
-        """Update grid visibility based on current setting"""
-        opacity = 0.7 if self._show_grid else 0
-        if hasattr(self, 'grid_lines'):
-            self.grid_lines.set_opacity(opacity)
-        if hasattr(self, 'unit_circle'):
-            self.unit_circle.set_opacity(opacity if self.show_unit_circle else 0)
+        """Build the grid on first use, and keep it out of the mobject tree while hidden"""
+        if not self._show_grid:
+            self.axes_components.remove(self.grid_lines)
+            self.unit_circle.set_opacity(0)
+            return
+        if len(self.grid_lines) == 0:
+            self._create_grid_lines()
+        self.grid_lines.set_opacity(0.7)
+        if self.grid_lines not in self.axes_components:
+            self.axes_components.add_to_back(self.grid_lines)
+        self.unit_circle.set_opacity(0.7 if self.show_unit_circle else 0)
+
+    def _create_grid_lines(self):
+        """Create the dashed radial grid lines of constant phase."""
+        x_min, x_max = self.plane.x_range[:2]
+        y_min, y_max = self.plane.y_range[:2]
+
+        # Radial lines (constant phase)
+        plane_origin_point = self.plane.number_to_point(0)
+        phase_angles = np.linspace(0, 2 * np.pi, 12, endpoint=False)  # Every 30 degrees
+        x_bounds = (x_min, x_max)
+        y_bounds = (y_min, y_max)
+
+        for angle in phase_angles:
+            # Direction vector
+            dx = np.cos(angle)
+            dy = np.sin(angle)
+            tx = float('inf') if dx == 0 else max(
+                (x_bounds[0] / dx) if dx < 0 else (x_bounds[1] / dx), 0
+            )
+            ty = float('inf') if dy == 0 else max(
+                (y_bounds[0] / dy) if dy < 0 else (y_bounds[1] / dy), 0
+            )
+            # Smallest positive scale to stay within bounds
+            scale = min(tx, ty)
+            # End point in complex plane
+            end_plane_point = scale * (dx + 1j * dy)
+            end_scene_point = self.plane.number_to_point(end_plane_point)
+            radial_line = Line(
+                plane_origin_point,
+                end_scene_point,
+                color=BLUE,
+                stroke_width=0.7,
+                stroke_opacity=1,
+            )
+            desired_dash_length = 0.4
+            line_length = radial_line.get_length()
+            num_dashes = max(1, int(line_length / desired_dash_length))
+            dashed_radial_line = DashedVMobject(
+                radial_line, num_dashes=num_dashes,
+                dashed_ratio=0.5
+            )
+            self.grid_lines.add(dashed_radial_line)
 
     def _is_proper(self, system=None):
         """Check if the system is proper (numerator degree ≤ denominator degree)."""
-        if system is None:
-            system = self.system
-        
-        if not isinstance(system, signal.TransferFunction):
-            system = signal.TransferFunction(*system)
-        
-        num_degree = len(system.num) - 1  # Degree of numerator
-        den_degree = len(system.den) - 1  # Degree of denominator
-        
-        return num_degree <= den_degree
+        return is_proper(self.system if system is None else system)
 
     def _is_strictly_proper(self):
         """Check if strictly proper (numerator degree < denominator degree)."""
-        num_degree = len(self.system.num) - 1
-        den_degree = len(self.system.den) - 1
-        return num_degree < den_degree
+        return is_strictly_proper(self.system)
 
     def _auto_determine_ranges(self):
-        """Safely determine plot ranges with comprehensive error handling."""
-        
-        try:
-            # Get system representation
-            if not isinstance(self.system, signal.TransferFunction):
-                self.system = signal.TransferFunction(*self.system)
+        """Determine the plot ranges with the headless analysis (see analysis.nyquist_ranges)."""
+        ranges = nyquist_ranges(self.system)
+        # The range finding evaluation is reused for the uniformly sampled curve
+        self._range_response = ranges['response']
+        self.num_poles_at_zero = ranges['num_poles_at_zero']
+        self.is_pure_integrator = ranges['is_pure_integrator']
+        return ranges
 
-            poles = self.system.poles
-            zeros = self.system.zeros
-            
-            # Initialize range variables with defaults
-            min_freq, max_freq = 0.1, 100
-            x_min, x_max = -10, 10
-            y_min, y_max = -10, 10
-            re_min, re_max = x_min, x_max 
-            im_min, im_max = y_min, y_max 
-
-            # Handle special cases
-            if not poles.size and not zeros.size:
-                return {
-                    'freq_range': (0.1, 100),
-                    'x_range': (-10, 10),
-                    'y_range': (-10, 10)
-                }
-
-            # Calculate frequency range
-            finite_features = np.abs(np.concatenate([
-                poles[np.isfinite(poles) & (poles != 0)],
-                zeros[np.isfinite(zeros) & (zeros != 0)]
-            ]))
-            
-            if finite_features.size > 0:
-                with np.errstate(divide='ignore'):
-                    min_freq = 10**(np.floor(np.log10(np.min(finite_features))) - 2)
-                    max_freq = 10**(np.ceil(np.log10(np.max(finite_features))) + 2)
-            else:
-                min_freq, max_freq = 0.1, 100
-
-            # Handle integrators/differentiators
-            if any(np.isclose(poles, 0, atol=1e-6)):
-                min_freq = min(0.001, min_freq)
-            if any(np.isclose(zeros, 0)):
-                max_freq = max(1000, max_freq)
-
-            self.num_poles_at_zero = np.sum(np.isclose(poles,0))
-            self.is_pure_integrator = (len(poles) == 1 and np.isclose(poles[0], 0) 
-                                  and len(zeros) == 0)
-
-            # Calculate Nyquist response
-            w = np.logspace(
-                np.log10(max(min_freq, 1e-10)), 
-                np.log10(max_freq), 
-                10000
-            )
-            _, response = signal.freqresp(self.system, w)
-            re, im = np.real(response), np.imag(response)
-            
-            if self.num_poles_at_zero>0:
-                magnitudes = np.abs(response)
-                if len(magnitudes) > 1:
-                    log_magnitudes = np.log(magnitudes + 1e-12)  # Avoid log(0)
-                    log_w = np.log(w + 1e-12)
-                    
-                    with np.errstate(divide='ignore', invalid='ignore'):
-                        growth_rate = np.diff(log_magnitudes)/np.diff(log_w)
-                    growth_rate = np.nan_to_num(growth_rate, nan=0, posinf=1e6, neginf=-1e6)
-                    
-                    # Parameters for sustained divergence detection
-                    negative_threshold = -0.5  # negative since magnitude increases as frequency decreases
-                    min_consecutive_points = 4000  #4000 Number of consecutive points below threshold 
-                    
-                    below_threshold = growth_rate < negative_threshold
-                    # Use convolution to find consecutive points below the negative threshold
-                    convolved_divergence = np.convolve(
-                        below_threshold,
-                        np.ones(min_consecutive_points),
-                        mode='valid' 
-                    )
-                    # Find the indices in the convolved result where the condition is met
-                    divergent_start_in_convolved = np.where(convolved_divergence >= min_consecutive_points)[0]
-                    if len(divergent_start_in_convolved) > 0:
-                        end_of_divergence_in_growth_rate = divergent_start_in_convolved[0] + min_consecutive_points - 1
-                        truncate_start_idx = end_of_divergence_in_growth_rate + 1 # Truncate from this index onwards
-
-                    re_truncated = re[truncate_start_idx:]
-                    im_truncated = im[truncate_start_idx:]
-                    
-                    # Ensure arrays are not empty after truncation
-                    if len(re_truncated) > 0:
-                        re_min, re_max = np.min(re_truncated), np.max(re_truncated)
-                        im_min, im_max = np.min(im_truncated), np.max(im_truncated)
-                
-                        if self.is_pure_integrator:
-                            re_min, re_max = -2, 10
-                            im_min, im_max = -10, 10
-                    else:
-                        re_min, re_max = (-1.5, 0.5) if self.is_pure_integrator else (-10, 10)
-                        im_min, im_max = (-1, 1) if self.is_pure_integrator else (-10, 10)
-                
-                x_min = re_min 
-                x_max = re_max 
-                max_abs_im = max(abs(im_min), abs(im_max))
-                y_min = -max_abs_im 
-                y_max = max_abs_im
-
-            if (self._is_proper() or self._is_strictly_proper) and self.num_poles_at_zero==0:
-
-                if not any(np.isclose(poles, 0)):  
-                    w_extended = np.logspace(
-                        np.log10(min_freq), 
-                        np.log10(max_freq * 10),  
-                        10000)
-                    _, response_ext = signal.freqresp(self.system, w_extended)
-                    re = np.concatenate([re, np.real(response_ext)])
-                    im = np.concatenate([im, np.imag(response_ext)])
-
-                    # Axis ranges with adaptive padding
-                    re_min, re_max = np.min(re), np.max(re)
-                    im_min, im_max = np.min(im), np.max(im)
-                    
-
-                    padding = 0.01 if self._is_proper() else 0.05
-                    
-                    x_min = re_min 
-                    x_max = re_max 
-                    max_abs_im = max(abs(im_min), abs(im_max))
-                    y_min = -max_abs_im 
-                    y_max = max_abs_im
-
-                    # Ensure the origin is visible for proper systems (critical for Nyquist criterion)
-            if (self._is_proper() or self._is_strictly_proper()) and self.num_poles_at_zero==0:
-
-                max_abs_real_deviation = max(abs(re_min), abs(re_max))
-                max_abs_im_deviation = max(abs(im_min), abs(im_max))
-
-                min_real_range_extent = max_abs_real_deviation * 0.15 # e.g., 15% of max real deviation
-                min_im_range_extent = max_abs_im_deviation * 0.15 # e.g., 15% of max imaginary deviation
-                
-                x_min = min(x_min, -min_real_range_extent)
-                x_max = max(x_max, min_real_range_extent)
-                y_min = min(y_min, -min_im_range_extent)
-                y_max = max(y_max, min_im_range_extent)
-                
-                x_padding = (x_max - x_min) * padding
-                y_padding = (y_max - y_min) * padding
-
-                x_min -= x_padding
-                x_max += x_padding
-                y_min -= y_padding
-                y_max += y_padding
-
-            if (not self._is_proper() and not self._is_strictly_proper()) and self.num_poles_at_zero==0:
-                # Detect sustained divergence for improper systems
-                magnitudes = np.abs(response)
-                if len(magnitudes) > 1:
-                    log_magnitudes = np.log(magnitudes + 1e-12)  # Avoid log(0)
-                    log_w = np.log(w + 1e-12)
-                    
-                    with np.errstate(divide='ignore', invalid='ignore'):
-                        growth_rate = np.diff(log_magnitudes)/np.diff(log_w)
-                    growth_rate = np.nan_to_num(growth_rate, nan=0, posinf=1e6, neginf=-1e6)
-                    
-                    # Parameters for sustained divergence detection
-                    threshold = 0.5  # Growth rate threshold 0.5
-                    min_consecutive_points = 1000  # 1000Number of consecutive points above threshold 100
-                    
-                    # Find regions of sustained growth
-                    above_threshold = growth_rate > threshold
-                    divergent_regions = np.where(np.convolve(
-                        above_threshold, 
-                        np.ones(min_consecutive_points), 
-                        mode='full'
-                    ) >= min_consecutive_points)[0]
-                    
-                    if len(divergent_regions) > 0:
-                        first_divergent_idx = divergent_regions[0]
-                        
-                        # Only truncate if the divergence is significant
-                        if (log_w[-1] - log_w[first_divergent_idx]) > 1.0:  # At least 1 decade of sustained growth
-                            re = re[:first_divergent_idx+1]
-                            im = im[:first_divergent_idx+1]
-                
-                # Calculate ranges based on response
-                re_min, re_max = np.min(re), np.max(re)
-                im_min, im_max = np.min(im), np.max(im)
-                
-                # Add padding only if not diverging
-                if len(magnitudes) == len(re):  # If we didn't truncate
-                    padding = 0
-                    x_padding = (re_max - re_min) * padding
-                    y_padding = (im_max - im_min) * padding
-                else:
-                    padding = 0  # Smaller padding for truncated responses
-                
-                x_min = re_min 
-                x_max = re_max 
-                max_abs_im = max(abs(im_min), abs(im_max))
-                y_min = -max_abs_im 
-                y_max = max_abs_im
-
-            # Calculate total span
-            self.x_span = abs(x_max-x_min)
-            self.y_span = abs(y_max-y_min)
-
-            # Based on the span, round off to nearest integer x
-            # Round off to 0.5
-            if self.x_span <= 2:
-                x_min=np.floor(x_min/0.5)*0.5
-                x_max=np.ceil(x_max/0.5)*0.5
-            if self.y_span <= 2:
-                y_min=np.floor(y_min/0.5)*0.5
-                y_max=np.ceil(y_max/0.5)*0.5
-
-            if 2<self.x_span < 4:
-                x_min=np.floor(x_min)
-                x_max=np.ceil(x_max)
-            if self.y_span < 4:
-                y_min=np.floor(y_min)
-                y_max=np.ceil(y_max)
-
-            # Round off to 1
-            if 4<= self.x_span <= 10:
-                x_min=np.floor(x_min/2)*2
-                x_max=np.ceil(x_max/2)*2
-            if 4 <= self.y_span <= 10:
-                y_min=np.floor(y_min/2)*2
-                y_max=np.ceil(y_max/2)*2
-
-            # Round off to 2
-            if 10< self.x_span <= 20:
-                x_min=np.floor(x_min/5)*5
-                x_max=np.ceil(x_max/5)*5
-            if 10 <= self.y_span <= 20:
-                y_min=np.floor(y_min/5)*5
-                y_max=np.ceil(y_max/5)*5
-
-            # Round off to 5 
-            if 20<self.x_span <=50:
-                x_min=np.floor(x_min/10)*10
-                x_max=np.ceil(x_max/10)*10
-            if 20<self.y_span <=50:
-                y_min=np.floor(y_min/10)*10
-                y_max=np.ceil(y_max/10)*10
-
-            # Round off to 10 
-            if self.x_span > 50:
-                x_min=np.floor(x_min/20)*20
-                x_max=np.ceil(x_max/20)*20
-            if self.y_span > 50:
-                y_min=np.floor(y_min/20)*20
-                y_max=np.ceil(y_max/20)*20
-            
-            if np.isclose(x_min, 0):
-                x_min = 0.0
-            if np.isclose(x_max, 0):
-                x_max = 0.0
-            if np.isclose(y_min, 0):
-                y_min = 0.0
-            if np.isclose(y_max, 0):
-                y_max = 0.0
-
-            return {
-                'freq_range': (float(min_freq), float(max_freq)),
-                'x_range': (float(x_min), float(x_max)),
-                'y_range': (float(y_min), float(y_max))
-                    }
-
-        except Exception as e:
-                    print(f"Range determination error: {e}")
-                    return {
-                        'freq_range': (0.1, 100),
-                        'x_range': (-10, 10),
-                        'y_range': (-10, 10)
-                    }
-        
     def _validate_range(self, range_tuple):
         """Ensure numerical stability in axis ranges."""
         min_val, max_val = range_tuple
@@ -608,87 +469,20 @@ class Nyquist(VGroup):
         else:
             self.unit_circle = VGroup()
         
-        # --- Create Grid Lines ---
-        corner_magnitudes = [
-        np.linalg.norm([x_min, y_min]),
-        np.linalg.norm([x_max, y_min]),
-        np.linalg.norm([x_min, y_max]),
-        np.linalg.norm([x_max, y_max]),
-        ]
-        max_magnitude_visible = max(corner_magnitudes)
-        db_levels = np.array([-10, -6, -4, -2, 0, 2, 4, 6, 10])
-
-        # Convert dB to magnitude: mag = 10^(dB / 20)
-        magnitude_radii = 10 ** (db_levels / 20)
-
-        # Keep only radii that are visible in current axes
-        visible_radii = [r for r in magnitude_radii if r <= max_magnitude_visible * 1.1]
-
-        # Create grid lines
+        # Only the axes are drawn from the plane; its (invisible) background lines are
+        # kept out of the mobject tree, and the grid is built on the first grid_on()
+        self.plane.remove(self.plane.background_lines, self.plane.faded_lines)
         self.grid_lines = VGroup()
 
-        for r, db in zip(magnitude_radii, db_levels):
-            if r > max_magnitude_visible * 1.1:
-                continue
-
-            circle = ParametricFunction(
-                lambda t, r=r: self.plane.number_to_point(r * np.exp(1j * t)),
-                t_range=[0, 2 * np.pi]
-            )
-            #self.grid_lines.add(circle)
-
-            # Optional: add a dB label on the circle (on the positive real axis)
-            label_point = self.plane.number_to_point(r + 0j)
-            db_label = MathTex(f"{db}\\,\\text{{dB}}", font_size=24).move_to(label_point + RIGHT * 0.2)
-            #self.grid_lines.add(db_label)
-
-        # 5. Radial lines (constant phase)
-        plane_origin_point = self.plane.number_to_point(0)
-        phase_angles = np.linspace(0, 2 * np.pi, 12, endpoint=False)  # Every 30 degrees
-        x_bounds = (x_min, x_max)
-        y_bounds = (y_min, y_max)
-
-        for angle in phase_angles:
-            # Direction vector
-            dx = np.cos(angle)
-            dy = np.sin(angle)
-            tx = float('inf') if dx == 0 else max(
-                (x_bounds[0] / dx) if dx < 0 else (x_bounds[1] / dx), 0
-            )
-            ty = float('inf') if dy == 0 else max(
-                (y_bounds[0] / dy) if dy < 0 else (y_bounds[1] / dy), 0
-            )
-            # Smallest positive scale to stay within bounds
-            scale = min(tx, ty)
-            # End point in complex plane
-            end_plane_point = scale * (dx + 1j * dy)
-            end_scene_point = self.plane.number_to_point(end_plane_point)
-            radial_line = Line(
-                plane_origin_point,
-                end_scene_point,
-                color=BLUE,
-                stroke_width=0.7,
-                stroke_opacity=1,
-            )
-            desired_dash_length = 0.4
-            line_length = radial_line.get_length()
-            num_dashes = max(1, int(line_length / desired_dash_length))
-            dashed_radial_line = DashedVMobject(
-                radial_line, num_dashes=num_dashes,
-                dashed_ratio=0.5
-            )
-            self.grid_lines.add(dashed_radial_line)
-
-        # Set visibility of grid lines
-        self.grid_lines.set_opacity(1 if self._show_grid else 0)
         # Group all axes components
         self.axes_components = VGroup(
             self.plane,
             self.x_axislabel,
             self.y_axislabel,
-            self.grid_lines,
             self.unit_circle, self.x_axis, self.y_axis
         )
+        if self._show_grid:
+            self._update_grid_visibility()
         
         # Add to main group
         self.add(self.axes_components)
@@ -696,85 +490,89 @@ class Nyquist(VGroup):
             self.add(self._title)
 
     def _calculate_nyquist_data(self):
-        """Calculate the Nyquist plot data using scipy.signal."""
-        w = np.logspace(
-            np.log10(self.freq_range[0]),
-            np.log10(self.freq_range[1]),
-            10000
-        )
-        
-        # Calculate frequency response
-        freqs, response = signal.freqresp(self.system, w)
+        """Calculate the Nyquist plot data using the shared frequency response engine."""
+        if self.sampling == "adaptive":
+            # Sample by on-screen geometry of the visible part of the curve
+            x_min, x_max = self.plane.x_range[:2]
+            y_min, y_max = self.plane.y_range[:2]
+            scale = (self.x_length/(x_max - x_min), self.y_length/(y_max - y_min))
+            self.freq_response = adaptive_nyquist_response(
+                self.system, self.freq_range, scale=scale, view=(x_min, x_max, y_min, y_max),
+                chord_tol=self.chord_tol, max_turn=self.max_turn)
+        else:
+            self.freq_response = nyquist_response(self.system, self.freq_range, self._range_response)
+        self._store_nyquist_data()
+
+    def _store_nyquist_data(self):
+        """Store the curve data of freq_response, mirrored for the negative frequencies."""
+        freqs = self.freq_response.omega
         
         # Store data
         self.frequencies = freqs
-        self.response = response
-        self.real_part = np.real(response)
-        self.imag_part = np.imag(response)
+        self.response = self.freq_response.response
+        self.real_part = self.freq_response.real
+        self.imag_part = self.freq_response.imag
         
         # Calculate mirror image for negative frequencies
         self.neg_frequencies = -freqs[::-1]
         self.neg_real_part = self.real_part[::-1]
         self.neg_imag_part = -self.imag_part[::-1]
 
+    def _response_at(self, w):
+        """Evaluate the frequency response at a single frequency."""
+        return self.freq_response.evaluate([w]).response[0]
+
     def _plot_nyquist_response(self):
         """Create the Nyquist plot curve with robust arrow placement."""
+        self.nyquist_plot = VMobject()
+        self.nyquist_plot.set_color(color=self.plotcolor)
+        self.nyquist_plot.set_stroke(width=self.plot_stroke_width)
+        self._draw_nyquist_curve()
+        self.add(self.nyquist_plot)
+
+    def _draw_nyquist_curve(self):
+        """Write the clipped curve and its direction arrows into the existing nyquist_plot."""
 
-        # Get all points from the calculated response
-        # Do NOT filter based on current plot bounds here.
+        # Clip the curve to the plot box instead of dropping the points outside of it,
+        # so it leaves and re-enters the view without chords across the plot.
         x_min, x_max = self.plane.x_range[:2]
         y_min, y_max = self.plane.y_range[:2]
+        box = (x_min, x_max, y_min, y_max)
+        transform = axes_transform(self.plane)
 
+        curves = [np.zeros((0, 3))]
+        if self.show_positive_freq:
+            curves.append(clipped_points(self.plane, self.real_part, self.imag_part, box, transform,
+                                         self.simplify_tol))
+        if self.show_negative_freq:
+            curves.append(clipped_points(self.plane, self.neg_real_part, self.neg_imag_part, box, transform,
+                                         self.simplify_tol))
 
-         # Positive frequencies
-        all_pos_points = []
-        for re, im in zip(self.real_part, self.imag_part):
-            if x_min <= re <= x_max and y_min <= im <= y_max:
-                all_pos_points.append(self.plane.number_to_point(re + 1j * im))
-                        
-
-        all_neg_points = []
-        for re, im in zip(self.neg_real_part, self.neg_imag_part):
-            if x_min <= re <= x_max and y_min <= im <= y_max:
-                all_neg_points.append(self.plane.number_to_point(re + 1j*im))
-
-        # Create the plot VMobject using all points
-        self.nyquist_plot = VMobject()
-        if all_pos_points and self.show_positive_freq: # Ensure there are points before setting
-            self.nyquist_plot.set_points_as_corners(all_pos_points)
-
-        if len(all_neg_points) > 0 and self.show_negative_freq:
-            neg_plot_vobject = VMobject()
-            neg_plot_vobject.set_points_as_corners(all_neg_points)
-            # Append points from the negative frequency VMobject
-            self.nyquist_plot.append_points(neg_plot_vobject.points)
+        # One subpath per visible piece of the curve
+        self.nyquist_plot.set_points(np.concatenate(curves))
 
+        # Visible samples, used to place the direction arrows
+        def visible_points(re, im):
+            inside = (re >= x_min) & (re <= x_max) & (im >= y_min) & (im <= y_max)
+            return to_scene(self.plane, re[inside], im[inside], transform)
 
-        self.nyquist_plot.set_color(color=self.plotcolor)
-        self.nyquist_plot.set_stroke(width=self.plot_stroke_width)
+        all_pos_points = visible_points(self.real_part, self.imag_part)
+        all_neg_points = visible_points(self.neg_real_part, self.neg_imag_part)
 
-        tip_length = 0.2 # Define the desired length of the triangular tip
         point_skip = 3 # Number of points to skip to get a direction vector
 
         def get_index_at_path_percentage(points, percentage):
             if len(points) < 2:
                 return 0 # Or handle as an error/no arrow case
 
-            cumulative_lengths = [0.0]
-            for i in range(1, len(points)):
-                segment_length = np.linalg.norm(points[i] - points[i-1])
-                cumulative_lengths.append(cumulative_lengths[-1] + segment_length)
-            
-            total_length = cumulative_lengths[-1]
-            target_length = total_length * percentage
+            cumulative_lengths = np.concatenate([[0.0], np.cumsum(np.linalg.norm(np.diff(points, axis=0), axis=1))])
+            target_length = cumulative_lengths[-1] * percentage
 
             # Find the index where cumulative_length first exceeds target_length
-            for i, length in enumerate(cumulative_lengths):
-                if length >= target_length:
-                    return i
-            return len(points) - 1 # Fallback to the last point
+            return min(int(np.searchsorted(cumulative_lengths, target_length)), len(points) - 1)
         
-        self.arrow_tips = VGroup()
+        # (location, direction) of every arrow tip
+        tips = []
         # --- Positive frequencies ---
         if (len(all_pos_points) >= point_skip + 1) and self.show_positive_freq:
             if self.num_poles_at_zero > 0:
@@ -786,16 +584,8 @@ class Nyquist(VGroup):
             end_dir_idx = min(len(all_pos_points) - 1, middle_idx + point_skip // 2)
 
             if start_dir_idx < end_dir_idx:
-                tip_location = all_pos_points[end_dir_idx]
-                direction_vector = all_pos_points[end_dir_idx] - all_pos_points[start_dir_idx]
-                angle = angle_of_vector(direction_vector)
-
-                arrow_tip = Triangle(fill_opacity=1, stroke_width=0)
-                arrow_tip.rotate(angle - PI / 2)
-                arrow_tip.set_height(tip_length)
-                arrow_tip.set_color(self.plotcolor)
-                arrow_tip.move_to(tip_location)
-                self.nyquist_plot.add(arrow_tip)
+                tips.append((all_pos_points[end_dir_idx],
+                             all_pos_points[end_dir_idx] - all_pos_points[start_dir_idx]))
 
         # --- Negative frequencies ---
         if (len(all_neg_points) >= point_skip + 1) and self.show_negative_freq:
@@ -812,19 +602,36 @@ class Nyquist(VGroup):
             end_dir_idx_neg = min(len(all_neg_points) - 1, middle_idx_neg + point_skip // 2)
 
             if start_dir_idx_neg != end_dir_idx_neg:
-                tip_location_neg = all_neg_points[end_dir_idx_neg]
-                direction_vector_neg = all_neg_points[end_dir_idx_neg] - all_neg_points[start_dir_idx_neg]
-                angle_neg = angle_of_vector(direction_vector_neg)
-
-                arrow_tip_neg = Triangle(fill_opacity=1, stroke_width=0)
-                arrow_tip_neg.rotate(angle_neg - PI / 2)
-                arrow_tip_neg.set_height(tip_length)
-                arrow_tip_neg.set_color(self.plotcolor)
-                arrow_tip_neg.move_to(tip_location_neg)
-                self.nyquist_plot.add(arrow_tip_neg)
+                tips.append((all_neg_points[end_dir_idx_neg],
+                             all_neg_points[end_dir_idx_neg] - all_neg_points[start_dir_idx_neg]))
+
+        # The arrow tips are submobjects of the curve. Existing tips are moved, so redrawing
+        # the curve only creates a tip when more of them are needed than before.
+        arrow_tips = list(self.nyquist_plot.submobjects)
+        for i, (location, direction) in enumerate(tips):
+            if i < len(arrow_tips):
+                arrow_tip = arrow_tips[i]
+            else:
+                arrow_tip = Triangle(fill_opacity=1, stroke_width=0).set_color(self.plotcolor)
+                self.nyquist_plot.add(arrow_tip)
+            arrow_tip.set_points(self._arrow_tip_points(location, angle_of_vector(direction)))
+        self.nyquist_plot.remove(*arrow_tips[len(tips):])
 
-        self.add(self.nyquist_plot)
+    _tip_shape = None
 
+    @classmethod
+    def _arrow_tip_points(cls, location, angle, tip_length=0.2):
+        """
+        Points of a triangular arrow tip pointing in the direction angle, as
+        Triangle().rotate(angle - PI/2).set_height(tip_length).move_to(location) creates them.
+        """
+        if cls._tip_shape is None:
+            cls._tip_shape = Triangle().get_points().copy()
+        c, s = np.cos(angle - PI/2), np.sin(angle - PI/2)
+        points = cls._tip_shape @ np.array([[c, s, 0], [-s, c, 0], [0, 0, 1]])
+        lower, upper = points.min(axis=0), points.max(axis=0)
+        points = (points - (lower + upper)/2) * (tip_length / (upper[1] - lower[1]))
+        return points + location
 
     def _add_plot_components(self):
         """Add additional plot components like ticks, labels, etc."""
@@ -850,8 +657,7 @@ class Nyquist(VGroup):
         self.axes_components.add(self.x_ticks, self.y_ticks, self.x_ticklabels, self.y_ticklabels, self.box)
 
     def _create_ticks(self, axes, y_range=None, orientation="horizontal"):
-        """Generalized tick creation for both axes using c2p method"""
-        ticks = VGroup()
+        """Generalized tick creation for both axes, as one line set per axis"""
         tick_length = 0.1
         
         if orientation == "horizontal":
@@ -866,23 +672,7 @@ class Nyquist(VGroup):
             # make sure that 0 is included
             if self.x_range[0] <= 0 <= self.x_range[1]:
                 values = np.sort(np.unique(np.concatenate([values, [0.0]])))
-
-            for x_val in values:
-                # Bottom ticks
-                bottom_point = axes.c2p(x_val, axes.y_range[0])
-                ticks.add(Line(
-                    [bottom_point[0], bottom_point[1], 0],
-                    [bottom_point[0], bottom_point[1] + tick_length, 0],
-                    **self.tick_style
-                ))
-                
-                # Top ticks
-                top_point = axes.c2p(x_val, axes.y_range[1])
-                ticks.add(Line(
-                    [top_point[0], top_point[1] - tick_length, 0],
-                    [top_point[0], top_point[1], 0],
-                    **self.tick_style
-                ))
+            start, end = edge_ticks(axes, values, "x", tick_length)
                 
         else:  # vertical (y-axis ticks - left and right)
             step = self.y_step
@@ -894,26 +684,10 @@ class Nyquist(VGroup):
 
             # Make sure that 0 is included
             if self.y_range[0] <= 0 <= self.y_range[1]:
-                 values = np.sort(np.unique(np.concatenate([values, [0.0]])))
-
-            for y_val in values:
-                # Left ticks
-                left_point = axes.c2p(axes.x_range[0], y_val)
-                ticks.add(Line(
-                    [left_point[0], left_point[1], 0],
-                    [left_point[0] + tick_length, left_point[1], 0],
-                    **self.tick_style
-                ))
-                
-                # Right ticks
-                right_point = axes.c2p(axes.x_range[1], y_val)
-                ticks.add(Line(
-                    [right_point[0] - tick_length, right_point[1], 0],
-                    [right_point[0], right_point[1], 0],
-                    **self.tick_style
-                ))
+                values = np.sort(np.unique(np.concatenate([values, [0.0]])))
+            start, end = edge_ticks(axes, values, "y", tick_length)
         
-        return ticks
+        return line_set(start, end, **self.tick_style)
 
     def _create_tick_labels(self, axes, orientation="horizontal"):
         """Create tick labels using c2p method"""
@@ -937,7 +711,7 @@ class Nyquist(VGroup):
                     label_text = "0.0"
                 else:
                     label_text = f"{x_val:.1f}"
-                label = MathTex(label_text, font_size=18)
+                label = number_label(label_text, font_size=18)
                 label.move_to([point[0], point[1] - 0.3, 0])  # Position below axis
                 labels.add(label)
                 
@@ -958,7 +732,7 @@ class Nyquist(VGroup):
                     label_text = "0.0"
                 else:
                     label_text = f"{y_val:.1f}"
-                label = MathTex(label_text, font_size=18)
+                label = number_label(label_text, font_size=18)
                 label.move_to([point[0] - 0.3, point[1], 0])  # Position left of axis
                 labels.add(label)
         
@@ -1019,9 +793,8 @@ class Nyquist(VGroup):
         
         # Highlight gain margin point (where phase crosses -180°)
         if gm != np.inf:
-            # Find the point on the plot closest to wg
-            idx = np.argmin(np.abs(self.frequencies - wg))
-            point = self.plane.number_to_point(self.real_part[idx] + 1j*self.imag_part[idx])
+            # Evaluate the curve at wg
+            point = self.plane.number_to_point(self._response_at(wg))
             
             gm_dot = Dot(point, color=YELLOW)
             gm_label = MathTex(f"GM = {gm:.2f} dB", font_size=24, color=YELLOW)
@@ -1035,10 +808,8 @@ class Nyquist(VGroup):
         
         # Highlight phase margin point (where magnitude crosses 1)
         if pm != np.inf:
-            # Find the point where |G(jw)| = 1 (0 dB)
-            mag = np.abs(self.response)
-            idx = np.argmin(np.abs(mag - 1))
-            point = self.plane.number_to_point(self.real_part[idx] + 1j*self.imag_part[idx])
+            # Evaluate the curve at wp, where |G(jw)| = 1 (0 dB)
+            point = self.plane.number_to_point(self._response_at(wp))
             
             pm_dot = Dot(point, color=GREEN)
             pm_label = MathTex(f"PM = {pm:.2f}^\\circ", font_size=24, color=GREEN)
@@ -1056,56 +827,8 @@ class Nyquist(VGroup):
         """
         Calculate gain margin, phase margin, and modulus margin.
         """
-        # Calculate Bode data for margin calculations
-        w = np.logspace(
-            np.log10(self.freq_range[0]),
-            np.log10(self.freq_range[1]),
-            30000
-        )
-        _, mag, phase = signal.bode(self.system, w)
-        
-        # Find phase crossover (where phase crosses -180°)
-        phase_crossings = np.where(np.diff(np.sign(phase + 180)))[0]
-        
-        if len(phase_crossings) > 0:
-            # Use the last crossing before phase goes below -180°
-            idx = phase_crossings[-1]
-            wg = np.interp(-180, phase[idx:idx+2], w[idx:idx+2])
-            mag_at_wg = np.interp(wg, w, mag)
-            gm = -mag_at_wg  # Gain margin is how much gain can increase before instability
-        else:
-            wg = np.inf
-            gm = np.inf
-        
-        # Find gain crossover (where magnitude crosses 0 dB)
-        crossings = []
-        for i in range(len(mag)-1):
-            if mag[i] * mag[i+1] <= 0:  # Sign change
-                crossings.append(i)
-        
-        if crossings:
-            idx = crossings[0]  # First 0 dB crossing
-            wp = np.interp(0, [mag[idx], mag[idx+1]], [w[idx], w[idx+1]])
-            phase_at_wp = np.interp(wp, w, phase)
-            pm = 180 + phase_at_wp
-            #if pm -0:
-                #pm = 0.0
-        else:
-            wp = np.inf
-            pm = np.inf
-        
-        # Calculate stability margin (minimum distance to -1 point)
-        if len(w) > 0:
-            # Compute L(jω) in complex form
-            sys_response = signal.freqresp(self.system, w)[1]
-            distances = np.abs(sys_response + 1)  # Distance from -1
-            mm = 1 / np.min(distances)
-            wm = w[np.argmin(distances)]  # Frequency at which MM occurs
-        else:
-            mm = np.inf
-            wm = np.inf
-        
-        return gm, pm, mm, wg, wp, wm
+        # Exact crossovers from the margin engine, limited to the plotted frequency range
+        return stability_margins(self.system, self.freq_range)
     
     def show_margins(self, pm_color=YELLOW,mm_color=ORANGE, gm_color=GREEN_E, font_size=18,
                       show_pm=True, show_gm=True, show_mm=True,pm_label=None,gm_label=None,mm_label=None, add_directly=True):
@@ -1119,9 +842,8 @@ class Nyquist(VGroup):
         # Add gain margin indicator (point where phase crosses -180°)
         if gm != np.inf and show_gm==True:
             gm_group = VGroup()
-            # Find the point on the plot closest to wg
-            idx = np.argmin(np.abs(self.frequencies - wg))
-            point = self.plane.number_to_point(self.real_part[idx] + 1j*self.imag_part[idx])
+            # Evaluate the curve at wg
+            point = self.plane.number_to_point(self._response_at(wg))
             
             # Draw line from origin to gain margin point
             origin = self.plane.number_to_point(0 + 0j)
@@ -1142,10 +864,9 @@ class Nyquist(VGroup):
         # Add phase margin indicator (point where magnitude crosses 1)
         if pm != np.inf and show_pm==True:
             pm_group = VGroup()
-            # Find the point where |G(jw)| = 1 (0 dB)
-            mag = np.abs(self.response)
-            idx = np.argmin(np.abs(mag - 1))
-            point = self.plane.number_to_point(self.real_part[idx] + 1j*self.imag_part[idx])
+            # Evaluate the curve at wp, where |G(jw)| = 1 (0 dB)
+            crossover_point = self._response_at(wp)
+            point = self.plane.number_to_point(crossover_point)
             
             self.pm_dot = Dot(point, color=pm_color, radius=0.06)
             if pm_label is None:
@@ -1160,7 +881,7 @@ class Nyquist(VGroup):
             origin = self.plane.number_to_point(0 + 0j)
             
             # Draw angle arc for phase margin
-            angle = np.angle(self.real_part[idx] + 1j*self.imag_part[idx])  # Angle in radians
+            angle = np.angle(crossover_point)  # Angle in radians
             start_angle = np.pi  
             end_angle = start_angle + np.deg2rad(pm)
             
@@ -1209,8 +930,7 @@ class Nyquist(VGroup):
         
         if mm != np.inf and show_mm==True:
             mm_group = VGroup()
-            idx = np.argmin(np.abs(self.frequencies - wm))
-            nyquist_point = self.real_part[idx] + 1j * self.imag_part[idx]
+            nyquist_point = self._response_at(wm)
             self.mm_dot = Dot(self.plane.number_to_point(nyquist_point), color=mm_color, radius=0.04)
 
             # Label
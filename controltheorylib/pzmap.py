@@ -1,14 +1,10 @@
 from manim import *
 import numpy as np
 import warnings
-from scipy import signal
-import sympy as sp
-from collections import OrderedDict
-from manim import TexTemplate
-from scipy.interpolate import interp1d 
-
-my_template = TexTemplate()
-my_template.add_to_preamble(r"\usepackage{amsmath}")  # Add required packages
+from .freqresp import normalize_system, is_z_domain
+from .analysis import pole_zero_ranges
+from .ticklabels import number_label
+from .curves import edge_ticks, line_set
 
 class PoleZeroMap(VGroup):
     def __init__(self, system, x_range=None, y_range=None, dashed_axis=True, 
@@ -52,7 +48,7 @@ class PoleZeroMap(VGroup):
         """
         super().__init__(**kwargs)
         self.raw_system = system 
-        self.system = self._parse_system_input(system)
+        self.system = normalize_system(system)
         self.x_range = x_range
         self.y_range = y_range
         self.y_axis_label = y_axis_label
@@ -93,102 +89,29 @@ class PoleZeroMap(VGroup):
         self._auto_determine_ranges()
         self._create_plot_components()
         
-    def _parse_system_input(self, system):
-        """Parse different input formats into numerator and denominator coefficients."""
-        # If system is already in (num, den) coefficient form
-        if isinstance(system, (tuple, list)) and len(system) == 2:
-            if all(isinstance(x, (list, tuple, np.ndarray)) for x in system):
-                return system  # Already in coefficient form
-
-        # Handle symbolic expressions
-        if isinstance(system, sp.Basic):
-            return self._symbolic_to_coefficients(system)
-
-        # Handle string input
-        if isinstance(system, str):
-            if '/' in system:
-                num_str, den_str = system.split('/', 1)
-                return self._symbolic_to_coefficients(num_str.strip(), den_str.strip())
-            return self._symbolic_to_coefficients(system.strip())
-
-        # Handle (numerator, denominator) as symbolic expressions
-        if isinstance(system, (tuple, list)) and len(system) == 2:
-            num, den = system
-            return self._symbolic_to_coefficients(num, den)
-
-        raise ValueError(f"Unsupported system format: {type(system)}")
-
-    def _symbolic_to_coefficients(self, num_expr, den_expr=1):
-        """Convert symbolic expressions to polynomial coefficients."""
-        # Determine variable from expressions (s or z)
-        expr_str = str(num_expr) + str(den_expr)
-        if 's' in expr_str:
-            var = sp.symbols('s')
-        elif 'z' in expr_str:
-            var = sp.symbols('z')
-        else:
-            var = sp.symbols('s')  # Default to continuous-time
-
-        # Handle complete transfer function expression
-        if den_expr == 1 and isinstance(num_expr, sp.Basic):
-            frac = sp.fraction(num_expr)
-            num_expr = frac[0]
-            den_expr = frac[1] if len(frac) > 1 else 1
-
-        # Convert strings to sympy expressions
-        if isinstance(num_expr, str):
-            num_expr = sp.sympify(num_expr.replace('^', '**'))
-        if isinstance(den_expr, str):
-            den_expr = sp.sympify(den_expr.replace('^', '**'))
-
-        # Convert to polynomial coefficients
-        num_poly = sp.Poly(num_expr, var)
-        den_poly = sp.Poly(den_expr, var)
-
-        return (
-            [float(c) for c in num_poly.all_coeffs()],
-            [float(c) for c in den_poly.all_coeffs()]
-        )
-
     def _determine_system_type(self):
         """Determine if system is continuous (s) or discrete (z) time."""
         if hasattr(self, 'system_type'):  # Already determined
             return
 
-        # Check the original system input for variables
-        if isinstance(self.raw_system, str):
-            if 'z' in self.raw_system:
-                self.system_type = 'discrete'
-            else:
-                self.system_type = 'continuous'
-        elif isinstance(self.raw_system, sp.Basic):
-            if 'z' in str(self.raw_system):
-                self.system_type = 'discrete'
-            else:
-                self.system_type = 'continuous'
-        elif isinstance(self.raw_system, (tuple, list)) and len(self.raw_system) == 2:
-            num, den = self.raw_system
-            if any('z' in str(x) for x in [num, den] if isinstance(x, (str, sp.Basic))):
-                self.system_type = 'discrete'
-            else:
-                self.system_type = 'continuous'
+        # Expressions in z and systems with a sample time (e.g. discrete-time scipy LTI objects)
+        if is_z_domain(self.raw_system) or getattr(self.system, 'dt', None) is not None:
+            self.system_type = 'discrete'
         else:
             # Default to continuous-time for coefficient arrays
             self.system_type = 'continuous'
 
-        self.variable = sp.symbols('z') if self.system_type == 'discrete' else sp.symbols('s')
+    @property
+    def variable(self):
+        """The sympy symbol of the system variable (z for discrete-time, s for continuous-time)."""
+        import sympy as sp
+        return sp.symbols('z') if self.system_type == 'discrete' else sp.symbols('s')
 
     def _calculate_poles_zeros(self):
         """Calculate poles and zeros from the system representation."""
-        num, den = self.system
-        
-        # Convert coefficients to polynomials
-        num_poly = np.poly1d(num)
-        den_poly = np.poly1d(den)
-        
-        # Calculate roots
-        zeros = num_poly.r
-        poles = den_poly.r
+        # Roots of the normalized numerator and denominator
+        zeros = self.system.zeros
+        poles = self.system.poles
         
         # Convert to coordinate pairs
         self.zero_coords = [(z.real, z.imag) for z in zeros]
@@ -200,26 +123,76 @@ class PoleZeroMap(VGroup):
         self.pole_real_parts = [p[0] for p in self.pole_coords]
         self.pole_imag_parts = [p[1] for p in self.pole_coords]
     
+    def _place_markers(self):
+        """
+        Move the zero and pole markers to the current zeros and poles. Existing markers are
+        reused, so markers are only created when there are more roots than before.
+        """
+        for markers, coords, create in (
+                (self.zeros, self.zero_coords, lambda: Circle(radius=self.markers_size, color=BLUE)),
+                (self.poles, self.pole_coords, lambda: Cross(scale_factor=self.markers_size, color=RED))):
+            existing = list(markers.submobjects)
+            for i, (x, y) in enumerate(coords):
+                if i < len(existing):
+                    marker = existing[i]
+                else:
+                    marker = create()
+                    markers.add(marker)
+                marker.move_to(self.axis.n2p(complex(x, y)))
+            markers.remove(*existing[len(coords):])
+
+    @classmethod
+    def live(cls, system_func, tracker, **kwargs):
+        """
+        Creates a pole-zero map of a parameterized system that follows a ValueTracker.
+
+        Unlike rebuilding the whole map with always_redraw, the updater of a live map only
+        computes the new poles and zeros and moves the existing markers. The plane, ticks
+        and labels are built once, so the roots have to stay within the ranges of the
+        initial value or the given x_range and y_range.
+
+        PARAMETERS
+        ----------
+        system_func : callable
+            Function of the parameter value returning the system, in any format accepted
+            by PoleZeroMap, e.g. lambda zeta: ([1], [1, 2*zeta, 1]).
+        tracker : ValueTracker
+            The tracker holding the parameter value (a gain K, a damping ratio, ...).
+        **kwargs : Any
+            Any other PoleZeroMap argument (x_range, y_range, markers_size, ...).
+
+        RETURNS
+        -------
+        PoleZeroMap
+            A pole-zero map with an updater. Remove it with clear_updaters() to freeze the map.
+        """
+        pzmap = cls(system_func(tracker.get_value()), **kwargs)
+        pzmap._live_func = system_func
+        pzmap._live_value = tracker.get_value()
+        pzmap.add_updater(lambda mob: mob.set_parameter(tracker.get_value()))
+        return pzmap
+
+    def set_parameter(self, value):
+        """
+        Updates a live pole-zero map (see PoleZeroMap.live) to a new parameter value.
+        Nothing is done if the value did not change.
+        """
+        if value == self._live_value:
+            return self
+        self._live_value = value
+        self.raw_system = self._live_func(value)
+        self.system = normalize_system(self.raw_system)
+        self._calculate_poles_zeros()
+        self._place_markers()
+        return self
+
     def _auto_determine_ranges(self):
         """Determine the x and y ranges if not specified"""
-        # Calculate max and min for real and imaginary parts
-        max_zero_real = max(self.zero_real_parts) if self.zero_real_parts else 0
-        min_zero_real = min(self.zero_real_parts) if self.zero_real_parts else 0
-        max_zero_imag = max(self.zero_imag_parts) if self.zero_imag_parts else 0
-        min_zero_imag = min(self.zero_imag_parts) if self.zero_imag_parts else 0
-
-        max_pole_real = max(self.pole_real_parts) if self.pole_real_parts else 0
-        min_pole_real = min(self.pole_real_parts) if self.pole_real_parts else 0
-        max_pole_imag = max(self.pole_imag_parts) if self.pole_imag_parts else 0
-        min_pole_imag = min(self.pole_imag_parts) if self.pole_imag_parts else 0
-        
+        auto_x_range, auto_y_range = pole_zero_ranges(self.system.poles, self.system.zeros)
         # Determine x_range
         if self.x_range is None:
-            x_range_max = max(max_zero_real, max_pole_real)
-            x_range_min = min(min_zero_real, min_pole_real)
-            x_total_range = abs(x_range_max - x_range_min)
-            self.x_step = max(0.1, min(10.0, (x_total_range+2) / 4))
-            self.x_range = [x_range_min-1, x_range_max+1, self.x_step]
+            self.x_step = auto_x_range[2]
+            self.x_range = auto_x_range
         else:
             x_range_max = self.x_range[1]
             x_range_min = self.x_range[0]
@@ -230,11 +203,8 @@ class PoleZeroMap(VGroup):
                 self.x_step = self.x_range[2]
         # Determine y_range
         if self.y_range is None:
-            y_range_max = max(max_zero_imag, max_pole_imag)
-            y_range_min = min(min_zero_imag, min_pole_imag)
-            y_total_range = abs(y_range_max - y_range_min)
-            self.y_step = max(0.1, min(10.0, (y_total_range+2) / 4))
-            self.y_range = [y_range_min-1, y_range_max+1, self.y_step]
+            self.y_step = auto_y_range[2]
+            self.y_range = auto_y_range
         else:
             y_range_max = self.y_range[1]
             y_range_min = self.y_range[0]
@@ -265,6 +235,8 @@ class PoleZeroMap(VGroup):
                 "include_tip": False
             },
         )
+        # The background lines are never shown, so keep them out of the mobject tree
+        self.axis.remove(self.axis.background_lines, self.axis.faded_lines)
         x_start, x_end = self.axis.x_axis.get_start(), self.axis.x_axis.get_end()
         y_start, y_end = self.axis.y_axis.get_start(), self.axis.y_axis.get_end()
 
@@ -286,24 +258,15 @@ class PoleZeroMap(VGroup):
         self.axis_labels = VGroup(re_label, im_label)
         self.axis.add(self.axis_labels)
         
-        # Plot zeros (blue circles)
-        zero_markers = [
-            Circle(radius=self.markers_size, color=BLUE).move_to(self.axis.n2p(complex(x, y))) 
-            for x, y in self.zero_coords
-        ]
-        self.zeros = VGroup(*zero_markers)
-        
-        # Plot poles (red crosses)
-        pole_markers = [
-            Cross(scale_factor=self.markers_size, color=RED).move_to(self.axis.n2p(complex(x, y))) 
-            for x, y in self.pole_coords
-        ]
-        self.poles = VGroup(*pole_markers)
+        # Plot zeros (blue circles) and poles (red crosses)
+        self.zeros = VGroup()
+        self.poles = VGroup()
+        self._place_markers()
         
         self.x_ticks = self._create_ticks(self.axis, orientation="horizontal")
         self.y_ticks = self._create_ticks(self.axis, orientation="vertical")
-        self.x_tick_labels = self.create_tick_labels(self.axis, orientation="horizontal")
-        self.y_tick_labels = self.create_tick_labels(self.axis, orientation="vertical")  
+        self.x_tick_labels = self._create_tick_labels(self.axis, orientation="horizontal")
+        self.y_tick_labels = self._create_tick_labels(self.axis, orientation="vertical")  
 
         # Add all components to the group
         self.add(self.axis, self.zeros, self.poles, self.box, self.x_axis, self.y_axis, 
@@ -358,7 +321,7 @@ class PoleZeroMap(VGroup):
             for x_val in values:
                 point = axes.c2p(x_val, axes.y_range[0])
                 label_text = f"{x_val:.1f}"
-                label = MathTex(label_text, font_size=18)
+                label = number_label(label_text, font_size=18)
                 label.move_to([point[0], point[1] - 0.3, 0])  # Position below axis
                 labels.add(label)
                 
@@ -373,15 +336,14 @@ class PoleZeroMap(VGroup):
             for y_val in values:
                 point = axes.c2p(axes.x_range[0], y_val)
                 label_text = f"{y_val:.1f}"
-                label = MathTex(label_text, font_size=18)
+                label = number_label(label_text, font_size=18)
                 label.move_to([point[0] - 0.3, point[1], 0])  # Position left of axis
                 labels.add(label)
         
         return labels
     
     def _create_ticks(self, axes, orientation="horizontal"):
-        """Generalized tick creation for both axes using c2p method"""
-        ticks = VGroup()
+        """Generalized tick creation for both axes, as one line set per axis"""
         tick_length = 0.1
         
         if orientation == "horizontal":
@@ -392,23 +354,7 @@ class PoleZeroMap(VGroup):
                 self.x_range[1],
                 step
             )
-
-            for x_val in values:
-                # Bottom ticks
-                bottom_point = axes.c2p(x_val, axes.y_range[0])
-                ticks.add(Line(
-                    [bottom_point[0], bottom_point[1], 0],
-                    [bottom_point[0], bottom_point[1] + tick_length, 0],
-                    **self.tick_style
-                ))
-                
-                # Top ticks
-                top_point = axes.c2p(x_val, axes.y_range[1])
-                ticks.add(Line(
-                    [top_point[0], top_point[1] - tick_length, 0],
-                    [top_point[0], top_point[1], 0],
-                    **self.tick_style
-                ))
+            start, end = edge_ticks(axes, values, "x", tick_length)
                 
         else:  # vertical (y-axis ticks - left and right)
             step = self.y_step
@@ -417,25 +363,9 @@ class PoleZeroMap(VGroup):
                 self.y_range[1],
                 step
             )
-
-            for y_val in values:
-                # Left ticks
-                left_point = axes.c2p(axes.x_range[0], y_val)
-                ticks.add(Line(
-                    [left_point[0], left_point[1], 0],
-                    [left_point[0] + tick_length, left_point[1], 0],
-                    **self.tick_style
-                ))
-                
-                # Right ticks
-                right_point = axes.c2p(axes.x_range[1], y_val)
-                ticks.add(Line(
-                    [right_point[0] - tick_length, right_point[1], 0],
-                    [right_point[0], right_point[1], 0],
-                    **self.tick_style
-                ))
+            start, end = edge_ticks(axes, values, "y", tick_length)
         
-        return ticks
+        return line_set(start, end, **self.tick_style)
     
     def add_stability_regions(self, show_stable=True, show_unstable=True, stable_label="Stable", unstable_label="Unstable"
                               , stable_color=BLUE, unstable_color=RED, use_mathtex = False, fill_opacity=0.2, label_font_size = 30, add_directly=True):
@@ -0,0 +1,160 @@
+import hashlib
+
+import numpy as np
+
+# Direct frequency-response evaluation of (large) state-space models
+
+def hessenberg_response(H, b, c, d, s, max_chunk_elements=2**22):
+    """
+    Evaluates c (sI - H)^-1 b + d for an upper Hessenberg matrix H at many points s.
+
+    Every frequency needs one Gaussian elimination of the Hessenberg matrix sI - H,
+    which costs O(n²) instead of the O(n³) of a general solve. The eliminations for
+    a block of frequencies run together as one vectorized sweep over the n columns.
+
+    PARAMETERS
+    ----------
+    H : np.ndarray
+        Upper Hessenberg matrix of shape (n, n).
+    b, c : np.ndarray
+        Input and output vectors of length n.
+    d : float
+        Direct feedthrough.
+    s : array_like
+        Complex evaluation points.
+    max_chunk_elements : int
+        Upper bound on the size of the (frequencies x n x n) work array.
+
+    RETURNS
+    -------
+    np.ndarray
+        Complex response with the same shape as s.
+    """
+    s = np.asarray(s, dtype=complex)
+    flat_s = s.ravel()
+    n = H.shape[0]
+    if n == 0:
+        return np.full(s.shape, d, dtype=complex)
+
+    out = np.empty(len(flat_s), dtype=complex)
+    chunk = max(1, max_chunk_elements // (n * n))
+    diag = np.arange(n)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for start in range(0, len(flat_s), chunk):
+            sk = flat_s[start:start + chunk]
+            M = np.empty((len(sk), n, n), dtype=complex)
+            M[:] = -H
+            M[:, diag, diag] += sk[:, None]
+            x = np.empty((len(sk), n), dtype=complex)
+            x[:] = b
+
+            # Forward elimination of the single subdiagonal, with partial pivoting between rows k and k+1
+            for k in range(n - 1):
+                swap = np.abs(M[:, k + 1, k]) > np.abs(M[:, k, k])
+                if np.any(swap):
+                    M[swap, k:k + 2, k:] = M[swap, k:k + 2, k:][:, ::-1]
+                    x[swap, k:k + 2] = x[swap, k:k + 2][:, ::-1]
+                factor = M[:, k + 1, k] / M[:, k, k]
+                factor[~np.isfinite(factor)] = 0
+                M[:, k + 1, k + 1:] -= factor[:, None] * M[:, k, k + 1:]
+                x[:, k + 1] -= factor * x[:, k]
+
+            # Back substitution on the upper triangular result
+            for k in range(n - 1, -1, -1):
+                x[:, k] = (x[:, k] - np.einsum('fj,fj->f', M[:, k, k + 1:], x[:, k + 1:])) / M[:, k, k]
+
+            out[start:start + chunk] = x @ c + d
+    return out.reshape(s.shape)
+
+class StateSpaceModel:
+    """
+    Single-input single-output state-space model that is evaluated without a
+    polynomial (transfer function) round-trip.
+
+    A is reduced once to upper Hessenberg form H = Qᵀ A Q, after which the frequency
+    response C (sI - A)^-1 B + D is computed with O(n²) work per frequency (see
+    hessenberg_response). Poles are the eigenvalues of A and zeros the finite
+    transmission zeros, so models with hundreds of states keep their accuracy.
+
+    PARAMETERS
+    ----------
+    A, B, C, D : array_like
+        State-space matrices of a single-input single-output system.
+    dt : float | None
+        Sampling time of a discrete-time model, None for continuous time.
+    """
+    def __init__(self, A, B, C, D, dt=None):
+        self.A = np.atleast_2d(np.asarray(A, dtype=float))
+        self.B = np.asarray(B, dtype=float).reshape(self.A.shape[0], -1)
+        self.C = np.asarray(C, dtype=float).reshape(-1, self.A.shape[0])
+        self.D = np.atleast_2d(np.asarray(D, dtype=float))
+        if self.A.size == 0:
+            self.A = np.zeros((0, 0))
+        if self.B.shape[1] != 1 or self.C.shape[0] != 1 or self.D.size != 1:
+            raise ValueError("Only single-input single-output state-space models are supported.")
+        self.dt = dt
+
+        # Hessenberg reduction, done once per model
+        from scipy import linalg
+        H, Q = linalg.hessenberg(self.A, calc_q=True) if self.A.size else (self.A, self.A)
+        self._H = H
+        self._b = Q.T @ self.B[:, 0]
+        self._c = self.C[0] @ Q
+        self._d = float(self.D[0, 0])
+        self._poles = None
+        self._zeros = None
+        digest = hashlib.sha1()
+        for m in (self.A, self.B, self.C, self.D):
+            digest.update(np.ascontiguousarray(m).tobytes())
+        self.key = (self.A.shape, digest.hexdigest(), dt)
+
+    @property
+    def order(self):
+        return self.A.shape[0]
+
+    @property
+    def poles(self):
+        """Eigenvalues of A."""
+        if self._poles is None:
+            from scipy import linalg
+            self._poles = linalg.eigvals(self._H) if self.order else np.array([], dtype=complex)
+        return self._poles
+
+    @property
+    def zeros(self):
+        """Finite transmission zeros, the finite generalized eigenvalues of the system pencil."""
+        if self._zeros is None:
+            from scipy import linalg
+            n = self.order
+            pencil_a = np.block([[self.A, self.B], [self.C, self.D]])
+            pencil_b = np.zeros((n + 1, n + 1))
+            pencil_b[:n, :n] = np.eye(n)
+            alpha, beta = linalg.eigvals(pencil_a, pencil_b, homogeneous_eigvals=True)
+            finite = np.abs(beta) > 1e-10 * np.abs(alpha)
+            self._zeros = alpha[finite] / beta[finite]
+        return self._zeros
+
+    @property
+    def is_strictly_proper(self):
+        return self._d == 0
+
+    def response(self, s):
+        """Evaluate C (sI - A)^-1 B + D at the complex points s."""
+        return hessenberg_response(self._H, self._b, self._c, self._d, s)
+
+    def dc_gain(self):
+        """
+        Return G(0) = D - C A^-1 B (G(z=1) in discrete time), which is infinite for
+        models with integrators.
+        """
+        origin = 0 if self.dt is None else 1
+        if self.order and np.any(np.isclose(self.poles, origin, atol=1e-12)):
+            return np.inf
+        return self.response(np.full(1, origin))[0].real
+
+    def to_tf(self):
+        """Convert to a scipy TransferFunction (loses accuracy for high orders)."""
+        from scipy import signal
+        if self.dt is None:
+            return signal.StateSpace(self.A, self.B, self.C, self.D).to_tf()
+        return signal.StateSpace(self.A, self.B, self.C, self.D, dt=self.dt).to_tf()
@@ -0,0 +1,163 @@
+import re
+from functools import lru_cache
+
+import numpy as np
+
+# Fast, sympy-free parser for polynomial expressions in s or z
+
+_TOKEN = re.compile(r"\s*(?:(\d+\.?\d*(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?)|([A-Za-z_]\w*)|(\*\*|[-+*/^()]))")
+
+class UnsupportedExpression(Exception):
+    """Raised for expressions outside the fast path, which are then left to sympy."""
+
+def tokenize(text):
+    """
+    Splits an expression into number, name and operator tokens.
+
+    RETURNS
+    -------
+    list
+        (kind, value) pairs with kind 'number', 'name' or 'op'. '^' is returned as '**'.
+    """
+    tokens = []
+    pos = 0
+    text = text.rstrip()
+    while pos < len(text):
+        match = _TOKEN.match(text, pos)
+        if match is None:
+            raise UnsupportedExpression(f"Unexpected character {text[pos]!r}")
+        number, name, op = match.groups()
+        if number is not None:
+            tokens.append(('number', float(number)))
+        elif name is not None:
+            tokens.append(('name', name))
+        else:
+            tokens.append(('op', '**' if op == '^' else op))
+        pos = match.end()
+    return tokens
+
+def _trim(poly):
+    """Strip exact leading zeros, keeping at least one coefficient."""
+    nonzero = np.flatnonzero(poly)
+    return poly[nonzero[0]:] if len(nonzero) else np.zeros(1)
+
+class _PolynomialParser:
+    """
+    Recursive descent parser that evaluates an expression to polynomial coefficients
+    (highest power first), using the usual precedence: +,- < *,/ < unary sign < power.
+    Division is only supported by constants, so the result is always a polynomial.
+    """
+    def __init__(self, tokens, var):
+        self.tokens = tokens
+        self.var = var
+        self.pos = 0
+
+    def parse(self):
+        poly = self._expression()
+        if self.pos != len(self.tokens):
+            raise UnsupportedExpression("Unexpected trailing input")
+        return _trim(poly)
+
+    def _peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else (None, None)
+
+    def _take_op(self, *ops):
+        kind, value = self._peek()
+        if kind == 'op' and value in ops:
+            self.pos += 1
+            return value
+        return None
+
+    def _expression(self):
+        poly = self._term()
+        while (op := self._take_op('+', '-')) is not None:
+            other = self._term()
+            poly = np.polyadd(poly, other) if op == '+' else np.polysub(poly, other)
+        return poly
+
+    def _term(self):
+        poly = self._unary()
+        while (op := self._take_op('*', '/')) is not None:
+            other = _trim(self._unary())
+            if op == '*':
+                poly = np.polymul(poly, other)
+            elif len(other) == 1 and other[0] != 0:
+                poly = poly / other[0]
+            else:
+                raise UnsupportedExpression("Division by a polynomial")
+        return poly
+
+    def _unary(self):
+        op = self._take_op('+', '-')
+        if op is None:
+            return self._power()
+        poly = self._unary()
+        return -poly if op == '-' else poly
+
+    def _power(self):
+        base = self._atom()
+        if self._take_op('**') is None:
+            return base
+        exponent = _trim(self._unary())
+        if len(exponent) != 1 or not float(exponent[0]).is_integer():
+            raise UnsupportedExpression("Non-integer exponent")
+        exponent = int(exponent[0])
+        base = _trim(base)
+        if exponent < 0:
+            if len(base) != 1 or base[0] == 0:
+                raise UnsupportedExpression("Negative power of a polynomial")
+            return np.array([base[0]**exponent])
+        result = np.ones(1)
+        for _ in range(exponent):
+            result = np.polymul(result, base)
+        return result
+
+    def _atom(self):
+        kind, value = self._peek()
+        self.pos += 1
+        if kind == 'number':
+            return np.array([value])
+        if kind == 'name' and value == self.var:
+            return np.array([1.0, 0.0])
+        if kind == 'op' and value == '(':
+            poly = self._expression()
+            if self._take_op(')') is None:
+                raise UnsupportedExpression("Unbalanced parentheses")
+            return poly
+        raise UnsupportedExpression(f"Unsupported token {value!r}")
+
+@lru_cache(maxsize=1024)
+def parse_coefficients(num_text, den_text="1"):
+    """
+    Parses numerator and denominator strings into polynomial coefficients without sympy.
+
+    The polynomial variable is 's', unless the expressions only contain 'z'. Numbers,
+    +, -, *, / (by constants), ** or ^ (integer exponents) and parentheses are supported.
+    Results are memoized by string, so repeated plots of one system parse instantly.
+
+    PARAMETERS
+    ----------
+    num_text : str
+        Numerator expression.
+    den_text : str
+        Denominator expression.
+
+    RETURNS
+    -------
+    tuple | None
+        (num_coeffs, den_coeffs) as tuples of floats, highest power first, or None if the
+        expressions need sympy (other symbols, functions, division by polynomials, ...).
+    """
+    try:
+        num_tokens, den_tokens = tokenize(num_text), tokenize(den_text)
+        names = {value for kind, value in num_tokens + den_tokens if kind == 'name'}
+        var = 'z' if names == {'z'} else 's'
+        if not names <= {var}:
+            return None
+        num = _PolynomialParser(num_tokens, var).parse()
+        den = _PolynomialParser(den_tokens, var).parse()
+    except (UnsupportedExpression, OverflowError):
+        return None
+    if not (np.all(np.isfinite(num)) and np.all(np.isfinite(den))):
+        return None
+    return tuple(float(c) + 0.0 for c in num), tuple(float(c) + 0.0 for c in den)
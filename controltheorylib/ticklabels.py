@@ -0,0 +1,81 @@
+from manim import *
+
+# Numeric axis labels composed from cached glyphs. All digits, signs and superscripts come
+# from a single MathTex, so a cold LaTeX cache costs one compilation instead of one per label.
+
+# Set to True to typeset every number label as its own MathTex instead
+exact_labels = False
+
+_CHARACTERS = "0123456789-."
+_SUPERSCRIPTS = "0123456789-"
+
+_glyphs = {}
+_labels = {}
+
+def _glyph_set():
+    """Normal and superscript glyphs at the default font size, relative to the baseline."""
+    if not _glyphs:
+        parts = list(_CHARACTERS) + ["{}^{" + char + "}" for char in _SUPERSCRIPTS]
+        template = MathTex(*parts)
+        baseline = template[0].get_bottom()[1]
+        for part, glyph in zip(parts, template):
+            glyph = glyph.copy()
+            glyph.shift(-glyph.get_left()[0]*RIGHT - baseline*UP)
+            _glyphs[part] = glyph
+    return _glyphs
+
+def _compose(text, superscript=""):
+    """Lay out the glyphs of text, followed by a superscript, along one baseline."""
+    glyphs = _glyph_set()
+    gap = 0.08*glyphs["0"].height
+    label = VGroup()
+    cursor = 0
+    for part in list(text) + ["{}^{" + char + "}" for char in superscript]:
+        glyph = glyphs[part].copy().shift(cursor*RIGHT)
+        label.add(glyph)
+        cursor += glyph.width + gap
+    return label
+
+def _cached_label(key, text, superscript):
+    if key not in _labels:
+        _labels[key] = _compose(text, superscript)
+    return _labels[key].copy()
+
+def number_label(text, font_size=20, color=WHITE, exact=None):
+    """
+    Creates a numeric label such as "-12" or "0.5" that looks like MathTex(text).
+
+    PARAMETERS
+    ----------
+    text : str
+        The number as it should be printed.
+    font_size : float
+        Font size of the label (default: 20).
+    color : Manim color
+        Color of the label (default: WHITE).
+    exact : bool | None
+        If True, the label is typeset with its own MathTex. Texts with other characters
+        than digits, '-' and '.' always are. None uses the module setting exact_labels.
+
+    RETURNS
+    -------
+    VMobject
+        The label, centered at the origin.
+    """
+    if exact is None:
+        exact = exact_labels
+    if exact or not text or not set(text) <= set(_CHARACTERS):
+        return MathTex(text, font_size=font_size, color=color)
+    label = _cached_label(text, text, "")
+    return label.scale(font_size/DEFAULT_FONT_SIZE).set_color(color).move_to(ORIGIN)
+
+def power_of_ten_label(exponent, font_size=20, color=WHITE, exact=None):
+    """
+    Creates a label "10^n" for a decade of a logarithmic axis, see number_label.
+    """
+    if exact is None:
+        exact = exact_labels
+    if exact:
+        return MathTex(f"10^{{{exponent}}}", font_size=font_size, color=color)
+    label = _cached_label(("10^", exponent), "10", str(exponent))
+    return label.scale(font_size/DEFAULT_FONT_SIZE).set_color(color).move_to(ORIGIN)
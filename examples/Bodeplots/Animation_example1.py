@@ -1,6 +1,8 @@
 from manim import *
 from controltheorylib import *
 
+use_default_style()
+
 class Animation_example1(Scene):
     def construct(self):
         # Define bode plot with a title
@@ -1,6 +1,8 @@
 from manim import *
 from controltheorylib import *
 
+use_default_style()
+
 class Animation_example2(Scene):
     def construct(self):
         # Define the bode plot, use red plot color
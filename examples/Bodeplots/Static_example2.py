@@ -1,6 +1,8 @@
 from manim import *
 from controltheorylib import *
 
+use_default_style()
+
 class Static_example2(Scene):
     def construct(self):
 
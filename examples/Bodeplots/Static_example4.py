@@ -1,5 +1,7 @@
 from manim import *
-from controltheorylib import BodePlot
+from controltheorylib import BodePlot, use_default_style
+
+use_default_style()
 
 class Static_example4(Scene):
     def construct(self):
@@ -1,6 +1,8 @@
 from manim import *
 from controltheorylib import *
 
+use_default_style()
+
 class Static_example5(Scene):
     def construct(self):
 
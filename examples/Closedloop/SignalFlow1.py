@@ -9,6 +9,8 @@ title and description.
 from manim import *
 from controltheorylib import *
 
+use_default_style()
+
 
 class SignalFlow(Scene):
     def construct(self):
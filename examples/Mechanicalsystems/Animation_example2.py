@@ -10,6 +10,8 @@ from manim import *
 import cmath
 from controltheorylib import *
 
+use_default_style()
+
 class MassSpring(Scene):
     def construct(self):
         # Define parameters 
@@ -160,7 +162,8 @@ class MassSpring(Scene):
         spring2 = mech_vis.spring(start=[-4, ceiling_height,0], end=[-4,y_eq+mass_size/2,0], coil_width=0.3,type='helical')
         
         #create damper
-        damper_box2, damper_rod2 = mech_vis.damper(start=[-3, ceiling_height, 0], end=[-3, y_eq + mass_size / 2, 0], box_height=1.2)
+        damper2 = mech_vis.damper(start=[-3, ceiling_height, 0], end=[-3, y_eq + mass_size / 2, 0], box_height=1.2)
+        damper_box2, damper_rod2 = damper2
 
         self.play(system_forces.animate.move_to(mass2.get_center()+0.35*UP+0.35*LEFT))
         self.wait(1)
@@ -289,10 +292,8 @@ class MassSpring(Scene):
 
             mob.move_to([-3.5, y, 0])
 
-            new_spring = mech_vis.spring(start=[-4,ceiling_height,0], end=[-4,y+mass_size/2,0], coil_width=0.3, type='helical')
-            new_damper_rod = mech_vis.damper(start=[-3,ceiling_height,0], end=[-3,y+mass_size/2,0])[1]
-            spring2.become(new_spring)
-            damper_rod2.become(new_damper_rod)
+            spring2.set_endpoints([-4,ceiling_height,0], [-4,y+mass_size/2,0])
+            damper2.set_endpoints([-3,ceiling_height,0], [-3,y+mass_size/2,0], rod_only=True)
             t_tracker.increment_value(dt)
 
         def update_graph():
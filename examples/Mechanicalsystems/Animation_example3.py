@@ -86,9 +86,12 @@ class CoupledSpringDamper(Scene):
         springs = VGroup(k1,k2,k3,k1_label,k2_label,k3_label)
 
         #dampers and their labels
-        c1_box, c1_rod = mech_vis.damper(start=[-2,-3,0], end=[-2,-1.5,0])
-        c2_box, c2_rod = mech_vis.damper(start=[-2,0,0], end=[-2,1.5,0])
-        c3_box, c3_rod = mech_vis.damper(start=[0,-3,0], end=[0,-1.5,0])
+        c1 = mech_vis.damper(start=[-2,-3,0], end=[-2,-1.5,0])
+        c1_box, c1_rod = c1
+        c2 = mech_vis.damper(start=[-2,0,0], end=[-2,1.5,0])
+        c2_box, c2_rod = c2
+        c3 = mech_vis.damper(start=[0,-3,0], end=[0,-1.5,0])
+        c3_box, c3_rod = c3
 
         c1_label = MathTex("c_1", font_size=35).next_to(c1_rod,RIGHT, buff=0.2)
         c2_label = MathTex("c_2", font_size=35).next_to(c2_rod,RIGHT, buff=0.2)
@@ -137,41 +140,17 @@ class CoupledSpringDamper(Scene):
             m2.move_to(m2_initial_pos + x2 * UP)
             
             # Update springs
-            k1.become(mech_vis.spring(
-                start=[-3,-3,0], 
-                end=[-3,-1.5 + x1,0], 
-                coil_width=0.4, 
-                num_coils=4
-            ))
-            k2.become(mech_vis.spring(
-                start=[-3,x1,0], 
-                end=[-3,1.5 + x2,0], 
-                coil_width=0.4, 
-                num_coils=4
-            ))
-            k3.become(mech_vis.spring(
-                start=[3,-3,0], 
-                end=[3,1.5 + x2,0], 
-                coil_width=0.4, 
-                num_coils=8
-            ))
+            k1.set_endpoints([-3,-3,0], [-3,-1.5 + x1,0])
+            k2.set_endpoints([-3,x1,0], [-3,1.5 + x2,0])
+            k3.set_endpoints([3,-3,0], [3,1.5 + x2,0])
             k1_label.next_to(k1,LEFT, buff=0.3)
             k2_label.next_to(k2,LEFT, buff=0.3)
             k3_label.next_to(k3,LEFT, buff=0.3)
             
             # Update dampers
-            c1_rod.become(mech_vis.damper(
-                start=[-2,-3,0], 
-                end=[-2,-1.5+x1 ,0]
-            ))
-            c2_rod.become(mech_vis.damper(
-                start=[-2,x1,0], 
-                end=[-2,1.5 + x2,0]
-            ))
-            c3_rod.become(mech_vis.damper(
-                start=[0,-3,0], 
-                end=[0,-1.5 + x1,0]
-            ))
+            c1.set_endpoints([-2,-3,0], [-2,-1.5+x1 ,0])
+            c2.set_endpoints([-2,x1,0], [-2,1.5 + x2,0])
+            c3.set_endpoints([0,-3,0], [0,-1.5 + x1,0])
             c1_label.next_to(c1_rod,RIGHT, buff=0.2)
             c2_label.next_to(c2_rod,RIGHT, buff=0.2)
             c3_label.next_to(c3_rod,RIGHT, buff=0.2)
@@ -30,8 +30,9 @@ class MassSpringSys(Scene):
 
         #Create spring and damper
         spring = spring(spring_start,spring_eq, type="helical")
-        damper_box, damper_rod = damper(damper_start,damper_eq, box_height=
+        damper_obj = damper(damper_start,damper_eq, box_height=
         1.3)
+        damper_box, damper_rod = damper_obj
 
         #Create spring and damper labels
         k = MathTex("k").next_to(spring,LEFT, buff=0.5)
@@ -63,9 +64,9 @@ class MassSpringSys(Scene):
             # Update mass
             mass.move_to([mass_x, y, 0])
 
-            # Update spring and damper rod
-            spring.become(spring(spring_start, spring_end, type="helical"))
-            damper_rod.become(damper(damper_start, damper_end)[1])
+            # Update spring and damper rod in place
+            spring.set_endpoints(spring_start, spring_end)
+            damper_obj.set_endpoints(damper_start, damper_end, rod_only=True)
 
             # Update labels
             k.next_to(spring, LEFT, buff=0.5)
@@ -9,6 +9,8 @@ title and description.
 from manim import *
 from controltheorylib import *
 
+use_default_style()
+
 class DamperExample(Scene):
     def construct(self):
         text1 = Text("Damper usage example").shift(2 * UP)
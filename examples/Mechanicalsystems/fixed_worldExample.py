@@ -9,6 +9,8 @@ title and description.
 from manim import *
 from controltheorylib import *
 
+use_default_style()
+
 class fixedworldExample(Scene):
     def construct(self):
         text1 = Text("Fixed world usage example").shift(2*UP)
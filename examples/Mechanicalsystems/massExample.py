@@ -9,6 +9,8 @@ title and description.
 from manim import *
 from controltheorylib import *
 
+use_default_style()
+
 class massExample(Scene):
     def construct(self):
         text1 = Text("Mass function usage example", font_size=30).shift(2*UP)
@@ -2,6 +2,8 @@
 from manim import *
 from controltheorylib import *
 
+use_default_style()
+
 class springExample(Scene):
     def construct(self):
         text1 = Text("Spring function usage example").shift(2*UP)
@@ -1,5 +1,7 @@
 from manim import *
 from controltheorylib import *
+
+use_default_style()
 import sympy as sp
 
 class Animation_example1(Scene):
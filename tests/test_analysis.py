@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from controltheorylib.analysis import (batch_margins, bode_data, nyquist_data, pole_zero_data,
+                                       pole_zero_ranges)
+from controltheorylib.margins import stability_margins
+
+
+def test_bode_data_without_plot():
+    data = bode_data("100/(s*(s+1)*(s+10))")
+    assert data['freq_range'] == (0.001, 100.0)
+    assert len(data['frequencies']) == len(data['magnitudes']) == len(data['phases'])
+    assert data['mag_range'][0] <= data['magnitudes'].min()
+    assert data['phase_range'][:2] == (-270.0, -90.0)
+
+
+def test_phase_range_follows_true_phase():
+    # No upper bound above 0 degrees for a lightly damped resonance
+    assert bode_data("1/(s^2+0.01*s+1)")['phase_range'][:2] == (-180.0, 0.0)
+    data = bode_data(([1], [1, 1]), freq_range=(1, 100))
+    assert np.isclose(data['phases'][0], -45)
+    assert data['phase_range'][:2] == (-90.0, -45.0)
+
+
+def test_discrete_data_stops_at_nyquist():
+    data = bode_data("0.2*(z+0.5)/((z-1)*(z-0.6))", dt=0.1)
+    assert np.isclose(data['freq_range'][1], np.pi / 0.1)
+    nyq = nyquist_data("0.2*(z+0.5)/((z-1)*(z-0.6))", dt=0.1)
+    assert np.isclose(nyq['frequencies'][-1], np.pi / 0.1)
+    assert nyq['num_poles_at_zero'] == 1
+
+
+def test_pole_zero_data():
+    data = pole_zero_data("(s+2)/(s**2+2*s+5)")
+    np.testing.assert_allclose(sorted(data['poles'].imag), [-2, 2])
+    assert data['system_type'] == 'continuous'
+    assert data['x_range'][:2] == pytest.approx([-3, 0])
+    assert pole_zero_ranges([], []) == ([-1, 1, 0.5], [-1, 1, 0.5])
+
+
+def test_batch_margins_match_single():
+    systems = ["10/(s*(s+1)*(s+5))", "4/(s+1)**3", "1/(s+1)"]
+    result = batch_margins(systems)
+    for i, system in enumerate(systems):
+        expected = stability_margins(system)
+        got = [result[name][i] for name in ('gm', 'pm', 'mm', 'wg', 'wp', 'wm')]
+        np.testing.assert_allclose(got, expected)
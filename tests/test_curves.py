@@ -0,0 +1,102 @@
+import numpy as np
+
+from controltheorylib.curves import (axes_transform, clip_segments, clipped_points, dash_segments, edge_ticks,
+                                     masked_polyline, polyline_points, simplify_polyline, to_scene)
+
+
+class _Axes:
+    x_range, y_range = [-3, 2, 1], [-40, 20, 10]
+
+    def coords_to_point(self, x, y):
+        return np.array([2 + 0.5 * x, -1 + 0.1 * y, 0])
+
+
+class _VMobject:
+    def set_points(self, points):
+        self.points = points
+        return self
+
+
+def test_transform_matches_coords_to_point():
+    axes = _Axes()
+    x, y = np.linspace(-3, 2, 7), np.linspace(-50, 30, 7)
+    expected = np.array([axes.coords_to_point(a, b) for a, b in zip(x, y)])
+    np.testing.assert_allclose(to_scene(axes, x, y), expected)
+    np.testing.assert_allclose(axes_transform(axes)[2], [2, -1, 0])
+
+
+def test_polyline_matches_corners():
+    points = np.array([[0, 0, 0], [3, 0, 0], [3, 3, 0]], dtype=float)
+    curves = polyline_points(points)
+    assert curves.shape == (8, 3)
+    np.testing.assert_allclose(curves[:4, 0], [0, 1, 2, 3])
+    np.testing.assert_allclose(curves[4:, 1], [0, 1, 2, 3])
+
+
+def test_masked_points_split_subpaths():
+    x = np.arange(8.0)
+    mask = np.array([1, 1, 1, 0, 1, 1, 0, 1], dtype=bool)
+    curve = masked_polyline(_VMobject(), _Axes(), x - 3, np.zeros(8), mask)
+    # Runs of 3 and 2 points give 2 + 1 line pieces; the single point is dropped
+    assert curve.points.shape == (12, 3)
+    assert not np.allclose(curve.points[7], curve.points[8])
+
+
+def test_clipping_ends_on_the_border():
+    # Leaves the unit box through the right edge and comes back through the top edge
+    x = np.array([0.0, 2.0, 2.0, 0.5, np.inf, 0.0])
+    y = np.array([0.0, 0.0, 2.0, 0.5, 0.0, 0.5])
+    start, end = clip_segments(x, y, (-1, 1, -1, 1))
+    np.testing.assert_allclose(start, [[0, 0], [1, 1]])
+    np.testing.assert_allclose(end, [[1, 0], [0.5, 0.5]])
+
+
+def test_clipping_keeps_inside_segments():
+    t = np.linspace(0, 2*np.pi, 50)
+    start, end = clip_segments(np.cos(t), np.sin(t), (-2, 2, -2, 2))
+    np.testing.assert_array_equal(start, np.column_stack([np.cos(t), np.sin(t)])[:-1])
+    np.testing.assert_array_equal(end, np.column_stack([np.cos(t), np.sin(t)])[1:])
+
+
+def test_simplification_stays_within_tolerance():
+    t = np.linspace(0, 4, 2000)
+    points = np.column_stack([t, np.sin(3 * t), np.zeros_like(t)])
+    keep = simplify_polyline(points, 1e-3)
+    assert keep[0] and keep[-1] and keep.sum() < 200
+    interp = np.interp(t, t[keep], points[keep, 1])
+    # Vertical error of a line within 1e-3 of the points, with slopes of at most 3
+    assert np.max(np.abs(interp - points[:, 1])) <= 1e-3 * np.sqrt(10)
+
+
+def test_simplified_subpaths_keep_their_ends():
+    x = np.linspace(0, 1, 100)
+    mask = np.ones(100, dtype=bool)
+    mask[50] = False
+    curve = masked_polyline(_VMobject(), _Axes(), x, 20 * x, mask, tol=1e-6)
+    # Two straight runs, each reduced to a single line piece
+    assert curve.points.shape == (8, 3)
+    np.testing.assert_allclose(curve.points[[0, 3, 4, 7], 0], 2 + 0.5 * x[[0, 49, 51, 99]])
+
+
+def test_simplified_clipping_matches_plain():
+    t = np.linspace(0, 6 * np.pi, 5000)
+    x, y = 1.5 * np.cos(t) * np.exp(-t / 20), np.sin(t)
+    plain = clipped_points(_Axes(), x, y, box=(-1, 1, -1, 1))
+    simple = clipped_points(_Axes(), x, y, box=(-1, 1, -1, 1), tol=1e-4)
+    assert len(simple) < len(plain) / 5
+    # Every piece still starts and ends on the same points
+    starts = lambda p: p[::4][np.r_[True, np.any(p[4::4] != p[3:-1:4], axis=1)]]
+    np.testing.assert_array_equal(starts(simple), starts(plain))
+
+
+def test_edge_ticks_on_both_sides():
+    start, end = edge_ticks(_Axes(), [-40, 0], "y", 0.1)
+    np.testing.assert_allclose(start[:, :2], [[0.5, -5], [0.5, -1], [2.9, -5], [2.9, -1]])
+    np.testing.assert_allclose(end[:, :2], [[0.6, -5], [0.6, -1], [3.0, -5], [3.0, -1]])
+
+
+def test_dashes_like_dashed_line():
+    start, end = dash_segments(np.zeros((1, 3)), np.array([[1.0, 0, 0]]), dash_length=0.05)
+    assert len(start) == 10
+    assert start[0, 0] == 0 and np.isclose(end[-1, 0], 1)
+    np.testing.assert_allclose(end[:, 0] - start[:, 0], 0.05)
@@ -0,0 +1,143 @@
+import numpy as np
+import pytest
+import sympy as sp
+from scipy import signal
+
+from controltheorylib.freqresp import (FrequencyResponse, align_phase, adaptive_frequency_response,
+                                       adaptive_nyquist_response, discrete_frequency_response,
+                                       fft_frequency_response, frequency_response, normalize_system,
+                                       parse_system_input, response_cache, ResponseCache,
+                                       evaluate_family, family_response, template_coefficients)
+
+
+def test_parse_formats_agree():
+    s = sp.symbols('s')
+    expected = ([4.0], [1.0, 0.5, 4.0])
+    assert parse_system_input("4/(s**2+0.5*s+4)") == expected
+    assert parse_system_input("4/(s^2+0.5*s+4)") == expected
+    assert parse_system_input((4, s**2 + 0.5*s + 4)) == expected
+    assert parse_system_input(4/(s**2 + 0.5*s + 4)) == expected
+    assert parse_system_input(([4], [1, 0.5, 4])) == ([4], [1, 0.5, 4])
+
+
+def test_parse_z_domain():
+    assert parse_system_input("(z-0.5)/(z**2-z+0.3)") == ([1.0, -0.5], [1.0, -1.0, 0.3])
+
+
+def test_invalid_system():
+    with pytest.raises(ValueError):
+        parse_system_input(42)
+
+
+def test_matches_scipy_bode():
+    tf = signal.TransferFunction([1, -10], [1, 6, 5, 0])
+    w = np.logspace(-2, 3, 500)
+    resp = frequency_response("(s-10)/(s*(s**2+6*s+5))", w)
+    _, mag, phase = signal.bode(tf, w)
+    np.testing.assert_allclose(resp.magnitude_db, mag, atol=1e-9)
+    np.testing.assert_allclose(resp.phase, phase, atol=1e-9)
+
+
+def test_response_is_reusable():
+    resp = frequency_response("1/(s+1)", np.logspace(-1, 1, 10))
+    other = resp.evaluate([1.0])
+    assert other.system is resp.system
+    assert normalize_system(resp) is resp.system
+    np.testing.assert_allclose(other.response, [1/(1 + 1j)])
+
+
+def test_phase_aligned_to_negative_dc_gain():
+    resp = FrequencyResponse(([-2], [1, 1]), np.logspace(-3, 2, 200))
+    assert np.isclose(resp.aligned_phase[0], 180, atol=0.5) or np.isclose(resp.aligned_phase[0], -180, atol=0.5)
+
+
+def test_aligned_phase_keeps_true_phase():
+    # Starting above the corner frequency, the curve must not be pulled up to 0 degrees
+    resp = FrequencyResponse(([1], [1, 1]), np.logspace(0, 2, 50))
+    assert np.isclose(resp.aligned_phase[0], -45)
+    np.testing.assert_allclose(resp.aligned_phase, resp.phase)
+
+    # A curve unwrapped onto another branch is only moved by whole turns
+    shifted = align_phase(resp.phase - 360, resp.system)
+    np.testing.assert_allclose(shifted, resp.phase)
+
+
+def test_adaptive_sampling_resolves_resonance():
+    system = "1/(s**2+0.02*s+1)"
+    resp = adaptive_frequency_response(system, (1e-2, 1e2), tol_db=0.05)
+    dense = frequency_response(system, np.logspace(-2, 2, 100000))
+    interp_db = np.interp(np.log10(dense.omega), np.log10(resp.omega), resp.magnitude_db)
+
+    assert len(resp) < 300
+    assert np.all(np.diff(resp.omega) > 0)
+    assert np.max(np.abs(interp_db - dense.magnitude_db)) < 0.1
+    assert np.isclose(resp.magnitude_db.max(), dense.magnitude_db.max(), atol=0.01)
+
+
+def test_adaptive_nyquist_bounded_by_view():
+    view = (-2, 1, -5, 5)
+    narrow = adaptive_nyquist_response("1/(s*(s+1))", (1e-3, 1e3), scale=(3, 0.6), view=view)
+    wide = adaptive_nyquist_response("1/(s*(s+1))", (1e-8, 1e8), scale=(3, 0.6), view=view)
+    assert len(narrow) < 200
+    assert len(wide) < len(narrow) + 100
+
+
+def test_cache_hits_for_equivalent_systems():
+    w = np.logspace(-2, 2, 100)
+    response_cache.clear()
+    first = frequency_response("2/(2*s+2)", w)
+    second = frequency_response(([1], [1, 1]), w.copy())
+    assert second is first
+    assert response_cache.hits == 1 and response_cache.misses == 1
+    with pytest.raises(ValueError):
+        first.response[0] = 0
+
+
+def test_cache_memory_cap():
+    cache = ResponseCache(max_bytes=10000)
+    for k in range(5):
+        cache.get_or_compute(k, lambda: FrequencyResponse("1/(s+1)", np.logspace(-1, 1, 100)))
+    assert cache.nbytes <= 10000
+    assert len(cache) == 2
+
+
+def test_template_family_matches_members():
+    w = np.logspace(-2, 2, 50)
+    params, nums, dens = template_coefficients("K*(s+a)/(s**2+s+1)", {"K": [1, 2, 5], "a": [0.5, 3]})
+    responses = evaluate_family(nums, dens, w)
+    assert responses.shape == (6, 50)
+    for i in range(6):
+        K, a = params["K"][i], params["a"][i]
+        np.testing.assert_allclose(responses[i], frequency_response(([K, K*a], [1, 1, 1]), w).response)
+
+
+def test_family_response_mixed_orders():
+    w = np.logspace(-1, 1, 20)
+    systems = ["1/(s+1)", ([1, 0], [1, 2, 1]), signal.TransferFunction([2], [1, 1]).to_ss()]
+    responses = family_response(systems, w)
+    for system, response in zip(systems, responses):
+        np.testing.assert_allclose(response, frequency_response(system, w).response)
+
+
+def test_z_domain_gets_sample_time():
+    assert normalize_system("(z-0.5)/(z**2-z+0.3)").dt == 1
+    assert normalize_system("1/(s+1)").dt is None
+    assert normalize_system("(z-0.5)/(z**2-z+0.3)", dt=0.1).dt == 0.1
+
+
+def test_fft_matches_freqz():
+    # b(z^-1)/a(z^-1) with a one-sample delay: (0.2z + 0.1)/(z^2 - 1.5z + 0.56)
+    system = normalize_system(([0.2, 0.1], [1, -1.5, 0.56]), dt=0.5)
+    resp = fft_frequency_response(system, 256)
+    _, expected = signal.freqz([0, 0.2, 0.1], [1, -1.5, 0.56], worN=resp.omega * 0.5)
+    np.testing.assert_allclose(resp.omega[-1], np.pi / 0.5)
+    np.testing.assert_allclose(resp.response, expected, rtol=1e-10)
+
+
+def test_discrete_grid_stops_at_nyquist():
+    system = "(z-0.2)/(z**2-1.2*z+0.5)"
+    resp = discrete_frequency_response(system, (1e-3, 10), 2000)
+    assert len(resp) <= 2000
+    assert np.all(np.diff(resp.omega) > 0)
+    assert np.isclose(resp.omega[-1], np.pi)
+    np.testing.assert_allclose(resp.response, frequency_response(system, resp.omega).response, rtol=1e-10)
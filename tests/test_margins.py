@@ -0,0 +1,59 @@
+import numpy as np
+
+from controltheorylib.freqresp import frequency_response
+from controltheorylib.margins import (gain_crossover_frequencies, phase_crossover_frequencies,
+                                      stability_margins)
+
+
+def test_third_order_lag():
+    # 10/(s+1)^3: phase crossover at sqrt(3), |G| = 10/8 there
+    gm, pm, mm, wg, wp, wm = stability_margins("10/((s+1)**3)")
+    assert np.isclose(wg, np.sqrt(3))
+    assert np.isclose(gm, -20*np.log10(10/8))
+    assert np.isclose(wp, np.sqrt(10**(2/3) - 1))
+    assert -180 < pm < 0
+
+
+def test_crossovers_are_exact():
+    system = "100/(s*(s+1)*(s+10))"
+    wp = gain_crossover_frequencies(system)
+    wg = phase_crossover_frequencies(system)
+    resp = frequency_response(system, np.concatenate([wp, wg]))
+    np.testing.assert_allclose(resp.magnitude[:len(wp)], 1, rtol=1e-9)
+    np.testing.assert_allclose(np.abs(np.angle(resp.response[len(wp):], deg=True)), 180, atol=1e-7)
+
+
+def test_modulus_margin_matches_dense_grid():
+    system = "1000*(s+1)/((s+0.1)*(s**2+0.2*s+100)*(s+50))"
+    _, _, mm, _, _, wm = stability_margins(system, (1e-3, 1e4))
+    resp = frequency_response(system, np.logspace(-3, 4, 200000))
+    distances = np.abs(1 + resp.response)
+    assert mm >= 1/distances.min() - 1e-9
+    assert np.isclose(mm, 1/distances.min(), rtol=1e-4)
+
+
+def test_modulus_margin_improper_systems():
+    # |G| grows without bound, so the minimum distance lies at a finite frequency
+    _, _, mm, _, _, wm = stability_margins("s+1")
+    assert np.isclose(mm, 0.5) and np.isfinite(wm)
+    _, _, mm, _, _, wm = stability_margins("10*(s+1)")
+    assert np.isclose(mm, 1/11) and np.isfinite(wm)
+    _, _, mm, _, _, wm = stability_margins("s**2+s+1")
+    assert np.isclose(mm, 1/np.sqrt(1.75))
+    assert np.isclose(wm, np.sqrt(1.5))
+
+
+def test_no_crossovers():
+    gm, pm, _, wg, wp, _ = stability_margins("0.5/(s+1)")
+    assert gm == np.inf and wg == np.inf
+    assert pm == np.inf and wp == np.inf
+
+
+def test_discrete_margins_match_dense_grid():
+    system = "0.2*(z+0.5)/((z-1)*(z-0.6))"
+    gm, pm, _, wg, wp, _ = stability_margins(system)
+    resp = frequency_response(system, [wg, wp])
+    assert 0 < wg < np.pi and 0 < wp < np.pi
+    assert np.isclose(resp.magnitude[1], 1)
+    assert np.isclose(np.abs(np.angle(resp.response[0], deg=True)), 180)
+    assert np.isclose(gm, -20*np.log10(resp.magnitude[0]))
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from controltheorylib.mech_vis import _damper_segments, _spring_vertices, damper, spring
+
+START = np.array([0.0, -1.0, 0.0])
+END = np.array([0.0, 2.0, 0.0])
+
+
+def test_zigzag_spring_vertices():
+    for num_coils in (4, 6, 8):
+        vertices = _spring_vertices(START, END, num_coils, 0.4, "zigzag")
+        assert len(vertices) == 2 * num_coils + 4
+        np.testing.assert_allclose(vertices[[0, -1]], [START, END], atol=1e-12)
+        # The corners stay within the coil width of the spring axis
+        assert np.abs(vertices[:, 0]).max() == pytest.approx(0.4)
+
+
+def test_helical_spring_vertices():
+    few = _spring_vertices(START, END, 4, 0.3, "helical")
+    many = _spring_vertices(START, END, 8, 0.3, "helical")
+    assert len(few) < len(many) < 1000
+    for vertices in (few, many):
+        np.testing.assert_allclose(vertices[[0, -1]], [START, END], atol=1e-12)
+
+
+def test_spring_set_endpoints_in_place():
+    shape = spring(START, END, num_coils=6)
+    curve = shape.submobjects[0]
+    assert shape.set_endpoints(START, END + [1, 0, 0]) is shape
+    assert shape.submobjects == [curve]
+    np.testing.assert_allclose(curve.get_points()[[0, -1]], [START, END + [1, 0, 0]], atol=1e-12)
+
+
+def test_damper_segments_follow_endpoints():
+    box, rod, fluid = _damper_segments(START, END, 0.5)
+    assert len(box) == 6 and len(rod) == 2 and len(fluid) == 4
+    np.testing.assert_allclose(rod[0][0], END)
+    np.testing.assert_allclose(box[3][0], START)
+
+
+def test_damper_rod_only_keeps_box():
+    shape = damper(START, END)
+    box, rod = shape
+    family = [id(m) for m in shape.get_family()]
+    box_points = [m.get_points().copy() for m in box]
+    rod_points = [m.get_points().copy() for m in rod]
+
+    shape.set_endpoints(START, END + [0, 0.5, 0], rod_only=True)
+    assert [id(m) for m in shape.get_family()] == family
+    for line, points in zip(box, box_points):
+        np.testing.assert_array_equal(line.get_points(), points)
+    assert not np.allclose(rod[0].get_points(), rod_points[0])
+    np.testing.assert_allclose(rod[0].get_points()[0], END + [0, 0.5, 0])
@@ -0,0 +1,120 @@
+import shutil
+
+import numpy as np
+import pytest
+
+manim = pytest.importorskip("manim")
+if shutil.which("latex") is None:
+    pytest.skip("MathTex needs a LaTeX installation", allow_module_level=True)
+
+from controltheorylib.bode import BodePlot
+from controltheorylib.nyquist import Nyquist
+from controltheorylib.pzmap import PoleZeroMap
+
+OLD = ([1], [1, 1])
+NEW = ([10], [1, 1, 10])
+
+
+def bode_like(plot, system):
+    """A freshly built Bode plot of system with the ranges of plot."""
+    return BodePlot(system, freq_range=plot.freq_range, magnitude_yrange=plot.magnitude_yrange,
+                    phase_yrange=plot.phase_yrange)
+
+
+def nyquist_like(plot, system):
+    """A freshly built Nyquist plot of system with the ranges of plot."""
+    return Nyquist(system, freq_range=plot.freq_range, x_range=plot.x_range, y_range=plot.y_range)
+
+
+def test_bode_update_system_matches_new_plot():
+    plot = BodePlot(OLD)
+    mag_plot, phase_plot = plot.mag_plot, plot.phase_plot
+    assert plot.update_system(NEW, animate=False) is plot
+
+    fresh = bode_like(plot, NEW)
+    np.testing.assert_allclose(plot.magnitudes, fresh.magnitudes)
+    np.testing.assert_allclose(plot.phases, fresh.phases)
+    np.testing.assert_allclose(plot._calculate_stability_margins(), fresh._calculate_stability_margins())
+
+    # The curves are updated in place
+    assert plot.mag_plot is mag_plot and plot.phase_plot is phase_plot
+    assert mag_plot in plot.mag_group.submobjects and phase_plot in plot.phase_group.submobjects
+    np.testing.assert_allclose(mag_plot.get_points(), fresh.mag_plot.get_points())
+    np.testing.assert_allclose(phase_plot.get_points(), fresh.phase_plot.get_points())
+
+
+def test_bode_update_system_animation():
+    plot = BodePlot(OLD)
+    mag_plot = plot.mag_plot
+    animation = plot.update_system(NEW, keep_ranges=False)
+    assert isinstance(animation, manim.Animation)
+    assert plot.mag_plot is mag_plot and mag_plot in plot.mag_group.submobjects
+    np.testing.assert_allclose(plot.phases, BodePlot(NEW).phases)
+
+
+def test_nyquist_update_system_matches_new_plot():
+    plot = Nyquist(OLD)
+    curve = plot.nyquist_plot
+    assert plot.update_system(NEW, animate=False) is plot
+
+    fresh = nyquist_like(plot, NEW)
+    np.testing.assert_allclose(plot.response, fresh.response)
+    assert plot.num_poles_at_zero == fresh.num_poles_at_zero
+
+    assert plot.nyquist_plot is curve and curve in plot.submobjects
+    np.testing.assert_allclose(curve.get_points(), fresh.nyquist_plot.get_points())
+    assert len(curve.submobjects) == len(fresh.nyquist_plot.submobjects)
+
+
+def family_ids(mobject):
+    return [id(m) for m in mobject.get_family()]
+
+
+def test_bode_live_rewrites_points_in_place():
+    tracker = manim.ValueTracker(1)
+    plot = BodePlot.live(lambda K: ([K], [1, 2, 1]), tracker)
+    family = family_ids(plot)
+    frequencies = plot.frequencies
+    magnitudes = plot.magnitudes.copy()
+    points = plot.mag_plot.get_points().copy()
+
+    tracker.set_value(10)
+    plot.update(0)
+    # Same grid, 20 dB more gain, and no mobject added or replaced
+    assert plot.frequencies is frequencies
+    np.testing.assert_allclose(plot.magnitudes, magnitudes + 20)
+    assert not np.array_equal(plot.mag_plot.get_points(), points)
+    assert family_ids(plot) == family
+
+    # Frames without a new value change nothing
+    points = plot.mag_plot.get_points()
+    plot.update(0)
+    assert plot.mag_plot.get_points() is points
+
+
+def test_nyquist_live_rewrites_points_in_place():
+    tracker = manim.ValueTracker(1)
+    plot = Nyquist.live(lambda K: ([K], [1, 2, 1]), tracker, x_range=(-2, 12), y_range=(-6, 6))
+    family = family_ids(plot)
+    response = plot.response.copy()
+    points = plot.nyquist_plot.get_points().copy()
+
+    tracker.set_value(5)
+    plot.update(0)
+    np.testing.assert_allclose(plot.response, 5 * response)
+    assert not np.array_equal(plot.nyquist_plot.get_points(), points)
+    assert family_ids(plot) == family
+
+
+def test_pole_zero_map_live_moves_markers():
+    tracker = manim.ValueTracker(0.2)
+    pzmap = PoleZeroMap.live(lambda zeta: ([1], [1, 2 * zeta, 1]), tracker, x_range=[-2, 1, 1],
+                             y_range=[-2, 2, 1])
+    family = family_ids(pzmap)
+
+    tracker.set_value(0.6)
+    pzmap.update(0)
+    assert family_ids(pzmap) == family
+    for marker, (x, y) in zip(pzmap.poles, pzmap.pole_coords):
+        np.testing.assert_allclose(marker.get_center(), pzmap.axis.n2p(complex(x, y)))
+    np.testing.assert_allclose(sorted(pzmap.pole_imag_parts), [-0.8, 0.8])
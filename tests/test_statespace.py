@@ -0,0 +1,38 @@
+import numpy as np
+from scipy import signal
+
+from controltheorylib.freqresp import frequency_response, normalize_system
+from controltheorylib.margins import stability_margins
+from controltheorylib.statespace import StateSpaceModel
+
+
+def mass_chain(n_masses):
+    """Chain of masses, springs and dampers; force and position at the first mass."""
+    K = 2*np.eye(n_masses) - np.eye(n_masses, k=1) - np.eye(n_masses, k=-1)
+    C = 0.01*K + 0.001*np.eye(n_masses)
+    A = np.block([[np.zeros((n_masses, n_masses)), np.eye(n_masses)], [-K, -C]])
+    B = np.zeros((2*n_masses, 1))
+    B[n_masses, 0] = 1
+    Cm = np.zeros((1, 2*n_masses))
+    Cm[0, 0] = 1
+    return signal.StateSpace(A, B, Cm, [[0]])
+
+
+def test_state_space_is_not_converted():
+    assert isinstance(normalize_system(mass_chain(3)), StateSpaceModel)
+
+
+def test_matches_direct_solve_for_high_order():
+    ss = mass_chain(60)
+    w = np.logspace(-3, 1, 200)
+    resp = frequency_response(ss, w).response
+    expected = [(ss.C @ np.linalg.solve(1j*wi*np.eye(120) - ss.A, ss.B))[0, 0] for wi in w]
+    np.testing.assert_allclose(resp, expected, rtol=1e-9)
+
+
+def test_poles_zeros_and_margins_match_transfer_function():
+    tf = signal.TransferFunction([10, 20], [1, 3, 3, 1])
+    model = normalize_system(tf.to_ss())
+    np.testing.assert_allclose(np.sort_complex(model.zeros), tf.zeros)
+    np.testing.assert_allclose(np.sort_complex(model.poles), np.sort_complex(tf.poles), atol=1e-4)
+    np.testing.assert_allclose(stability_margins(model)[:5], stability_margins(tf)[:5], rtol=1e-6)
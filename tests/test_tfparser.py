@@ -0,0 +1,26 @@
+import sympy as sp
+
+from controltheorylib.freqresp import symbolic_to_coefficients
+from controltheorylib.tfparser import parse_coefficients
+
+
+def test_matches_sympy():
+    cases = [("4", "s**2+0.5*s+4"), ("(s-10)", "(s*(s^2+6*s+5))"), ("(z-0.5)", "(z**2-z+0.3)"),
+             ("1000*(s+1)", "(s+0.1)*(s**2+0.2*s+100)*(s+50)"), ("-s^2+3", "2*s**3-s/4"),
+             ("s-s+1", "(s+1)**3"), ("1e-3*s", ".5*s+2.")]
+    for num, den in cases:
+        num_expr, den_expr = sp.sympify(num.replace('^', '**')), sp.sympify(den.replace('^', '**'))
+        var = sp.symbols('z') if 's' not in num + den else sp.symbols('s')
+        expected = ([float(c) for c in sp.Poly(num_expr, var).all_coeffs()],
+                    [float(c) for c in sp.Poly(den_expr, var).all_coeffs()])
+        parsed = parse_coefficients(num, den)
+        assert parsed is not None
+        assert (list(parsed[0]), list(parsed[1])) == expected
+
+
+def test_unsupported_expressions_use_sympy():
+    assert parse_coefficients("K*s", "s+1") is None
+    assert parse_coefficients("exp(-s)", "s") is None
+    assert parse_coefficients("1", "(s+1)/(s+2)") is None
+    assert parse_coefficients("sqrt(2)", "s+1") is None
+    assert symbolic_to_coefficients("sqrt(4)", "s+1") == ([2.0], [1.0, 1.0])
@@ -0,0 +1,45 @@
+import shutil
+
+import pytest
+
+manim = pytest.importorskip("manim")
+if shutil.which("latex") is None:
+    pytest.skip("MathTex needs a LaTeX installation", allow_module_level=True)
+
+from controltheorylib import ticklabels
+from controltheorylib.ticklabels import number_label, power_of_ten_label
+
+
+@pytest.fixture(autouse=True)
+def composed_labels(monkeypatch):
+    monkeypatch.setattr(ticklabels, "exact_labels", False)
+
+
+def test_decimal_label_from_cached_glyphs():
+    label = number_label("-0.5")
+    assert not isinstance(label, manim.MathTex)
+    assert len(label) == 4  # '-', '0', '.', '5'
+    assert "-0.5" in ticklabels._labels
+    # Every label is a fresh copy of the cached one
+    assert number_label("-0.5") is not label
+    assert len(number_label("-0.5")) == 4
+
+
+def test_negative_exponent_from_cached_glyphs():
+    label = power_of_ten_label(-3)
+    assert not isinstance(label, manim.MathTex)
+    assert len(label) == 4  # '1', '0', superscript '-', superscript '3'
+    assert ("10^", -3) in ticklabels._labels
+
+
+def test_fallback_to_mathtex():
+    assert isinstance(number_label("\\pi"), manim.MathTex)
+    assert isinstance(number_label(""), manim.MathTex)
+    assert isinstance(number_label("-0.5", exact=True), manim.MathTex)
+    assert isinstance(power_of_ten_label(-3, exact=True), manim.MathTex)
+
+
+def test_module_setting_selects_mathtex(monkeypatch):
+    monkeypatch.setattr(ticklabels, "exact_labels", True)
+    assert isinstance(number_label("12"), manim.MathTex)
+    assert isinstance(power_of_ten_label(2), manim.MathTex)